@@ -11,13 +11,16 @@ sys.path.insert(0, str(root_path / "Echoes-of-Deceit-v2" / "src"))
 import streamlit as st
 
 from unified_webui.config import PAGE_CONFIG, APP_NAME, APP_ICON
-from unified_webui.i18n import set_language, get_available_languages
+from unified_webui.i18n import get_available_languages
 from unified_webui.components import render_css
 from unified_webui import session_state as state
+from unified_webui.metrics import metrics
 from unified_webui.pages.home import render_home_page
 from unified_webui.pages.werewolf import render_werewolf_page
 from unified_webui.pages.turtle_soup import render_turtle_soup_page
 
+RERUN_SECONDS = metrics.histogram("rerun_seconds", "Script reruns by page", ("page",))
+
 
 def render_global_sidebar():
     """Render the global sidebar with language selection."""
@@ -67,17 +70,20 @@ def main():
     
     # Initialize session state
     state.init_session_state()
+    metrics.start()
     
     # Get current game and render appropriate page
     current_game = state.get_current_game()
     
-    if current_game == "werewolf":
-        render_werewolf_page()
-    elif current_game == "turtle_soup":
-        render_turtle_soup_page()
-    else:
-        render_global_sidebar()
-        render_home_page()
+    # st.rerun() raises out of the page; the timer still records that run
+    with RERUN_SECONDS.time(page=current_game):
+        if current_game == "werewolf":
+            render_werewolf_page()
+        elif current_game == "turtle_soup":
+            render_turtle_soup_page()
+        else:
+            render_global_sidebar()
+            render_home_page()
 
 
 if __name__ == "__main__":
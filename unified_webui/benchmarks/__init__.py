@@ -0,0 +1,40 @@
+"""Load and render benchmarks for unified MysterySeek platform.
+
+The harnesses run the real pages under Streamlit's headless ``AppTest``
+against the stand-in engines in ``benchmarks/fakes``, which answer through
+:mod:`unified_webui.benchmarks.mock_backend` instead of a model server.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+FAKES_DIR = Path(__file__).parent / "fakes"
+
+FAKE_MODULES = (
+    "game",
+    "game.domain",
+    "game.domain.entities",
+    "game.engine",
+    "game.session_runner",
+    "autowerewolf",
+    "autowerewolf.streamlit_web",
+    "autowerewolf.streamlit_web.session",
+    "autowerewolf.streamlit_web.config_loader",
+)
+
+
+def install_fakes() -> None:
+    """Import the fake ``game`` and ``autowerewolf`` packages ahead of the real ones.
+
+    The pages put the submodule directories first on ``sys.path`` when they
+    run, so the fakes are pre-imported into ``sys.modules`` rather than only
+    being placed on the path.
+    """
+    if str(FAKES_DIR) not in sys.path:
+        sys.path.insert(0, str(FAKES_DIR))
+    for name in FAKE_MODULES:
+        module = sys.modules.get(name)
+        if module is not None and not str(getattr(module, "__file__", "") or "").startswith(str(FAKES_DIR)):
+            del sys.modules[name]
+        importlib.import_module(name)
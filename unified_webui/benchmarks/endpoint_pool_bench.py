@@ -0,0 +1,269 @@
+"""EndpointPool routing harness for unified MysterySeek platform.
+
+Starts local ``http.server`` stand-ins for model endpoints and drives an
+:class:`~unified_webui.endpoint_pool.EndpointPool` against them through the
+shared HTTP clients, the way the pages do. Five scenarios are checked:
+
+* ``least_outstanding``: one endpoint answers slower than the others and
+  must receive fewer of the concurrent requests.
+* ``ejection``: an endpoint that drops connections is ejected after
+  ``failure_threshold`` failures and no longer chosen.
+* ``readmission``: once it answers again, a health check re-admits it.
+* ``server_errors``: an endpoint answering 500 is ejected like a down one.
+* ``client_errors``: an endpoint answering 404 stays in the pool, since
+  the request, not the endpoint, was at fault.
+
+Usage::
+
+    python -m unified_webui.benchmarks.endpoint_pool_bench --requests 200 --output pool.json
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from unified_webui.config import ConnectionPoolSettings, EndpointPoolSettings
+import httpx
+
+from unified_webui.endpoint_pool import EndpointPool, endpoint_outcome
+from unified_webui.model_clients import ModelClientRegistry
+
+logger = logging.getLogger(__name__)
+
+SCENARIOS = ("least_outstanding", "ejection", "readmission", "server_errors", "client_errors")
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server: "StandInEndpoint"
+
+    def do_GET(self):
+        endpoint = self.server
+        if endpoint.down:
+            # Hang up without a response, like a crashed or restarting model server.
+            self.close_connection = True
+            return
+        time.sleep(endpoint.latency_ms / 1000)
+        with endpoint.lock:
+            endpoint.served += 1
+        body = b'{"models": []}'
+        self.send_response(endpoint.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInEndpoint(ThreadingHTTPServer):
+    """A model endpoint on a free local port with a fixed latency that can be taken down.
+
+    ``status`` is the HTTP status it answers with while up.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency_ms: float = 5.0):
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.latency_ms = latency_ms
+        self.down = False
+        self.status = 200
+        self.served = 0
+        self.lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, name=f"stand-in-{self.port}", daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    passed: bool
+    detail: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+def _make_pool(urls: List[str]) -> EndpointPool:
+    settings = EndpointPoolSettings(
+        health_check_interval=0,
+        health_check_timeout=1.0,
+        failure_threshold=2,
+        readmit_after=0.2,
+        sticky_sessions=True,
+    )
+    registry = ModelClientRegistry(ConnectionPoolSettings())
+    return EndpointPool("ollama", urls, settings=settings, registry=registry)
+
+
+def _request(pool: EndpointPool, affinity: Optional[str] = None) -> Optional[str]:
+    """One routed request; returns the endpoint it went to, or None when it failed."""
+    url = pool.choose(affinity)
+    client = pool.registry.get_http_client(url)
+    try:
+        with pool.track(url):
+            client.get(url + "/api/tags", timeout=2.0).raise_for_status()
+        return url
+    except Exception as e:
+        if endpoint_outcome(e) is None and not isinstance(e, httpx.HTTPStatusError):
+            raise
+        return None
+
+
+def least_outstanding(requests: int, concurrency: int) -> ScenarioResult:
+    fast = [StandInEndpoint(latency_ms=5), StandInEndpoint(latency_ms=5)]
+    slow = StandInEndpoint(latency_ms=50)
+    endpoints = fast + [slow]
+    pool = _make_pool([e.url for e in endpoints])
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lambda _: _request(pool), range(requests)))
+        served = {e.url: e.served for e in endpoints}
+        fast_share = min(e.served for e in fast)
+        passed = slow.served < fast_share
+        return ScenarioResult(
+            "least_outstanding",
+            passed,
+            f"slow endpoint served {slow.served}, fast endpoints at least {fast_share}",
+            {"served": served},
+        )
+    finally:
+        pool.stop()
+        for endpoint in endpoints:
+            endpoint.stop()
+
+
+def ejection(requests: int, concurrency: int) -> ScenarioResult:
+    endpoints = [StandInEndpoint(), StandInEndpoint()]
+    broken = endpoints[1]
+    pool = _make_pool([e.url for e in endpoints])
+    try:
+        broken.down = True
+        failed = sum(1 for _ in range(requests) if _request(pool) is None)
+        chosen = {pool.choose() for _ in range(20)}
+        healthy = {s["url"]: s["healthy"] for s in pool.stats()}
+        threshold = pool.settings.failure_threshold
+        passed = not healthy[broken.url] and broken.url not in chosen and failed <= threshold
+        return ScenarioResult(
+            "ejection",
+            passed,
+            f"{failed} failed requests before ejection (threshold {threshold}); "
+            f"chosen afterwards: {sorted(chosen)}",
+            {"failed": failed, "healthy": healthy},
+        )
+    finally:
+        pool.stop()
+        for endpoint in endpoints:
+            endpoint.stop()
+
+
+def readmission(requests: int, concurrency: int) -> ScenarioResult:
+    endpoints = [StandInEndpoint(), StandInEndpoint()]
+    flaky = endpoints[1]
+    pool = _make_pool([e.url for e in endpoints])
+    try:
+        flaky.down = True
+        for _ in range(pool.settings.failure_threshold):
+            pool.check_health()
+        ejected = not pool.is_healthy(flaky.url)
+        # Still down: the first check after readmit_after must keep it out.
+        time.sleep(pool.settings.readmit_after)
+        pool.check_health()
+        kept_out = not pool.is_healthy(flaky.url)
+        flaky.down = False
+        time.sleep(pool.settings.readmit_after)
+        pool.check_health()
+        readmitted = pool.is_healthy(flaky.url)
+        before = flaky.served
+        for _ in range(requests):
+            _request(pool)
+        routed = flaky.served - before
+        passed = ejected and kept_out and readmitted and routed > 0
+        return ScenarioResult(
+            "readmission",
+            passed,
+            f"ejected={ejected} kept_out={kept_out} readmitted={readmitted}, "
+            f"then served {routed}/{requests} requests",
+            {"ejected": ejected, "kept_out": kept_out, "readmitted": readmitted, "routed": routed},
+        )
+    finally:
+        pool.stop()
+        for endpoint in endpoints:
+            endpoint.stop()
+
+
+def _status_scenario(name: str, status: int, ejected: bool, requests: int) -> ScenarioResult:
+    endpoints = [StandInEndpoint(), StandInEndpoint()]
+    erroring = endpoints[1]
+    pool = _make_pool([e.url for e in endpoints])
+    try:
+        erroring.status = status
+        failed = sum(1 for _ in range(requests) if _request(pool) is None)
+        healthy = pool.is_healthy(erroring.url)
+        passed = healthy != ejected
+        return ScenarioResult(
+            name,
+            passed,
+            f"HTTP {status} endpoint {'ejected' if not healthy else 'kept'} after {failed} failed requests",
+            {"failed": failed, "healthy": healthy},
+        )
+    finally:
+        pool.stop()
+        for endpoint in endpoints:
+            endpoint.stop()
+
+
+def server_errors(requests: int, concurrency: int) -> ScenarioResult:
+    return _status_scenario("server_errors", 500, True, requests)
+
+
+def client_errors(requests: int, concurrency: int) -> ScenarioResult:
+    return _status_scenario("client_errors", 404, False, requests)
+
+
+RUNNERS: Dict[str, Callable[[int, int], ScenarioResult]] = {
+    "least_outstanding": least_outstanding,
+    "ejection": ejection,
+    "readmission": readmission,
+    "server_errors": server_errors,
+    "client_errors": client_errors,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check EndpointPool routing against local stand-in endpoints")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS), help="Scenarios to run")
+    parser.add_argument("--requests", type=int, default=120, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=12, help="Concurrent requests in least_outstanding")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    results = [RUNNERS[name](args.requests, args.concurrency) for name in args.scenarios]
+    for result in results:
+        print(f"{'PASS' if result.passed else 'FAIL'}  {result.name:<18} {result.detail}")
+    if args.output:
+        args.output.write_text(json.dumps([r.__dict__ for r in results], indent=2))
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
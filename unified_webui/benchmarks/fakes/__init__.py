@@ -0,0 +1 @@
+"""Fake benchmark doubles for the game submodules."""
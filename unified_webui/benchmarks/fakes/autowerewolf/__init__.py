@@ -0,0 +1 @@
+"""Fake AutoWerewolf package for the benchmarks."""
@@ -0,0 +1,15 @@
+from autowerewolf.streamlit_web.session import StreamlitGameConfig, StreamlitModelConfig
+
+
+class _ConfigLoader:
+    model_config = None
+    game_config = None
+
+    def load_from_file(self):
+        self.model_config = StreamlitModelConfig(backend="api", model_name="mock", api_base="http://mock.invalid")
+
+    def load_game_config(self):
+        self.game_config = StreamlitGameConfig()
+
+
+streamlit_config_loader = _ConfigLoader()
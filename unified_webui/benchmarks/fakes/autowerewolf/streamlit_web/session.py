@@ -0,0 +1,177 @@
+import os
+import queue
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from unified_webui.benchmarks.mock_backend import mock_backend
+
+# The page reruns itself every second while a game reports "running", which
+# never settles under AppTest; live games report this status instead.
+LIVE_STATUS = os.environ.get("BENCH_WEREWOLF_STATUS", "paused")
+SEATS = 12
+ROLES = ("werewolf", "werewolf", "werewolf", "werewolf", "seer", "witch", "hunter", "guard",
+         "villager", "villager", "villager", "villager")
+EVENT_TYPES = ("speech", "speech", "speech", "vote", "system", "death", "sheriff")
+
+
+@dataclass
+class StreamlitModelConfig:
+    backend: str = "ollama"
+    model_name: str = "mock"
+    api_base: Optional[str] = None
+    api_key: Optional[str] = None
+    ollama_base_url: Optional[str] = None
+    temperature: float = 0.7
+    max_tokens: int = 1024
+    enable_corrector: bool = True
+    corrector_max_retries: int = 2
+
+
+@dataclass
+class StreamlitGameConfig:
+    role_set: str = "A"
+    random_seed: Optional[int] = None
+    language: str = "en"
+
+
+@dataclass
+class StreamlitCorrectorConfig:
+    enabled: bool = True
+    max_retries: int = 2
+    use_separate_model: bool = False
+
+
+@dataclass
+class PlayerData:
+    id: str
+    name: str
+    seat_number: int
+    role: str = "villager"
+    is_alive: bool = True
+    is_teammate: bool = False
+    is_human: bool = False
+
+
+@dataclass
+class EventData:
+    event_type: str
+    description: str
+    day_number: int = 1
+    phase: str = "day"
+    actor_id: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+def make_event(index: int) -> EventData:
+    """A deterministic event; ``index`` picks its type, speaker and day."""
+    seat = index % SEATS + 1
+    event_type = EVENT_TYPES[index % len(EVENT_TYPES)]
+    return EventData(
+        event_type=event_type,
+        description=f"Player {seat} ({event_type}): I think seat {(seat + 4) % SEATS + 1} has been too quiet today.",
+        day_number=index // (SEATS * 2) + 1,
+        phase="day" if index % (SEATS * 2) < SEATS else "night",
+        actor_id=f"p{seat}",
+    )
+
+
+class StreamlitGameSession:
+    """A game whose players each make one mock-backend call per speech.
+
+    In play mode the game pauses once per round for a speech from the human
+    seat, served through ``get_action_request``/``submit_action``.
+    """
+
+    def __init__(self, mode, model_config=None, player_seat=None, player_name=None, max_days: int = 3):
+        self.mode = mode
+        self.game_id = uuid.uuid4().hex
+        self.error_message = ""
+        self.events: List[EventData] = []
+        self.model_config = model_config
+        self.max_days = max_days
+        self.human_seat = (player_seat or 1) if mode == "play" else None
+        self.players = [
+            PlayerData(f"p{i}", player_name if i == self.human_seat and player_name else f"P{i}", i, ROLES[i - 1],
+                       is_human=i == self.human_seat)
+            for i in range(1, SEATS + 1)
+        ]
+        self._status = "idle"
+        self._stop = threading.Event()
+        self._requests: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._answers: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def snapshot(cls, mode: str, events: int, pending_action: bool = False) -> "StreamlitGameSession":
+        """A game frozen mid-run with ``events`` events and no game thread."""
+        session = cls(mode)
+        session._status = "running"
+        session.events = [make_event(i) for i in range(events)]
+        if pending_action:
+            session._requests.put({"action_type": "text_input", "prompt": "Your turn to speak."})
+        return session
+
+    @property
+    def status(self) -> str:
+        return LIVE_STATUS if self._status == "running" else self._status
+
+    def start(self):
+        self._status = "running"
+        self._thread = threading.Thread(target=self._run, name=f"werewolf-{self.game_id[:8]}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        index = 0
+        for _ in range(self.max_days * SEATS * 2):
+            if self._stop.is_set():
+                return
+            seat = index % SEATS + 1
+            if seat == self.human_seat:
+                self._requests.put({"action_type": "text_input", "prompt": "Your turn to speak."})
+                try:
+                    self._answers.get(timeout=30)
+                except queue.Empty:
+                    pass
+            else:
+                mock_backend.invoke(f"seat {seat} speaks")
+            self.events.append(make_event(index))
+            index += 1
+        self._status = "completed"
+
+    def stop(self):
+        self._stop.set()
+        self._answers.put(None)
+        self._status = "stopped"
+
+    def get_state(self):
+        return {
+            "day_number": self.events[-1].day_number if self.events else 1,
+            "phase": self.events[-1].phase if self.events else "night",
+            "players": self.players,
+            "sheriff_id": None,
+            "winning_team": "village" if self._status == "completed" else None,
+            "human_player_view": {"role": ROLES[self.human_seat - 1], "alignment": "village", "is_alive": True,
+                                  "private_info": {}} if self.mode == "play" else None,
+        }
+
+    def get_events(self):
+        return list(self.events)
+
+    def get_action_request(self, timeout=0.05):
+        try:
+            return self._requests.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def submit_action(self, action_type, target_id, text, confirm):
+        self._answers.put((action_type, target_id, text, confirm))
+
+
+class _SessionManager:
+    def create_session(self, mode, model_config, game_config, corrector_config, player_seat=None, player_name=None):
+        return StreamlitGameSession(mode, model_config=model_config, player_seat=player_seat, player_name=player_name)
+
+
+session_manager = _SessionManager()
@@ -0,0 +1 @@
+"""Fake Echoes-of-Deceit ``game`` package for the benchmarks."""
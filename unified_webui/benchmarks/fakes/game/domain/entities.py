@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+
+class GameState(Enum):
+    LOBBY = "lobby"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    ABORTED = "aborted"
+
+
+@dataclass
+class Constraints:
+    max_hints: int = 3
+
+
+@dataclass
+class Puzzle:
+    id: str
+    title: str
+    description: str = ""
+    difficulty: Optional[str] = "medium"
+    language: str = "en"
+    tags: List[str] = field(default_factory=list)
+    puzzle_statement: str = "A man walks into a bar and asks for a glass of water."
+    answer: str = "He had hiccups; the bartender scared them away."
+    constraints: Constraints = field(default_factory=Constraints)
+
+
+@dataclass
+class Session:
+    session_id: str
+    puzzle_id: str
+    player_id: str
+    state: GameState = GameState.IN_PROGRESS
+    turn_count: int = 0
+    hint_count: int = 0
+    score: Optional[int] = None
+
+    @property
+    def question_count(self) -> int:
+        return self.turn_count
@@ -0,0 +1,71 @@
+import os
+import threading
+import uuid
+
+from game.domain.entities import Puzzle, Session
+
+from unified_webui.benchmarks.mock_backend import mock_backend
+
+PUZZLE_COUNT = int(os.environ.get("BENCH_PUZZLES", "40"))
+DIFFICULTIES = ("easy", "medium", "hard")
+
+
+class _ModelRegistry:
+    config = {"provider": "mock", "mock": {"base_url": "http://mock.invalid", "llm_model_name": "mock"}}
+
+    def get_llm_client(self):
+        return mock_backend
+
+
+class _SessionStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sessions = {}
+
+    def save_session(self, session):
+        with self._lock:
+            self.sessions[session.session_id] = session
+
+    def get_session(self, session_id):
+        return self.sessions.get(session_id)
+
+
+class GameEngine:
+    """Shares one session store per process, like the real engine's on-disk store."""
+
+    _store = _SessionStore()
+
+    def __init__(self):
+        self.kb_manager = object()
+        self.memory_manager = object()
+        self.session_store = self._store
+        self.model_registry = _ModelRegistry()
+        self.agents_config = {}
+        self._puzzles = {
+            f"p{i}": Puzzle(
+                id=f"p{i}",
+                title=f"Puzzle {i}",
+                description="A short mystery about a stranger and a glass of water. " * 3,
+                difficulty=DIFFICULTIES[i % 3],
+                language=("en", "zh")[i % 2],
+                tags=[f"tag{i % 5}", "classic"],
+            )
+            for i in range(PUZZLE_COUNT)
+        }
+
+    def list_puzzles(self):
+        return list(self._puzzles.values())
+
+    def get_puzzle(self, puzzle_id):
+        return self._puzzles[puzzle_id]
+
+    def list_sessions(self, player_id=None):
+        return [s for s in list(self._store.sessions.values()) if player_id is None or s.player_id == player_id]
+
+    def get_session(self, session_id):
+        return self._store.sessions[session_id]
+
+    async def create_session(self, puzzle_id, player_id):
+        session = Session(uuid.uuid4().hex, puzzle_id, player_id)
+        self._store.save_session(session)
+        return session
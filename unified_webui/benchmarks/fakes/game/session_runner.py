@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+
+from game.domain.entities import GameState
+
+
+@dataclass
+class AgentResponse:
+    message: str
+    verdict: str = ""
+    game_over: bool = False
+    metadata: dict = field(default_factory=dict)
+
+
+class GameSessionRunner:
+    """Answers every question with one call to the mock backend."""
+
+    def __init__(self, session, puzzle, kb_manager, memory_manager, session_store, llm_client, agents_config,
+                 player_agent_mode=False, dm_agent_mode=True):
+        self.session = session
+        self.puzzle = puzzle
+        self.session_store = session_store
+        self.llm_client = llm_client
+
+    @property
+    def is_active(self):
+        return self.session.state == GameState.IN_PROGRESS
+
+    def start_game(self):
+        return AgentResponse("Welcome! " + self.puzzle.puzzle_statement)
+
+    async def process_player_input(self, text):
+        self.session.turn_count += 1
+        if text == "/hint":
+            self.session.hint_count += 1
+            return AgentResponse("Hint: think about why he was thirsty.")
+        answer = self.llm_client.invoke(text)
+        self.session_store.save_session(self.session)
+        return AgentResponse(answer.content, verdict="yes")
+
+    async def run_player_agent_turn(self):
+        self.session.turn_count += 1
+        answer = self.llm_client.invoke(f"Q{self.session.turn_count}")
+        return AgentResponse(answer.content, verdict="no", metadata={"player_message": f"Q{self.session.turn_count}?"})
@@ -0,0 +1,382 @@
+"""Concurrent-session load generator for unified MysterySeek platform.
+
+Each simulated session is one ``AppTest`` of ``app.py`` driven from its own
+thread, so N sessions share one process, its caches and its singletons the
+way N browser tabs share one ``streamlit run``. Every rerun is timed from
+the harness side; the mock backend records how long model calls queued.
+
+Usage::
+
+    python -m unified_webui.benchmarks.load_test --sessions 1 2 4 8 16 --output load.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from unified_webui.benchmarks import install_fakes
+from unified_webui.benchmarks.mock_backend import mock_backend, percentile
+
+logger = logging.getLogger(__name__)
+
+APP_PATH = Path(__file__).parent.parent / "app.py"
+FLOWS = ("home", "turtle_soup", "werewolf_watch", "werewolf_play")
+QUESTIONS = ("Is he dead?", "Was it an accident?", "Is the water important?", "Did he know the bartender?")
+# A sessions level whose throughput gains less than this over the previous level has stopped scaling.
+SCALING_GAIN = 1.1
+# How often memory is sampled while the sessions of a level are running.
+MEMORY_SAMPLE_INTERVAL = 0.05
+
+
+@dataclass
+class SessionResult:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    retries: int = 0
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def share_test_runtime() -> None:
+    """Let ``AppTest`` runs overlap across threads.
+
+    Each ``AppTest.run`` installs a mock ``Runtime`` singleton and clears it
+    when it returns, which pulls the runtime out from under any run still in
+    progress on another thread. After this, a cleared singleton falls back to
+    the first mock seen, and the app-testing config flag stays on.
+    """
+    from streamlit import config
+    from streamlit.runtime import Runtime
+
+    shared: List[object] = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            if not shared:
+                shared.append(cls._instance)
+            return cls._instance
+        if shared:
+            return shared[0]
+        raise RuntimeError("Runtime hasn't been created!")
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(shared))
+    config.set_option("global.appTest", True)
+
+
+def _timed(result: SessionResult, action: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    at = action()
+    result.latencies_ms.append((time.perf_counter() - started) * 1000)
+    if at is not None and at.exception:
+        result.errors.append(str(at.exception[0].value))
+
+
+def _keys(widgets) -> List[str]:
+    return [w.key for w in widgets if w.key]
+
+
+class SimulatedSession:
+    """One browser tab walking through a flow for ``rounds`` interactions.
+
+    ``AppTest`` is not built for overlapping runs in one process and now
+    and then drops a click or returns a partial element tree. Each step
+    therefore checks that the widget the next step needs is on screen and
+    repeats itself (at most ``MAX_ATTEMPTS`` times) when it is not; repeats
+    are timed like any other rerun and counted separately as retries.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, flow: str, index: int, rounds: int, think_ms: float, timeout: float):
+        from streamlit.testing.v1 import AppTest
+
+        self.flow = flow
+        self.index = index
+        self.rounds = rounds
+        self.think_ms = think_ms
+        self.at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+        self.result = SessionResult()
+
+    def _think(self) -> None:
+        if self.think_ms:
+            time.sleep(self.think_ms / 1000)
+
+    def _step(self, action: Callable[[], object], ready: Callable[[], bool], what: str) -> None:
+        for attempt in range(self.MAX_ATTEMPTS):
+            if attempt:
+                self.result.retries += 1
+            _timed(self.result, action)
+            if ready():
+                return
+        shown = [e.value for e in self.at.exception] or _keys(self.at.button)
+        raise RuntimeError(f"{what} not shown after {self.MAX_ATTEMPTS} attempts (on screen: {shown})")
+
+    def _click(self, key: str):
+        """Click ``key`` if it is on screen; otherwise just rerun."""
+        if key in _keys(self.at.button):
+            return self.at.button(key=key).click().run()
+        return self.at.run()
+
+    def _has_button(self, prefix: str) -> bool:
+        return any(key.startswith(prefix) for key in _keys(self.at.button))
+
+    def run(self) -> None:
+        try:
+            self._step(self.at.run, lambda: self._has_button("play_"), "home page")
+            getattr(self, f"_run_{self.flow}")()
+        except Exception as e:
+            self.result.errors.append(f"{type(e).__name__}: {e}")
+
+    def _run_home(self) -> None:
+        for _ in range(self.rounds):
+            self._think()
+            self._step(self.at.run, lambda: self._has_button("play_"), "home page")
+
+    def _send_button(self):
+        return next((b for b in self.at.button if b.key and "FormSubmitter:turtle_player_input_form" in b.key), None)
+
+    def _ask(self, question: str):
+        send = self._send_button()
+        if send is None:
+            return self.at.run()
+        self.at.text_input(key="turtle_player_question_input").input(question)
+        return send.click().run()
+
+    def _run_turtle_soup(self) -> None:
+        self._step(lambda: self._click("play_turtle_soup_btn"), lambda: self._has_button("turtle_start_puzzle_"),
+                   "puzzle list")
+        puzzles = [key for key in _keys(self.at.button) if key.startswith("turtle_start_puzzle_")]
+        puzzle = puzzles[self.index % len(puzzles)]
+        self._step(lambda: self._click(puzzle), lambda: self._send_button() is not None, "question form")
+        for turn in range(self.rounds):
+            self._think()
+            question = QUESTIONS[turn % len(QUESTIONS)]
+            self._step(lambda: self._ask(question), lambda: self._send_button() is not None, "question form")
+
+    def _start_werewolf(self, mode: str) -> None:
+        at = self.at
+        self._step(lambda: self._click("play_werewolf_btn"), lambda: "werewolf_mode_radio" in _keys(at.radio),
+                   "werewolf sidebar")
+
+        def configure():
+            if "werewolf_mode_radio" not in _keys(at.radio):
+                return at.run()
+            at.radio(key="werewolf_mode_radio").set_value(mode)
+            at.selectbox(key="werewolf_backend_select").set_value("api")
+            return at.run()
+
+        def configured() -> bool:
+            return (
+                "werewolf_start_btn" in _keys(at.button)
+                and "werewolf_mode_radio" in _keys(at.radio)
+                and "werewolf_backend_select" in _keys(at.selectbox)
+                and at.radio(key="werewolf_mode_radio").value == mode
+                and at.selectbox(key="werewolf_backend_select").value == "api"
+            )
+
+        self._step(configure, configured, "start button")
+        self._step(lambda: self._click("werewolf_start_btn"), self._started, "werewolf game")
+
+    def _started(self) -> bool:
+        state = self.at.session_state
+        return "werewolf_session" in state and state["werewolf_session"] is not None
+
+    def _in_game(self) -> bool:
+        keys = _keys(self.at.button)
+        return "werewolf_clear_events_btn" in keys or "werewolf_close_winner_btn" in keys
+
+    def _run_werewolf_watch(self) -> None:
+        self._start_werewolf("watch")
+        for _ in range(self.rounds):
+            self._think()
+            self._step(self.at.run, self._in_game, "event log")
+        self._stop_werewolf()
+
+    def _speak(self):
+        at = self.at
+        if "werewolf_speech_input" not in _keys(at.text_area):
+            return at.run()
+        at.text_area(key="werewolf_speech_input").input(f"Seat {self.index} thinks seat 5 is lying.")
+        return at.button(key="werewolf_submit_text_btn").click().run()
+
+    def _run_werewolf_play(self) -> None:
+        self._start_werewolf("play")
+        for _ in range(self.rounds):
+            self._think()
+            self._step(self._speak, self._in_game, "event log")
+        self._stop_werewolf()
+
+    def _stop_werewolf(self) -> None:
+        if self._started():
+            self.at.session_state["werewolf_session"].stop()
+
+
+class PeakMemory:
+    """Peak memory above a baseline while the sessions are alive.
+
+    With tracemalloc on, it is the traced Python heap's own peak. Otherwise
+    a thread samples process RSS every ``MEMORY_SAMPLE_INTERVAL`` seconds.
+    Memory freed by the time the sessions finish still counts that way.
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.baseline = 0
+        self.peak = 0
+
+    def _sample(self) -> None:
+        while not self._stop.wait(MEMORY_SAMPLE_INTERVAL):
+            self.peak = max(self.peak, _rss_bytes())
+
+    def __enter__(self) -> "PeakMemory":
+        gc.collect()
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self.baseline = tracemalloc.get_traced_memory()[0]
+        else:
+            self.baseline = self.peak = _rss_bytes()
+            self._thread = threading.Thread(target=self._sample, name="load-memory", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.peak = max(self.peak, _rss_bytes())
+        else:
+            self.peak = tracemalloc.get_traced_memory()[1]
+
+    def per_session_mb(self, sessions: int) -> Optional[float]:
+        """Growth per session, or None when none was seen (memory the sessions reused was already mapped)."""
+        growth = self.peak - self.baseline
+        if growth <= 0:
+            return None
+        return round(growth / sessions / (1024 * 1024), 2)
+
+
+def run_level(flow: str, sessions: int, rounds: int, think_ms: float, timeout: float) -> Dict[str, object]:
+    """Run ``sessions`` concurrent sessions of ``flow`` and summarize them."""
+    mock_backend.configure(mock_backend.slots, mock_backend.latency_ms)
+    with PeakMemory() as memory:
+        simulated = [SimulatedSession(flow, i, rounds, think_ms, timeout) for i in range(sessions)]
+        threads = [threading.Thread(target=s.run, name=f"load-{flow}-{s.index}") for s in simulated]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+
+    latencies = [ms for s in simulated for ms in s.result.latencies_ms]
+    errors = [e for s in simulated for e in s.result.errors]
+    for error in sorted(set(errors))[:3]:
+        logger.warning(f"{flow} x{sessions}: {error}")
+    summary = {
+        "flow": flow,
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "retries": sum(s.result.retries for s in simulated),
+        "wall_s": round(wall, 2),
+        "reruns_per_s": round(len(latencies) / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(max(latencies), 1) if latencies else 0.0,
+        "memory_per_session_mb": memory.per_session_mb(sessions),
+        "backend": mock_backend.stats(),
+    }
+    del simulated
+    return summary
+
+
+def scaling_limit(levels: List[Dict[str, object]]) -> Optional[int]:
+    """The first sessions level that did not raise throughput by ``SCALING_GAIN``."""
+    for previous, current in zip(levels, levels[1:]):
+        if current["reruns_per_s"] < previous["reruns_per_s"] * SCALING_GAIN:
+            return current["sessions"]
+    return None
+
+
+def _or_dash(value: Optional[float]) -> str:
+    return "-" if value is None else str(value)
+
+
+def format_report(results: Dict[str, List[Dict[str, object]]]) -> str:
+    lines = []
+    header = f"{'sessions':>8} {'reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'MB/sess':>8} " \
+             f"{'queue p95':>9} {'inflight':>8} {'retries':>7} {'errors':>6}"
+    for flow, levels in results.items():
+        lines.append(f"\n== {flow} ==")
+        lines.append(header)
+        for level in levels:
+            backend = level["backend"]
+            lines.append(
+                f"{level['sessions']:>8} {level['reruns_per_s']:>9} {level['p50_ms']:>8} {level['p95_ms']:>8} "
+                f"{level['p99_ms']:>8} {_or_dash(level['memory_per_session_mb']):>8} "
+                f"{backend['queue_wait_p95_ms']:>9} {backend['max_inflight']:>8} {level['retries']:>7} "
+                f"{level['errors']:>6}"
+            )
+        limit = scaling_limit(levels)
+        lines.append(f"throughput stops scaling at {limit} sessions" if limit else "throughput still scaling")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Drive concurrent simulated sessions through the web UI")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Concurrency levels")
+    parser.add_argument("--flows", nargs="+", choices=FLOWS, default=list(FLOWS), help="Flows to run")
+    parser.add_argument("--rounds", type=int, default=10, help="Interactions per session")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Pause between interactions")
+    parser.add_argument("--backend-slots", type=int, default=4, help="Parallel requests the mock backend serves")
+    parser.add_argument("--backend-latency-ms", type=float, default=50.0, help="Mock backend service time")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-rerun timeout in seconds")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Measure memory per session with tracemalloc instead of RSS (slows every rerun)")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    install_fakes()
+    share_test_runtime()
+    mock_backend.configure(args.backend_slots, args.backend_latency_ms)
+    if args.trace_memory:
+        tracemalloc.start()
+
+    # One untimed session per flow first, so imports and process-wide caches are not billed to the first level.
+    for flow in args.flows:
+        run_level(flow, 1, 1, 0.0, args.timeout)
+
+    results: Dict[str, List[Dict[str, object]]] = {}
+    for flow in args.flows:
+        results[flow] = [run_level(flow, n, args.rounds, args.think_ms, args.timeout) for n in args.sessions]
+    print(format_report(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"created_at": time.time(), "args": {k: str(v) for k, v in vars(args).items()},
+                       "results": results}, f, indent=2)
+    return 0 if not any(level["errors"] for levels in results.values() for level in levels) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
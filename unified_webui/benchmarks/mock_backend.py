@@ -0,0 +1,84 @@
+"""Mock model backend for the unified MysterySeek benchmarks."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class MockResponse:
+    content: str
+    response_metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+class MockModelBackend:
+    """A model server with ``slots`` parallel decoders and a fixed service time.
+
+    Calls beyond ``slots`` wait for a free decoder, like requests queued by
+    Ollama's ``OLLAMA_NUM_PARALLEL``. Queue wait and service time are
+    recorded per call so a load run can tell backend saturation apart from
+    time spent in the app itself.
+    """
+
+    def __init__(self, slots: int = 4, latency_ms: float = 50.0):
+        self._lock = threading.Lock()
+        self.configure(slots, latency_ms)
+
+    def configure(self, slots: int, latency_ms: float) -> None:
+        with self._lock:
+            self.slots = max(1, slots)
+            self.latency_ms = latency_ms
+            self._semaphore = threading.BoundedSemaphore(self.slots)
+            self._waits: List[float] = []
+            self._services: List[float] = []
+            self._inflight = 0
+            self._max_inflight = 0
+            self._max_queued = 0
+            self._queued = 0
+
+    def invoke(self, prompt: Any = "", **kwargs) -> MockResponse:
+        with self._lock:
+            semaphore = self._semaphore
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+        queued_at = time.perf_counter()
+        with semaphore:
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._inflight += 1
+                self._max_inflight = max(self._max_inflight, self._inflight)
+            time.sleep(self.latency_ms / 1000)
+            finished = time.perf_counter()
+            with self._lock:
+                self._inflight -= 1
+                self._waits.append((started - queued_at) * 1000)
+                self._services.append((finished - started) * 1000)
+        return MockResponse(content=f"Mock answer to: {str(prompt)[:40]}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits, services = list(self._waits), list(self._services)
+            return {
+                "slots": self.slots,
+                "latency_ms": self.latency_ms,
+                "calls": len(waits),
+                "queue_wait_p50_ms": round(percentile(waits, 50), 1),
+                "queue_wait_p95_ms": round(percentile(waits, 95), 1),
+                "queue_wait_p99_ms": round(percentile(waits, 99), 1),
+                "service_p50_ms": round(percentile(services, 50), 1),
+                "max_inflight": self._max_inflight,
+                "max_queued": self._max_queued,
+            }
+
+
+mock_backend = MockModelBackend()
@@ -0,0 +1,262 @@
+"""Render-cost benchmarks for the unified MysterySeek page functions.
+
+Every case is a tiny Streamlit script that sets up fake state once and then
+calls one page function per rerun under ``AppTest``. The call is timed inside
+the script, and the size of what it sent to the browser is the summed size
+of the element protos in the resulting tree.
+
+Usage::
+
+    python -m unified_webui.benchmarks.render_bench --output bench.json
+    python -m unified_webui.benchmarks.render_bench --output new.json --compare bench.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from unified_webui.benchmarks import install_fakes
+from unified_webui.benchmarks.mock_backend import percentile
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).parent.parent.parent
+RESULTS_VERSION = 1
+# A case regresses when its median call time or its payload grows by more than these fractions.
+TIME_TOLERANCE = 0.20
+PAYLOAD_TOLERANCE = 0.05
+
+SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+from unified_webui.benchmarks import install_fakes
+install_fakes()
+from unified_webui.benchmarks.render_bench import run_case
+run_case({name!r})
+"""
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[int], None]
+    render: Callable[[Any], None]
+    size: int = 0
+
+
+def _setup_home(size: int) -> None:
+    pass
+
+
+def _render_home(i18n) -> None:
+    from unified_webui.pages.home import render_home_page
+
+    render_home_page()
+
+
+def _setup_werewolf(mode: str) -> Callable[[int], None]:
+    def setup(size: int) -> None:
+        from autowerewolf.streamlit_web.session import StreamlitGameSession
+        from unified_webui import session_state as state
+
+        state.set_werewolf_session(StreamlitGameSession.snapshot(mode, size, pending_action=mode == "play"))
+
+    return setup
+
+
+def _render_werewolf_main(i18n) -> None:
+    from unified_webui.pages.werewolf import render_werewolf_main_content
+
+    render_werewolf_main_content(i18n)
+
+
+def _render_event_log(i18n) -> None:
+    from unified_webui import session_state as state
+    from unified_webui.pages.werewolf import render_event_log
+
+    render_event_log(state.get_werewolf_session(), i18n)
+
+
+def _setup_turtle_game(size: int) -> None:
+    from game.domain.entities import Session
+    from game.engine import GameEngine
+    from game.session_runner import GameSessionRunner
+    from unified_webui import session_state as state
+    from unified_webui.benchmarks.mock_backend import mock_backend
+
+    engine = GameEngine()
+    puzzle = engine.list_puzzles()[0]
+    session = Session(uuid.uuid4().hex, puzzle.id, state.get_turtle_player_id(), turn_count=size // 2)
+    engine.session_store.save_session(session)
+    state.set_turtle_game_engine(engine)
+    state.set_turtle_session_id(session.session_id)
+    state.set_turtle_puzzle_id(puzzle.id)
+    state.set_turtle_session_runner(
+        GameSessionRunner(session, puzzle, engine.kb_manager, engine.memory_manager, engine.session_store,
+                          mock_backend, engine.agents_config)
+    )
+    for i in range(size):
+        if i % 2 == 0:
+            state.add_turtle_message("user", f"Question {i // 2}: was the water poisoned?", turn_index=i // 2)
+        else:
+            state.add_turtle_message("assistant", "No, think about why he wanted it.", verdict="no",
+                                     turn_index=i // 2)
+
+
+def _render_turtle_game(i18n) -> None:
+    from unified_webui.pages.turtle_soup import render_turtle_game_page
+
+    render_turtle_game_page(i18n)
+
+
+CASES: Dict[str, Case] = {
+    case.name: case
+    for case in [
+        Case("home", _setup_home, _render_home),
+        Case("werewolf_main_watch", _setup_werewolf("watch"), _render_werewolf_main, 100),
+        Case("werewolf_main_play", _setup_werewolf("play"), _render_werewolf_main, 100),
+        *[Case(f"event_log_{n}", _setup_werewolf("watch"), _render_event_log, n) for n in (50, 500, 5000)],
+        *[Case(f"turtle_game_{n}", _setup_turtle_game, _render_turtle_game, n) for n in (10, 100, 1000)],
+    ]
+}
+
+
+def run_case(name: str) -> None:
+    """Script body: set the case up on the first run, then time one render per rerun."""
+    import streamlit as st
+
+    from unified_webui import session_state as state
+
+    case = CASES[name]
+    state.init_session_state()
+    if not st.session_state.get("bench_ready"):
+        case.setup(case.size)
+        st.session_state.bench_ready = True
+        st.session_state.bench_call_ms = []
+    i18n = state.get_i18n()
+    started = time.perf_counter()
+    case.render(i18n)
+    st.session_state.bench_call_ms.append((time.perf_counter() - started) * 1000)
+
+
+def _payload(node) -> Dict[str, int]:
+    """Summed proto size and count of the elements under ``node``."""
+    totals = {"bytes": 0, "elements": 0}
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        totals["bytes"] += proto.ByteSize()
+        totals["elements"] += 1
+    for child in getattr(node, "children", {}).values():
+        sub = _payload(child)
+        totals["bytes"] += sub["bytes"]
+        totals["elements"] += sub["elements"]
+    return totals
+
+
+def bench_case(name: str, reruns: int, timeout: float) -> Dict[str, Any]:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(SCRIPT.format(root=str(ROOT), name=name), default_timeout=timeout)
+    rerun_ms: List[float] = []
+    for _ in range(reruns + 1):
+        started = time.perf_counter()
+        at.run()
+        rerun_ms.append((time.perf_counter() - started) * 1000)
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].value}")
+    calls = at.session_state["bench_call_ms"]
+    # The first call also pays for the case's one-time setup and cold caches.
+    warm = calls[1:]
+    payload = _payload(at._tree)
+    return {
+        "first_call_ms": round(calls[0], 2),
+        "call_ms": round(percentile(warm, 50), 2),
+        "call_p95_ms": round(percentile(warm, 95), 2),
+        "rerun_ms": round(percentile(rerun_ms[1:], 50), 2),
+        "payload_bytes": payload["bytes"],
+        "elements": payload["elements"],
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """One line per case present in both runs; regressions are marked."""
+    lines = []
+    for name, result in current["cases"].items():
+        before = baseline.get("cases", {}).get(name)
+        if before is None:
+            continue
+        time_change = result["call_ms"] / before["call_ms"] - 1 if before["call_ms"] else 0.0
+        payload_change = result["payload_bytes"] / before["payload_bytes"] - 1 if before["payload_bytes"] else 0.0
+        regressed = time_change > TIME_TOLERANCE or payload_change > PAYLOAD_TOLERANCE
+        lines.append(
+            f"{'REGRESSION' if regressed else 'ok':<10} {name:<22} call {before['call_ms']:>8} -> {result['call_ms']:>8} ms "
+            f"({time_change:+.0%})  payload {before['payload_bytes']:>8} -> {result['payload_bytes']:>8} B "
+            f"({payload_change:+.0%})"
+        )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time the page render functions under AppTest")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="Cases to run")
+    parser.add_argument("--reruns", type=int, default=20, help="Timed reruns per case")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-rerun timeout in seconds")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="Earlier results to check for regressions")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    install_fakes()
+    import streamlit
+
+    results = {
+        "version": RESULTS_VERSION,
+        "commit": _git_commit(),
+        "created_at": time.time(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "reruns": args.reruns,
+        "cases": {},
+    }
+    print(f"{'case':<22} {'first ms':>9} {'call ms':>8} {'p95 ms':>8} {'rerun ms':>9} {'payload B':>10} {'elements':>8}")
+    for name in args.cases:
+        result = bench_case(name, args.reruns, args.timeout)
+        results["cases"][name] = result
+        print(
+            f"{name:<22} {result['first_call_ms']:>9} {result['call_ms']:>8} {result['call_p95_ms']:>8} "
+            f"{result['rerun_ms']:>9} {result['payload_bytes']:>10} {result['elements']:>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        lines = compare(results, baseline)
+        print(f"\nAgainst {baseline.get('commit') or args.compare}:")
+        print("\n".join(lines))
+        if any(line.startswith("REGRESSION") for line in lines):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
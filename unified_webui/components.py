@@ -1,16 +1,32 @@
 """Reusable UI components for unified MysterySeek platform."""
 
-from typing import Optional, List
+import hashlib
+import html
+from typing import Any, Dict, Optional, List, Tuple
 import streamlit as st
 
-from unified_webui.config import EMOJI_MAP, CSS_STYLES, HIDE_STREAMLIT_STYLE
+from unified_webui.config import EMOJI_MAP, STATIC_DIR, STYLESHEET_FILE
 from unified_webui.i18n import I18n
+from unified_webui.thinking import THINKING_MODES
+
+
+STYLESHEET = (STATIC_DIR / STYLESHEET_FILE).read_text(encoding="utf-8")
+# The content hash in the URL lets browsers keep the file until it changes.
+STYLESHEET_VERSION = hashlib.sha256(STYLESHEET.encode("utf-8")).hexdigest()[:12]
+STYLESHEET_URL = f"app/static/{STYLESHEET_FILE}?v={STYLESHEET_VERSION}"
 
 
 def render_css() -> None:
-    """Render global CSS styles and hide default Streamlit navigation."""
-    st.markdown(HIDE_STREAMLIT_STYLE, unsafe_allow_html=True)
-    st.markdown(CSS_STYLES, unsafe_allow_html=True)
+    """Render global CSS styles and hide default Streamlit navigation.
+
+    With ``server.enableStaticServing`` on, only a ``<link>`` to the static
+    stylesheet is sent per rerun and the browser fetches the file once;
+    otherwise the stylesheet is inlined as before.
+    """
+    if st.get_option("server.enableStaticServing"):
+        st.markdown(f'<link rel="stylesheet" href="{STYLESHEET_URL}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>\n{STYLESHEET}</style>", unsafe_allow_html=True)
 
 
 def render_platform_header(i18n: I18n) -> None:
@@ -165,6 +181,62 @@ def render_chat_message(
             st.markdown(f"**{name}:** {content}")
 
 
+def render_chat_page_html(messages: List[Dict[str, Any]], i18n: Optional[I18n] = None) -> str:
+    """One static HTML block for a page of archived chat messages."""
+    rows = []
+    for msg in messages:
+        is_user = msg["role"].lower() in ["player", "user", "you"]
+        if is_user:
+            avatar, name, css_class = EMOJI_MAP["player"], i18n("turtle_you") if i18n else "You", "chat-archive-user"
+        else:
+            avatar, name, css_class = EMOJI_MAP["dm"], i18n("turtle_dm") if i18n else "DM", "chat-archive-dm"
+        verdict = msg.get("verdict") or ""
+        verdict_emoji = f" {EMOJI_MAP.get(verdict.lower(), '')}" if verdict else ""
+        content = html.escape(msg["content"]).replace("\n", "<br>")
+        rows.append(
+            f'<div class="chat-archive-message {css_class}">{avatar} <strong>{name}:</strong> {content}{verdict_emoji}</div>'
+        )
+    return "".join(rows)
+
+
+TRACE_LABEL_ATTRIBUTES = ("coroutine", "model", "host")
+
+
+def render_trace_waterfall(traces: List[List[Any]], i18n: I18n) -> None:
+    """One waterfall per trace: every span as a bar placed on the trace's timeline."""
+    blocks = []
+    for spans in traces:
+        spans = sorted(spans, key=lambda s: s.start_ns)
+        start = spans[0].start_ns
+        total_ns = max(max(s.end_ns for s in spans) - start, 1)
+        depth: Dict[str, int] = {}
+        turn = next((s for s in spans if s.name == "turtle.turn"), spans[0])
+        source = turn.attributes.get("source")
+        header = i18n("trace_turn", turn=turn.attributes.get("turn", "?")) + (f" · {source}" if source else "")
+        rows = [
+            f'<div class="trace-header">{html.escape(header)} · {i18n("trace_total")} '
+            f'{turn.duration_ms:.1f} ms</div>'
+        ]
+        for span in spans:
+            depth[span.span_id] = depth[span.parent_id] + 1 if span.parent_id in depth else 0
+            detail = next((span.attributes[k] for k in TRACE_LABEL_ATTRIBUTES if span.attributes.get(k)), None)
+            label = span.name + (f" · {detail}" if detail else "")
+            left = (span.start_ns - start) / total_ns * 100
+            width = (span.end_ns - span.start_ns) / total_ns * 100
+            error = " error" if span.status == "error" else ""
+            title = html.escape(str(span.attributes.get("error", label)), quote=True)
+            rows.append(
+                f'<div class="trace-row">'
+                f'<span class="trace-name" style="padding-left: {depth[span.span_id] * 0.8}rem" title="{title}">'
+                f'{html.escape(label)}</span>'
+                f'<span class="trace-track"><span class="trace-bar{error}" '
+                f'style="left: {left:.2f}%; width: {width:.2f}%"></span></span>'
+                f'<span class="trace-ms">{span.duration_ms:.1f} ms</span></div>'
+            )
+        blocks.append(f'<div class="trace-waterfall">{"".join(rows)}</div>')
+    st.markdown("".join(blocks), unsafe_allow_html=True)
+
+
 def render_verdict_badge(verdict: str) -> str:
     verdict_lower = verdict.lower()
     emoji = EMOJI_MAP.get(verdict_lower, "")
@@ -194,6 +266,35 @@ def render_how_to_play(i18n: I18n) -> None:
         st.markdown(i18n("turtle_instructions"))
 
 
+def render_thinking_controls(
+    i18n: I18n,
+    mode: str,
+    budget: int,
+    key_prefix: str,
+    disabled: bool = False,
+) -> Tuple[str, int]:
+    """Render the thinking mode selector (and budget input in cap mode)."""
+    mode = st.selectbox(
+        i18n("thinking_mode"),
+        options=THINKING_MODES,
+        format_func=lambda x: i18n(f"thinking_{x}"),
+        index=THINKING_MODES.index(mode) if mode in THINKING_MODES else 0,
+        disabled=disabled,
+        key=f"{key_prefix}_thinking_mode_select",
+        help=i18n("thinking_mode_help"),
+    )
+    if mode == "cap":
+        budget = st.number_input(
+            i18n("thinking_budget"),
+            min_value=0,
+            value=budget,
+            step=128,
+            disabled=disabled,
+            key=f"{key_prefix}_thinking_budget_input",
+        )
+    return mode, int(budget)
+
+
 def render_empty_state(message: str, icon: str = "info") -> None:
     emoji = EMOJI_MAP.get(icon, EMOJI_MAP["info"])
     st.markdown(
@@ -0,0 +1,287 @@
+"""Multi-endpoint load balancing for model backends in unified MysterySeek platform."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from unified_webui.config import ENDPOINT_POOL_SETTINGS, EndpointPoolSettings
+from unified_webui.model_clients import ModelClientRegistry, client_registry
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATHS = {
+    "ollama": "/api/tags",
+    "api": "/models",
+}
+
+
+def parse_endpoints(value: Union[str, List[str], None]) -> List[str]:
+    """Split a comma/newline separated URL setting (or a list) into unique endpoints."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.replace("\n", ",").split(",")
+    endpoints = []
+    for url in value:
+        url = url.strip().rstrip("/")
+        if url and url not in endpoints:
+            endpoints.append(url)
+    return endpoints
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """True when ``exc`` (or anything it was raised from) is a transport failure."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (ConnectionError, TimeoutError)):
+            return True
+        if type(exc).__name__ in ("ConnectError", "ConnectTimeout", "ReadTimeout", "RemoteProtocolError",
+                                  "APIConnectionError", "APITimeoutError"):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def endpoint_outcome(exc: BaseException) -> Optional[bool]:
+    """How a request that raised ``exc`` counts for its endpoint: False for a failure, else None.
+
+    Transport errors, timeouts of any kind and 5xx responses are the
+    endpoint's fault. Anything else is left out of its health, including
+    4xx responses (bad requests, unknown models, auth) and errors raised by
+    the caller's own code.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if is_connection_error(exc) or "Timeout" in type(exc).__name__:
+            return False
+        status = _status_code(exc)
+        if status is not None:
+            return False if status >= 500 else None
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+@dataclass
+class Endpoint:
+    url: str
+    healthy: bool = True
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejected_at: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejected_for": round(time.time() - self.ejected_at, 1) if self.ejected_at else 0.0,
+        }
+
+
+class EndpointPool:
+    """Routes work across equivalent endpoints by least outstanding requests.
+
+    Routing is sticky per affinity key (a game or session id) so backends that
+    cache the prompt prefix keep seeing the same conversation. Only the
+    ``max_affinities`` most recently used keys are remembered. Endpoints are
+    ejected after ``failure_threshold`` consecutive failures and re-admitted
+    once a background health check succeeds again.
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        urls: List[str],
+        settings: Optional[EndpointPoolSettings] = None,
+        registry: Optional[ModelClientRegistry] = None,
+    ):
+        if not urls:
+            raise ValueError("EndpointPool needs at least one endpoint")
+        self.backend = backend
+        self.settings = settings or ENDPOINT_POOL_SETTINGS
+        self.registry = registry or client_registry
+        self._endpoints: Dict[str, Endpoint] = {url: Endpoint(url) for url in urls}
+        self._affinity: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self._endpoints)
+
+    def choose(self, affinity: Optional[str] = None) -> str:
+        self._ensure_health_thread()
+        with self._lock:
+            if affinity and self.settings.sticky_sessions:
+                pinned = self._endpoints.get(self._affinity.get(affinity, ""))
+                if pinned is not None and pinned.healthy:
+                    self._affinity.move_to_end(affinity)
+                    return pinned.url
+            candidates = [e for e in self._endpoints.values() if e.healthy]
+            if not candidates:
+                # Fail open: everything is ejected, so try the longest-ejected endpoint.
+                candidates = sorted(self._endpoints.values(), key=lambda e: e.ejected_at or 0.0)[:1]
+            endpoint = min(candidates, key=lambda e: (e.outstanding, e.requests))
+            if affinity:
+                self._remember(affinity, endpoint.url)
+            return endpoint.url
+
+    def _remember(self, affinity: str, url: str) -> None:
+        self._affinity[affinity] = url
+        self._affinity.move_to_end(affinity)
+        # Sessions that are abandoned never forget their key; drop the least recently used.
+        while len(self._affinity) > self.settings.max_affinities:
+            self._affinity.popitem(last=False)
+
+    def is_healthy(self, url: str) -> bool:
+        with self._lock:
+            endpoint = self._endpoints.get(url)
+            return endpoint is not None and endpoint.healthy
+
+    def pin(self, affinity: str, url: str) -> None:
+        with self._lock:
+            if url in self._endpoints:
+                self._remember(affinity, url)
+
+    def forget(self, affinity: str) -> None:
+        with self._lock:
+            self._affinity.pop(affinity, None)
+
+    def begin(self, url: str) -> None:
+        with self._lock:
+            endpoint = self._endpoints.get(url)
+            if endpoint is not None:
+                endpoint.outstanding += 1
+                endpoint.requests += 1
+
+    def end(self, url: str, ok: Optional[bool] = True) -> None:
+        """Finish work on ``url``; ``ok=None`` leaves the health state untouched."""
+        with self._lock:
+            endpoint = self._endpoints.get(url)
+            if endpoint is None:
+                return
+            endpoint.outstanding = max(0, endpoint.outstanding - 1)
+        if ok is True:
+            self.record_success(url)
+        elif ok is False:
+            self.record_failure(url)
+
+    @contextmanager
+    def track(self, url: str):
+        """Count a request against ``url``; see ``endpoint_outcome`` for which errors are failures."""
+        self.begin(url)
+        try:
+            yield url
+        except BaseException as e:
+            self.end(url, ok=endpoint_outcome(e))
+            raise
+        else:
+            self.end(url, ok=True)
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            endpoint = self._endpoints.get(url)
+            if endpoint is None:
+                return
+            endpoint.consecutive_failures = 0
+            if not endpoint.healthy:
+                endpoint.healthy = True
+                endpoint.ejected_at = None
+                logger.info(f"Re-admitted {self.backend} endpoint {url}")
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            endpoint = self._endpoints.get(url)
+            if endpoint is None:
+                return
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.healthy and endpoint.consecutive_failures >= self.settings.failure_threshold:
+                endpoint.healthy = False
+                endpoint.ejected_at = time.time()
+                logger.warning(f"Ejected {self.backend} endpoint {url} after {endpoint.consecutive_failures} failures")
+
+    def probe(self, url: str) -> bool:
+        client = self.registry.get_http_client(url)
+        if client is None:
+            return True
+        try:
+            response = client.get(
+                url + HEALTH_PATHS.get(self.backend, ""),
+                timeout=self.settings.health_check_timeout,
+            )
+            # Auth errors still prove the server is up and routing requests.
+            return response.status_code < 500
+        except Exception:
+            return False
+
+    def check_health(self) -> None:
+        now = time.time()
+        for endpoint in list(self._endpoints.values()):
+            if not endpoint.healthy and now - (endpoint.ejected_at or now) < self.settings.readmit_after:
+                continue
+            if self.probe(endpoint.url):
+                self.record_success(endpoint.url)
+            else:
+                self.record_failure(endpoint.url)
+
+    def _ensure_health_thread(self) -> None:
+        if len(self._endpoints) < 2 or self.settings.health_check_interval <= 0:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._health_loop, name=f"{self.backend}-endpoint-health", daemon=True
+            )
+            self._thread.start()
+
+    def _health_loop(self) -> None:
+        while not self._stop.wait(self.settings.health_check_interval):
+            self.check_health()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [e.as_dict() for e in self._endpoints.values()]
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+_pools: Dict[Tuple[str, Tuple[str, ...]], EndpointPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_endpoint_pool(backend: str, urls: List[str]) -> EndpointPool:
+    """Return the process-wide pool for this backend and endpoint list."""
+    key = (backend, tuple(urls))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = EndpointPool(backend, urls)
+            _pools[key] = pool
+        return pool
+
+
+def endpoint_stats() -> Dict[str, List[Dict[str, Any]]]:
+    with _pools_lock:
+        return {f"{backend}:{','.join(urls)}": pool.stats() for (backend, urls), pool in _pools.items()}
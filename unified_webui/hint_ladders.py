@@ -0,0 +1,195 @@
+"""Precomputed Turtle Soup hint ladders for unified MysterySeek platform."""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from unified_webui.config import HINT_LADDER_DIR
+from unified_webui.question_cache import puzzle_fingerprint
+from unified_webui.thinking import split_thinking
+
+logger = logging.getLogger(__name__)
+
+SOLUTION_FIELDS = ("answer", "solution", "truth")
+
+GENERATE_PROMPTS = {
+    "en": (
+        "You are the host of a lateral thinking puzzle.\n"
+        "Puzzle: {statement}\n"
+        "Hidden truth: {solution}\n\n"
+        "Write exactly {count} hints, numbered 1 to {count}. Hint 1 is the vaguest, "
+        "each next hint reveals a little more, and no hint states the truth outright. "
+        "One sentence per hint, no other text."
+    ),
+    "zh": (
+        "你是一道海龟汤谜题的主持人。\n"
+        "谜面：{statement}\n"
+        "汤底：{solution}\n\n"
+        "请写出恰好 {count} 条提示，编号 1 到 {count}。第 1 条最模糊，之后每条多透露一点，"
+        "但任何一条都不能直接说出汤底。每条一句话，不要输出其他内容。"
+    ),
+}
+
+ADAPT_PROMPTS = {
+    "en": "Translate these puzzle hints into English. Keep the numbering and reveal nothing more:\n{hints}",
+    "zh": "请把这些谜题提示翻译成中文，保留编号，不要透露更多信息：\n{hints}",
+}
+
+_NUMBERED = re.compile(r"^\s*(?:\d+|[一二三四五六七八九十]+)\s*[.)、:：]\s*(.+?)\s*$")
+
+
+def _solution(puzzle: Any) -> str:
+    for name in SOLUTION_FIELDS:
+        value = getattr(puzzle, name, None)
+        if value:
+            return str(value)
+    return ""
+
+
+def parse_hints(text: str, count: int) -> List[str]:
+    _, answer = split_thinking(text)
+    hints = [m.group(1) for m in map(_NUMBERED.match, answer.splitlines()) if m]
+    if not hints:
+        hints = [line.strip() for line in answer.splitlines() if line.strip()]
+    return hints[:count]
+
+
+def _invoke(llm_client, prompt: str) -> str:
+    result = llm_client.invoke(prompt)
+    return str(getattr(result, "content", result))
+
+
+class HintLadderStore:
+    """Ordered hints per puzzle and language, as JSON files under ``directory``.
+
+    Each ladder records the puzzle fingerprint it was built from; a ladder
+    for an edited puzzle is treated as missing. Parsed files are cached by
+    mtime, so a ladder written by another process or the build CLI is picked
+    up on the next read, and a missing one is looked for again each time.
+    """
+
+    def __init__(self, directory: Path = HINT_LADDER_DIR):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+    def _path(self, puzzle_id: str, language: str) -> Path:
+        return self.directory / f"{puzzle_id}.{language}.json"
+
+    def _read(self, puzzle_id: str, language: str) -> Optional[Dict[str, Any]]:
+        key = f"{puzzle_id}.{language}"
+        path = self._path(puzzle_id, language)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            with self._lock:
+                self._cache.pop(key, None)
+            return None
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = None
+        with self._lock:
+            self._cache[key] = (mtime, data)
+        return data
+
+    def get(self, puzzle: Any, language: str) -> Optional[List[str]]:
+        data = self._read(puzzle.id, language)
+        if data is None or data.get("fingerprint") != puzzle_fingerprint(puzzle):
+            return None
+        return data["hints"]
+
+    def put(self, puzzle: Any, language: str, hints: Sequence[str], source: str) -> None:
+        data = {"fingerprint": puzzle_fingerprint(puzzle), "source": source, "hints": list(hints)}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(puzzle.id, language)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+        with self._lock:
+            self._cache[f"{puzzle.id}.{language}"] = (path.stat().st_mtime, data)
+
+    def build(self, puzzle: Any, language: str, llm_client=None) -> Optional[List[str]]:
+        """Authored hints when the puzzle has them, else generated by ``llm_client``."""
+        count = puzzle.constraints.max_hints
+        authored = [str(getattr(h, "content", h)) for h in (getattr(puzzle, "hints", None) or [])]
+        if authored and language == (puzzle.language or language):
+            hints, source = authored[:count], "authored"
+        elif llm_client is not None and _solution(puzzle):
+            prompt = GENERATE_PROMPTS.get(language, GENERATE_PROMPTS["en"]).format(
+                statement=puzzle.puzzle_statement, solution=_solution(puzzle), count=count
+            )
+            hints, source = parse_hints(_invoke(llm_client, prompt), count), "generated"
+        else:
+            return None
+        if hints:
+            self.put(puzzle, language, hints, source)
+        return hints or None
+
+    def adapt(self, puzzle: Any, language: str, llm_client) -> Optional[List[str]]:
+        """Translate a ladder built for another language; one LLM call, then stored."""
+        for other in ("en", "zh"):
+            if other == language:
+                continue
+            source = self.get(puzzle, other)
+            if not source:
+                continue
+            numbered = "\n".join(f"{i}. {hint}" for i, hint in enumerate(source, 1))
+            prompt = ADAPT_PROMPTS.get(language, ADAPT_PROMPTS["en"]).format(hints=numbered)
+            hints = parse_hints(_invoke(llm_client, prompt), len(source))
+            if len(hints) == len(source):
+                self.put(puzzle, language, hints, f"adapted:{other}")
+                return hints
+        return None
+
+
+hint_ladders = HintLadderStore()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompute Turtle Soup hint ladders")
+    parser.add_argument("--languages", nargs="+", default=["en", "zh"], help="Ladder languages")
+    parser.add_argument("--puzzle", action="append", help="Only these puzzle ids")
+    parser.add_argument("--force", action="store_true", help="Rebuild ladders that are up to date")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    sys.path.insert(0, str(Path(__file__).parent.parent / "Echoes-of-Deceit-v2" / "src"))
+    from game.engine import GameEngine
+
+    engine = GameEngine()
+    llm_client = engine.model_registry.get_llm_client()
+    built = skipped = failed = 0
+    for puzzle in engine.list_puzzles():
+        if args.puzzle and puzzle.id not in args.puzzle:
+            continue
+        for language in args.languages:
+            if not args.force and hint_ladders.get(puzzle, language):
+                skipped += 1
+                continue
+            try:
+                if hint_ladders.build(puzzle, language, llm_client):
+                    built += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                logger.warning(f"Hint ladder for {puzzle.id} ({language}) failed: {e}")
+                failed += 1
+    print(json.dumps({"built": built, "skipped": skipped, "failed": failed}))
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Per-puzzle knowledge-base residency for unified MysterySeek platform."""
+
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from unified_webui.config import KB_RESIDENCY_SETTINGS, KBResidencySettings
+from unified_webui.metrics import metrics
+from unified_webui.vector_index import kb_vector_index
+
+logger = logging.getLogger(__name__)
+
+# Only the puzzle-scoped KB manager API; generic load/unload/evict names may mean something else.
+KB_LOAD_METHODS = ("load_puzzle_kb",)
+KB_UNLOAD_METHODS = ("unload_puzzle_kb",)
+KB_SIZE_METHODS = ("memory_usage",)
+
+MB = 1024 * 1024
+
+
+def _method(obj: Any, names: Tuple[str, ...]):
+    for name in names:
+        method = getattr(obj, name, None)
+        if callable(method):
+            return method
+    return None
+
+
+def _weak(obj: Any) -> Callable[[], Any]:
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return lambda: obj
+
+
+@dataclass
+class ResidentKB:
+    # Weak, so a discarded engine's KB manager is not kept alive by its residency entries.
+    manager_ref: Callable[[], Any]
+    puzzle_id: str
+    size_bytes: int
+    load_ms: float
+    loaded_at: float = field(default_factory=time.time)
+    holders: Set[str] = field(default_factory=set)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "puzzle_id": self.puzzle_id,
+            "size_mb": round(self.size_bytes / MB, 1),
+            "load_ms": round(self.load_ms, 1),
+            "pinned": len(self.holders),
+            "age_s": round(time.time() - self.loaded_at, 1),
+        }
+
+
+class KBResidencyManager:
+    """Keeps puzzle KBs loaded in an LRU bounded by a memory budget.
+
+    A KB is loaded through ``engine.kb_manager`` when a session starts and
+    pinned for as long as a session runner holds it. Unpinned KBs are
+    unloaded least recently used first once the resident total exceeds
+    ``memory_budget_mb``. Pinned KBs are never evicted, so the budget can be
+    overshot while many puzzles are in play at once.
+    """
+
+    def __init__(self, settings: Optional[KBResidencySettings] = None):
+        self.settings = settings or KB_RESIDENCY_SETTINGS
+        self._lock = threading.Lock()
+        self._resident: "OrderedDict[Tuple[int, str], ResidentKB]" = OrderedDict()
+        self._loads = 0
+        self._evictions = 0
+        self._total_load_ms = 0.0
+
+    def _size(self, kb_manager: Any, puzzle_id: str) -> int:
+        sizer = _method(kb_manager, KB_SIZE_METHODS)
+        if sizer is not None:
+            try:
+                return int(sizer(puzzle_id))
+            except Exception as e:
+                logger.debug(f"KB size for {puzzle_id} unavailable: {e}")
+        index = kb_vector_index.get()
+        span = index.puzzles.get(puzzle_id) if index is not None else None
+        if span:
+            rows = index.rows[span[0]:span[1]]
+            return (span[1] - span[0]) * index.dim * 4 + sum(len(r["text"].encode("utf-8")) for r in rows)
+        return int(self.settings.default_puzzle_mb * MB)
+
+    def _drop_dead(self) -> None:
+        """Forget entries whose KB manager has been garbage collected."""
+        for key in [k for k, e in self._resident.items() if e.manager_ref() is None]:
+            del self._resident[key]
+
+    def _entry(self, kb_manager: Any, puzzle_id: str) -> Optional[ResidentKB]:
+        entry = self._resident.get((id(kb_manager), puzzle_id))
+        # An id can be reused once its manager is gone; such an entry belongs to the old one.
+        return entry if entry is not None and entry.manager_ref() is kb_manager else None
+
+    def acquire(self, kb_manager: Any, puzzle_id: str, holder: str) -> None:
+        """Make ``puzzle_id``'s KB resident and pin it for ``holder``."""
+        key = (id(kb_manager), puzzle_id)
+        with self._lock:
+            self._drop_dead()
+            entry = self._entry(kb_manager, puzzle_id)
+            if entry is not None:
+                entry.holders.add(holder)
+                self._resident.move_to_end(key)
+                return
+
+        started = time.perf_counter()
+        loader = _method(kb_manager, KB_LOAD_METHODS)
+        if loader is not None:
+            try:
+                loader(puzzle_id)
+            except Exception as e:
+                logger.warning(f"Could not preload KB for puzzle {puzzle_id}: {e}")
+        load_ms = (time.perf_counter() - started) * 1000
+        entry = ResidentKB(
+            _weak(kb_manager), puzzle_id, self._size(kb_manager, puzzle_id), load_ms, holders={holder}
+        )
+        logger.info(f"Loaded KB for puzzle {puzzle_id} in {load_ms:.0f} ms ({entry.size_bytes / MB:.1f} MB)")
+
+        with self._lock:
+            existing = self._entry(kb_manager, puzzle_id)
+            if existing is not None:
+                existing.holders.add(holder)
+                self._resident.move_to_end(key)
+                return
+            self._resident[key] = entry
+            self._loads += 1
+            self._total_load_ms += load_ms
+            victims = self._evict_over_budget()
+        self._unload(victims)
+
+    def release(self, kb_manager: Any, puzzle_id: str, holder: str) -> None:
+        with self._lock:
+            entry = self._entry(kb_manager, puzzle_id)
+            if entry is None:
+                return
+            entry.holders.discard(holder)
+            victims = self._evict_over_budget()
+        self._unload(victims)
+
+    def _evict_over_budget(self) -> List[ResidentKB]:
+        budget = self.settings.memory_budget_mb * MB
+        total = sum(e.size_bytes for e in self._resident.values())
+        victims = []
+        for key in list(self._resident):
+            if total <= budget:
+                break
+            entry = self._resident[key]
+            if entry.holders:
+                continue
+            del self._resident[key]
+            total -= entry.size_bytes
+            self._evictions += 1
+            victims.append(entry)
+        return victims
+
+    def _unload(self, victims: List[ResidentKB]) -> None:
+        for entry in victims:
+            unloader = _method(entry.manager_ref(), KB_UNLOAD_METHODS)
+            try:
+                if unloader is not None:
+                    unloader(entry.puzzle_id)
+                logger.info(f"Evicted KB for puzzle {entry.puzzle_id} ({entry.size_bytes / MB:.1f} MB)")
+            except Exception as e:
+                logger.warning(f"Could not unload KB for puzzle {entry.puzzle_id}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._drop_dead()
+            entries = list(self._resident.values())
+            return {
+                "resident": len(entries),
+                "pinned": sum(1 for e in entries if e.holders),
+                "resident_mb": round(sum(e.size_bytes for e in entries) / MB, 1),
+                "budget_mb": self.settings.memory_budget_mb,
+                "loads": self._loads,
+                "evictions": self._evictions,
+                "avg_load_ms": round(self._total_load_ms / self._loads, 1) if self._loads else 0.0,
+                "puzzles": [e.as_dict() for e in reversed(entries)],
+            }
+
+
+kb_residency = KBResidencyManager()
+metrics.register_stats(
+    "kb_residency", kb_residency.stats, counters=("loads", "evictions"), gauges=("resident", "pinned", "resident_mb")
+)
@@ -0,0 +1,295 @@
+"""In-process metrics with Prometheus text exposition for unified MysterySeek platform."""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from unified_webui.config import METRICS_SETTINGS, MetricsSettings
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "mysteryseek_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# (labels, value); histogram samples put their _bucket/_sum/_count suffix under "__name__".
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> List[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [(self._labels(key), value) for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (last is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[key] = series
+            series[0][position] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels: Any):
+        """Observe the seconds spent in the ``with`` block, even when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            series = [(key, list(counts), total, count) for key, (counts, total, count) in self._series.items()]
+        samples: List[Sample] = []
+        for key, counts, total, count in series:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                samples.append(({"__name__": "_bucket", **labels, "le": _format_value(bound)}, cumulative))
+            samples.append(({"__name__": "_sum", **labels}, total))
+            samples.append(({"__name__": "_count", **labels}, count))
+        return samples
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms recorded in-process, rendered on demand.
+
+    Recording is a lock, a dict lookup and an add, so the hot path stays
+    cheap. State that other components already keep (cache stats, queue
+    depths) is read only when the metrics are rendered, through collectors.
+    The text can be served on a local port and/or written to a file.
+    """
+
+    def __init__(self, settings: Optional[MetricsSettings] = None):
+        self.settings = settings or METRICS_SETTINGS
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Family]]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._writer: Optional[threading.Thread] = None
+        self._started = False
+        self._stop = threading.Event()
+
+    def _get_or_create(self, cls, name: str, help: str, labelnames: Sequence[str], **kwargs) -> Any:
+        name = PREFIX + name
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, help, labelnames, **kwargs)
+                self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def register_collector(self, name: str, collect: Callable[[], Iterable[Family]]) -> None:
+        """``collect`` returns (name, type, help, samples) families when the metrics are rendered.
+
+        Family names get the same ``mysteryseek_`` prefix as registered metrics.
+        """
+        with self._lock:
+            self._collectors[name] = collect
+
+    def register_stats(
+        self,
+        name: str,
+        stats: Callable[[], Dict[str, Any]],
+        counters: Sequence[str] = (),
+        gauges: Sequence[str] = (),
+    ) -> None:
+        """Expose numeric keys of a component's ``stats()`` dict as ``<name>_<key>`` metrics."""
+
+        def collect() -> List[Family]:
+            values = stats()
+            families = [
+                (f"{name}_{key}_total", "counter", f"{name} {key}", [({}, values[key])])
+                for key in counters if key in values
+            ]
+            families += [
+                (f"{name}_{key}", "gauge", f"{name} {key}", [({}, values[key])])
+                for key in gauges if key in values
+            ]
+            return families
+
+        self.register_collector(name, collect)
+
+    def _families(self) -> List[Family]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+        families: List[Family] = [(m.name, m.kind, m.help, m.samples()) for m in metrics]
+        for name, collect in collectors:
+            try:
+                families.extend((PREFIX + family[0],) + tuple(family[1:]) for family in collect())
+            except Exception as e:
+                logger.warning(f"Metrics collector {name} failed: {e}")
+        return families
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, kind, help, samples in self._families():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                labels = dict(labels)
+                suffix = labels.pop("__name__", "")
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> None:
+        """Start the configured exporters once per process; later calls do nothing."""
+        with self._lock:
+            if self._started or not self.settings.enabled:
+                return
+            self._started = True
+        if self.settings.port is not None:
+            self._start_server(self.settings.host, self.settings.port)
+        if self.settings.file_path is not None:
+            self._writer = threading.Thread(target=self._write_loop, name="metrics-writer", daemon=True)
+            self._writer.start()
+
+    def _start_server(self, host: str, port: int) -> None:
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            # Usually another app process on this host already serves the port.
+            logger.warning(f"Metrics endpoint not started on {host}:{port}: {e}")
+            return
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info(f"Serving metrics at http://{host}:{self._server.server_port}/metrics")
+
+    def write_file(self, path: Optional[Path] = None) -> None:
+        path = Path(path or self.settings.file_path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _write_loop(self) -> None:
+        while not self._stop.wait(self.settings.file_interval):
+            try:
+                self.write_file()
+            except OSError as e:
+                logger.warning(f"Could not write metrics file: {e}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,489 @@
+"""Process-wide model client registry and HTTP pools for unified MysterySeek platform."""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Optional, Set
+from urllib.parse import urlsplit
+
+from unified_webui.config import CONNECTION_POOL_SETTINGS, ConnectionPoolSettings
+from unified_webui.metrics import metrics
+from unified_webui.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+    _httpx_available = True
+except ImportError:
+    httpx = None
+    _httpx_available = False
+    logger.warning("httpx not available, model HTTP connections will not be pooled")
+
+DEFAULT_OLLAMA_URL = "http://localhost:11434"
+DEFAULT_API_BASE = "https://api.openai.com/v1"
+
+
+@dataclass(frozen=True)
+class ClientKey:
+    backend: str
+    base_url: str
+    model_name: str
+    api_key_digest: str = ""
+    variant: str = ""
+
+    @classmethod
+    def build(
+        cls,
+        backend: str,
+        base_url: Optional[str],
+        model_name: str,
+        api_key: Optional[str] = None,
+    ) -> "ClientKey":
+        if not base_url:
+            base_url = DEFAULT_OLLAMA_URL if backend == "ollama" else DEFAULT_API_BASE
+        digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12] if api_key else ""
+        return cls(backend, base_url.rstrip("/"), model_name, digest)
+
+    @property
+    def host(self) -> str:
+        return host_of(self.base_url)
+
+
+def host_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.netloc else url
+
+
+@dataclass
+class HostPoolStats:
+    host: str
+    max_connections: int
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    requests: int = 0
+    saturated_requests: int = 0
+
+    @property
+    def saturation(self) -> float:
+        return self.in_flight / self.max_connections if self.max_connections else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "host": self.host,
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "requests": self.requests,
+            "saturated_requests": self.saturated_requests,
+            "saturation": round(self.saturation, 3),
+        }
+
+
+class _HostPool:
+    """In-flight accounting for one host's connection pool."""
+
+    def __init__(self, host: str, max_connections: int):
+        self.stats = HostPoolStats(host=host, max_connections=max_connections)
+        self._lock = threading.Lock()
+        self._warned = False
+
+    def enter(self) -> None:
+        with self._lock:
+            s = self.stats
+            s.requests += 1
+            if s.in_flight >= s.max_connections:
+                s.saturated_requests += 1
+                if not self._warned:
+                    logger.warning(
+                        f"Connection pool for {s.host} saturated "
+                        f"({s.in_flight}/{s.max_connections} in flight)"
+                    )
+                    self._warned = True
+            s.in_flight += 1
+            s.peak_in_flight = max(s.peak_in_flight, s.in_flight)
+
+    def exit(self) -> None:
+        with self._lock:
+            self.stats.in_flight = max(0, self.stats.in_flight - 1)
+
+
+if _httpx_available:
+
+    class _CountingTransport(httpx.BaseTransport):
+        def __init__(self, inner: "httpx.BaseTransport", pool: _HostPool):
+            self._inner = inner
+            self._pool = pool
+
+        def handle_request(self, request):
+            self._pool.enter()
+            try:
+                with tracer.child_span("model.request", host=self._pool.stats.host, path=request.url.path) as span:
+                    response = self._inner.handle_request(request)
+                    if span is not None:
+                        span.set(status_code=response.status_code)
+                    return response
+            finally:
+                self._pool.exit()
+
+        def close(self) -> None:
+            self._inner.close()
+
+    class _AsyncCountingTransport(httpx.AsyncBaseTransport):
+        def __init__(self, inner: "httpx.AsyncBaseTransport", pool: _HostPool):
+            self._inner = inner
+            self._pool = pool
+
+        async def handle_async_request(self, request):
+            self._pool.enter()
+            try:
+                with tracer.child_span("model.request", host=self._pool.stats.host, path=request.url.path) as span:
+                    response = await self._inner.handle_async_request(request)
+                    if span is not None:
+                        span.set(status_code=response.status_code)
+                    return response
+            finally:
+                self._pool.exit()
+
+        async def aclose(self) -> None:
+            await self._inner.aclose()
+
+
+@dataclass
+class _ClientEntry:
+    client: Any
+    created_at: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+class ModelClientRegistry:
+    """Shares model clients and keep-alive HTTP pools across sessions."""
+
+    def __init__(self, settings: Optional[ConnectionPoolSettings] = None):
+        self.settings = settings or CONNECTION_POOL_SETTINGS
+        self._lock = threading.RLock()
+        self._clients: Dict[ClientKey, _ClientEntry] = {}
+        self._leases: Dict[ClientKey, int] = {}
+        self._pools: Dict[str, _HostPool] = {}
+        self._transports: Dict[str, Any] = {}
+        self._async_transports: Dict[str, Any] = {}
+        self._http_clients: Dict[str, Any] = {}
+        self._async_http_clients: Dict[str, Any] = {}
+        self._misses = 0
+
+    def _pool_for(self, host: str) -> _HostPool:
+        pool = self._pools.get(host)
+        if pool is None:
+            pool = _HostPool(host, self.settings.max_connections_per_host)
+            self._pools[host] = pool
+        return pool
+
+    def _limits(self):
+        return httpx.Limits(
+            max_connections=self.settings.max_connections_per_host,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry,
+        )
+
+    def _transport(self, base_url: str):
+        host = host_of(base_url)
+        with self._lock:
+            transport = self._transports.get(host)
+            if transport is None:
+                transport = _CountingTransport(
+                    httpx.HTTPTransport(limits=self._limits()), self._pool_for(host)
+                )
+                self._transports[host] = transport
+            return transport
+
+    def _async_transport(self, base_url: str):
+        host = host_of(base_url)
+        with self._lock:
+            transport = self._async_transports.get(host)
+            if transport is None:
+                transport = _AsyncCountingTransport(
+                    httpx.AsyncHTTPTransport(limits=self._limits()), self._pool_for(host)
+                )
+                self._async_transports[host] = transport
+            return transport
+
+    def get_http_client(self, base_url: str):
+        """Return the shared keep-alive ``httpx.Client`` for a host, or None without httpx."""
+        if not _httpx_available:
+            return None
+        host = host_of(base_url)
+        with self._lock:
+            client = self._http_clients.get(host)
+            if client is None:
+                client = httpx.Client(transport=self._transport(host), timeout=self.settings.request_timeout)
+                self._http_clients[host] = client
+            return client
+
+    def get_async_http_client(self, base_url: str):
+        """Return the shared ``httpx.AsyncClient`` for a host, or None without httpx."""
+        if not _httpx_available:
+            return None
+        host = host_of(base_url)
+        with self._lock:
+            client = self._async_http_clients.get(host)
+            if client is None:
+                client = httpx.AsyncClient(
+                    transport=self._async_transport(host), timeout=self.settings.request_timeout
+                )
+                self._async_http_clients[host] = client
+            return client
+
+    def pooled_client_updates(self, client, base_url: str) -> Dict[str, Any]:
+        """Chat model fields that route ``client``'s requests through this host's pool.
+
+        OpenAI-style models take ready ``httpx`` clients; Ollama models take
+        keyword arguments for the clients they build, so they get the shared
+        transports. Fields the client class does not declare are left out.
+        """
+        if not _httpx_available:
+            return {}
+        fields = getattr(type(client), "model_fields", None) or {}
+        updates: Dict[str, Any] = {}
+        if "http_client" in fields:
+            updates["http_client"] = self.get_http_client(base_url)
+        if "http_async_client" in fields:
+            updates["http_async_client"] = self.get_async_http_client(base_url)
+        if "sync_client_kwargs" in fields:
+            updates["sync_client_kwargs"] = {"transport": self._transport(base_url)}
+        if "async_client_kwargs" in fields:
+            updates["async_client_kwargs"] = {"transport": self._async_transport(base_url)}
+        return updates
+
+    def peek(self, key: ClientKey) -> Any:
+        """Return the cached client for ``key`` (counting a hit), or None."""
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                return None
+            entry.hits += 1
+            return entry.client
+
+    def get_or_create(self, key: ClientKey, factory: Callable[[], Any]) -> Any:
+        """Return the cached client for ``key``, building it with ``factory`` on first use.
+
+        ``factory`` runs outside the registry lock, so a slow build does not
+        hold up other keys. When two sessions build the same key at once, the
+        first client stored wins and the other is dropped.
+        """
+        client = self.peek(key)
+        if client is not None:
+            return client
+        client = factory()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry.hits += 1
+                return entry.client
+            self._misses += 1
+            self._clients[key] = _ClientEntry(client=client)
+            self._pool_for(key.host)
+        logger.info(f"Created shared {key.backend} client for {key.model_name} at {key.base_url}")
+        return client
+
+    def acquire(self, key: ClientKey) -> int:
+        """Record that a session is using ``key``; returns the new lease count."""
+        with self._lock:
+            self._leases[key] = self._leases.get(key, 0) + 1
+            self._pool_for(key.host)
+            return self._leases[key]
+
+    def release(self, key: ClientKey) -> int:
+        """Drop one session lease on ``key``; returns the remaining lease count."""
+        with self._lock:
+            remaining = max(0, self._leases.get(key, 0) - 1)
+            if remaining:
+                self._leases[key] = remaining
+            else:
+                self._leases.pop(key, None)
+            return remaining
+
+    def active_keys(self) -> Dict[ClientKey, int]:
+        with self._lock:
+            return dict(self._leases)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = sum(e.hits for e in self._clients.values())
+            return {
+                "clients": len(self._clients),
+                "client_hits": hits,
+                "client_misses": self._misses,
+                "leases": {
+                    f"{k.backend}:{k.model_name}@{k.base_url}": n for k, n in self._leases.items()
+                },
+                "pools": [p.stats.as_dict() for p in self._pools.values()],
+            }
+
+    def close(self, run_coroutine: Optional[Callable[[Any], Any]] = None) -> None:
+        """Close the shared HTTP clients and transports, sync and async.
+
+        The async ones are closed through ``run_coroutine``, ``asyncio.run``
+        by default. Pass the runner of the loop they were used on, if any.
+        """
+        with self._lock:
+            closables = [*self._http_clients.values(), *self._transports.values()]
+            async_closables = [*self._async_http_clients.values(), *self._async_transports.values()]
+            self._http_clients.clear()
+            self._async_http_clients.clear()
+            self._transports.clear()
+            self._async_transports.clear()
+            self._clients.clear()
+        for closable in closables:
+            try:
+                closable.close()
+            except Exception as e:
+                logger.warning(f"Could not close {type(closable).__name__}: {e}")
+        if not async_closables:
+            return
+
+        async def aclose_all():
+            for closable in async_closables:
+                try:
+                    await closable.aclose()
+                except Exception as e:
+                    logger.warning(f"Could not close {type(closable).__name__}: {e}")
+
+        try:
+            (run_coroutine or asyncio.run)(aclose_all())
+        except Exception as e:
+            logger.warning(f"Could not close the async HTTP clients: {e}")
+
+
+def _read(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def turtle_client_key(engine) -> Optional[ClientKey]:
+    """Build the registry key for a Turtle Soup engine's LLM client.
+
+    Follows the ``config/models.yaml`` layout: ``provider`` plus a section of
+    the same name holding ``base_url``, ``llm_model_name`` and ``api_key``.
+    Returns None when the engine does not expose its model config.
+    """
+    registry = getattr(engine, "model_registry", None)
+    config = _read(registry, "config")
+    provider = _read(config, "provider")
+    if not provider:
+        return None
+    provider = getattr(provider, "value", provider)
+    section = _read(config, provider)
+    model_name = _read(section, "llm_model_name")
+    if not model_name:
+        return None
+    return ClientKey.build(
+        backend="ollama" if provider == "ollama" else "api",
+        base_url=_read(section, "base_url"),
+        model_name=model_name,
+        api_key=_read(section, "api_key"),
+    )
+
+
+_BASE_URL_FIELDS = ("base_url", "openai_api_base", "api_base")
+
+
+def rebuild_llm_client(client, updates: Dict[str, Any]):
+    """Rebuild a pydantic-style chat model with some fields replaced.
+
+    Only fields the client class declares are applied; dict fields such as
+    ``extra_body`` are merged. Clients without any matching field are
+    returned unchanged.
+    """
+    fields = getattr(type(client), "model_fields", None) or {}
+    applicable = {name: value for name, value in updates.items() if name in fields}
+    if not applicable:
+        logger.warning(f"{type(client).__name__} has none of {', '.join(updates)}; keeping it unchanged")
+        return client
+    try:
+        data = client.model_dump()
+        for name, value in applicable.items():
+            if isinstance(value, dict) and isinstance(data.get(name), dict):
+                value = {**data[name], **value}
+            data[name] = value
+        return type(client)(**data)
+    except Exception as e:
+        logger.warning(f"Could not rebuild {type(client).__name__} with {', '.join(applicable)}: {e}")
+        return client
+
+
+def _client_base_url(client) -> Optional[str]:
+    return next((getattr(client, f, None) for f in _BASE_URL_FIELDS if getattr(client, f, None)), None)
+
+
+def rebase_llm_client(client, base_url: str):
+    """Rebuild a chat model against another endpoint."""
+    fields = getattr(type(client), "model_fields", None) or {}
+    name = next((f for f in _BASE_URL_FIELDS if f in fields), _BASE_URL_FIELDS[0])
+    return rebuild_llm_client(client, {name: base_url})
+
+
+# Endpoint overrides a chat model could not take; requests for them reuse the configured client.
+_fixed_endpoint_keys: Set[ClientKey] = set()
+
+
+def get_turtle_llm_client(
+    engine,
+    base_url: Optional[str] = None,
+    client_updates: Optional[Dict[str, Any]] = None,
+    variant: str = "",
+):
+    """Return the shared LLM client for ``engine``'s model config.
+
+    With ``base_url`` the client is rebuilt against that endpoint instead of the
+    configured one; ``client_updates`` (keyed by ``variant``) replaces further
+    chat model fields. Its HTTP traffic goes through the shared pool for the
+    endpoint's host when the chat model accepts an HTTP client.
+    """
+    key = turtle_client_key(engine)
+    rebase = bool(base_url) and (key is None or base_url.rstrip("/") != key.base_url)
+
+    def build(rebased: bool):
+        client = engine.model_registry.get_llm_client()
+        if rebased:
+            rebased_client = rebase_llm_client(client, base_url)
+            rebased = rebased_client is not client
+            client = rebased_client
+        if client_updates:
+            client = rebuild_llm_client(client, client_updates)
+        pool_url = base_url if rebased else (key.base_url if key is not None else _client_base_url(client))
+        pooled = client_registry.pooled_client_updates(client, pool_url) if pool_url else {}
+        if pooled:
+            client = rebuild_llm_client(client, pooled)
+        return client, rebased
+
+    if key is None:
+        return build(rebase)[0]
+    if client_updates:
+        key = replace(key, variant=variant)
+    if not rebase:
+        return client_registry.get_or_create(key, lambda: build(False)[0])
+
+    rebased_key = replace(key, base_url=base_url.rstrip("/"))
+    if rebased_key in _fixed_endpoint_keys:
+        return client_registry.get_or_create(key, lambda: build(False)[0])
+    client = client_registry.peek(rebased_key)
+    if client is not None:
+        return client
+    client, rebased = build(True)
+    if rebased:
+        return client_registry.get_or_create(rebased_key, lambda: client)
+    # The chat model has no endpoint field, so it stays shared under its configured endpoint.
+    _fixed_endpoint_keys.add(rebased_key)
+    return client_registry.get_or_create(key, lambda: client)
+
+
+client_registry = ModelClientRegistry()
+metrics.register_stats(
+    "model_clients", client_registry.stats, counters=("client_hits", "client_misses"), gauges=("clients",)
+)
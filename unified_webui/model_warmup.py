@@ -0,0 +1,225 @@
+"""Ollama model prewarm and keep-alive management for unified MysterySeek platform."""
+
+import logging
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+
+from unified_webui.config import OLLAMA_KEEP_ALIVE_SETTINGS, OllamaKeepAliveSettings
+from unified_webui.model_clients import ClientKey, ModelClientRegistry, client_registry
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def keep_alive_seconds(keep_alive: Union[str, int, float]) -> Optional[float]:
+    """Seconds in an Ollama ``keep_alive`` value ("10m", "1h30m", 300); None means forever."""
+    if isinstance(keep_alive, (int, float)):
+        return None if keep_alive < 0 else float(keep_alive)
+    text = str(keep_alive).strip()
+    if text.lstrip("-").replace(".", "", 1).isdigit():
+        return keep_alive_seconds(float(text))
+    if text.startswith("-"):
+        return None
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    return sum(float(value) * _DURATION_UNITS[unit] for value, unit in parts)
+
+
+@dataclass
+class ModelLoadStats:
+    prewarms: int = 0
+    refreshes: int = 0
+    unloads: int = 0
+    failures: int = 0
+    loads: int = 0
+    last_load_ms: float = 0.0
+    total_load_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "prewarms": self.prewarms,
+            "refreshes": self.refreshes,
+            "unloads": self.unloads,
+            "failures": self.failures,
+            "loads": self.loads,
+            "last_load_ms": round(self.last_load_ms, 1),
+            "avg_load_ms": round(self.total_load_ms / self.loads, 1) if self.loads else 0.0,
+        }
+
+
+class ModelKeeper:
+    """Holds Ollama models resident while any session leases them.
+
+    ``acquire`` fires a prewarm request in the background so model loading
+    overlaps with game setup, a refresh thread re-sends ``keep_alive`` for every
+    leased model, and the last ``release`` asks Ollama to unload the model.
+    Load time reported by Ollama is kept apart from game latency.
+
+    Each lease has a holder token and a last-use time that ``touch`` renews.
+    The refresh thread expires leases unused for longer than ``keep_alive``,
+    so a closed browser tab does not keep its models loaded forever; a
+    holder that comes back is leased again on its next ``touch``.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[OllamaKeepAliveSettings] = None,
+        registry: Optional[ModelClientRegistry] = None,
+    ):
+        self.settings = settings or OLLAMA_KEEP_ALIVE_SETTINGS
+        self.registry = registry or client_registry
+        self._lock = threading.Lock()
+        self._stats: Dict[ClientKey, ModelLoadStats] = {}
+        self._leases: Dict[Tuple[ClientKey, str], float] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _managed(self, key: ClientKey) -> bool:
+        return self.settings.enabled and key.backend == "ollama"
+
+    def _stats_locked(self, key: ClientKey) -> ModelLoadStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = ModelLoadStats()
+            self._stats[key] = stats
+        return stats
+
+    def _stats_for(self, key: ClientKey) -> ModelLoadStats:
+        with self._lock:
+            return self._stats_locked(key)
+
+    def _count(self, key: ClientKey, name: str) -> None:
+        with self._lock:
+            stats = self._stats_locked(key)
+            setattr(stats, name, getattr(stats, name) + 1)
+
+    def acquire(self, key: ClientKey, holder: Optional[str] = None) -> str:
+        """Lease ``key`` for ``holder`` (a new token when omitted) and return the holder."""
+        holder = holder or uuid.uuid4().hex
+        with self._lock:
+            if (key, holder) in self._leases:
+                self._leases[(key, holder)] = time.time()
+                return holder
+            self._leases[(key, holder)] = time.time()
+        self.registry.acquire(key)
+        if self._managed(key):
+            self._count(key, "prewarms")
+            self._send_in_background(key, self.settings.keep_alive)
+        self._ensure_refresh_thread()
+        return holder
+
+    def touch(self, key: ClientKey, holder: str) -> None:
+        """Mark the lease as in use, leasing again if it had expired."""
+        with self._lock:
+            if (key, holder) in self._leases:
+                self._leases[(key, holder)] = time.time()
+                return
+        logger.info(f"Lease on {key.model_name} for {holder} had expired; leasing it again")
+        self.acquire(key, holder)
+
+    def release(self, key: ClientKey, holder: str) -> None:
+        with self._lock:
+            if self._leases.pop((key, holder), None) is None:
+                return
+        self._release(key)
+
+    def _release(self, key: ClientKey) -> None:
+        remaining = self.registry.release(key)
+        if remaining == 0 and self._managed(key) and self.settings.unload_on_release:
+            self._count(key, "unloads")
+            self._send_in_background(key, 0)
+
+    def expire_idle(self, now: Optional[float] = None) -> int:
+        """Drop leases unused for longer than ``keep_alive``; returns how many expired."""
+        ttl = keep_alive_seconds(self.settings.keep_alive)
+        if ttl is None:
+            return 0
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [lease for lease, last_used in self._leases.items() if now - last_used > ttl]
+            for lease in expired:
+                del self._leases[lease]
+        for key, holder in expired:
+            logger.info(f"Expired idle lease on {key.model_name} for {holder}")
+            self._release(key)
+        return len(expired)
+
+    def _send_in_background(self, key: ClientKey, keep_alive) -> None:
+        threading.Thread(
+            target=self._send,
+            args=(key, keep_alive),
+            name=f"ollama-keepalive-{key.model_name}",
+            daemon=True,
+        ).start()
+
+    def _send(self, key: ClientKey, keep_alive) -> Optional[float]:
+        """Send an empty generate request; Ollama loads (or unloads) the model and returns."""
+        client = self.registry.get_http_client(key.base_url)
+        if client is None:
+            return None
+        stats = self._stats_for(key)
+        try:
+            response = client.post(
+                f"{key.base_url}/api/generate",
+                json={"model": key.model_name, "keep_alive": keep_alive},
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self._count(key, "failures")
+            logger.warning(f"Ollama keep-alive request for {key.model_name} failed: {e}")
+            return None
+        load_ms = data.get("load_duration", 0) / 1e6
+        if load_ms:
+            with self._lock:
+                stats.loads += 1
+                stats.last_load_ms = load_ms
+                stats.total_load_ms += load_ms
+            logger.info(f"Ollama loaded {key.model_name} in {load_ms:.0f} ms")
+        return load_ms
+
+    def _ensure_refresh_thread(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._refresh_loop, name="ollama-keepalive", daemon=True
+            )
+            self._thread.start()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.settings.refresh_interval):
+            self.expire_idle()
+            with self._lock:
+                if not self._leases:
+                    self._thread = None
+                    return
+                keys = [k for k in self.registry.active_keys() if self._managed(k)]
+            for key in keys:
+                self._count(key, "refreshes")
+                self._send(key, self.settings.keep_alive)
+        with self._lock:
+            self._thread = None
+
+    def load_stats(self, key: ClientKey) -> Dict[str, Any]:
+        return self._stats_for(key).as_dict()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                f"{k.model_name}@{k.base_url}": s.as_dict() for k, s in self._stats.items()
+            }
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+model_keeper = ModelKeeper()
@@ -2,13 +2,11 @@
 
 import streamlit as st
 from unified_webui.config import WEREWOLF_ICON, TURTLE_SOUP_ICON
-from unified_webui.components import render_css, render_feature_box
+from unified_webui.components import render_feature_box
 from unified_webui import session_state as state
 
 
 def render_home_page():
-    render_css()
-    
     i18n = state.get_i18n()
     
     # Hero Section
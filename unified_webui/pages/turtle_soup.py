@@ -1,42 +1,71 @@
 """Echoes of Deceit (Turtle Soup) game page for unified MysterySeek platform."""
 
+import html
 import logging
 import sys
+import time
 import asyncio
+from contextlib import contextmanager, nullcontext
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "Echoes-of-Deceit-v2" / "src"))
 
 from unified_webui.i18n import I18n
-from unified_webui.config import EMOJI_MAP, TURTLE_SOUP_ICON
+from unified_webui.config import EMOJI_MAP, PUZZLE_PAGE_SIZES, TURTLE_SOUP_ICON
 from unified_webui.components import (
-    render_css,
     render_error,
+    render_trace_waterfall,
     render_success,
     render_game_stats,
     render_chat_message,
+    render_chat_page_html,
     render_commands_panel,
     render_how_to_play,
     render_status_badge,
     render_empty_state,
+    render_thinking_controls,
 )
 from unified_webui import session_state as state
+from unified_webui.model_clients import get_turtle_llm_client, turtle_client_key
+from unified_webui.model_warmup import model_keeper
+from unified_webui.endpoint_pool import get_endpoint_pool, parse_endpoints
+from unified_webui.thinking import ThinkingPolicy
+from unified_webui.puzzle_catalog import puzzle_catalog
+from unified_webui.session_index import session_index
+from unified_webui.turtle_transcript import count_turns, load_page, DM_FIELDS, PLAYER_FIELDS, SESSION_TURN_FIELDS
+from unified_webui.question_cache import get_question_embedder, puzzle_fingerprint, question_cache
+from unified_webui.vector_index import kb_vector_index
+from unified_webui.kb_residency import kb_residency
+from unified_webui.metrics import metrics
+from unified_webui.hint_ladders import hint_ladders
+from unified_webui.tracing import KB_METHODS, traced, tracer
+from unified_webui.turtle_commands import dispatch_command
+from unified_webui.write_behind import SESSION_STORE_WRITES, write_behind
 
 logger = logging.getLogger(__name__)
 
+TURTLE_TURNS = metrics.counter("turtle_turns_total", "Turtle Soup turns answered", ("source",))
+TURTLE_TURN_SECONDS = metrics.histogram("turtle_turn_seconds", "Turtle Soup turns run by the game runner", ("source",))
+EVENT_LOOP_WAITING = metrics.gauge("event_loop_waiting", "Script threads waiting for the shared event loop")
+EVENT_LOOP_WAIT_SECONDS = metrics.histogram("event_loop_wait_seconds", "Wait for the shared event loop")
+EVENT_LOOP_RUN_SECONDS = metrics.histogram("event_loop_run_seconds", "Coroutine runs on the shared event loop")
+
 _turtle_soup_initialized = False
 _turtle_engine_ready_printed = False
 
 # Global event loop management for safe async execution
 _loop = None
 _loop_lock = None
+_run_lock = None
 
 try:
     import threading
     _loop_lock = threading.Lock()
+    _run_lock = threading.RLock()
 except ImportError:
     pass
 
@@ -83,9 +112,20 @@ def run_async(coro):
         # No running loop - this is the normal case
         pass
     
-    # Set the loop and run
-    asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    # Set the loop and run; concurrent sessions' script threads take turns on the shared loop
+    with tracer.span("run_async", coroutine=getattr(coro, "__qualname__", type(coro).__name__)) as span:
+        EVENT_LOOP_WAITING.inc()
+        waiting_since = time.perf_counter()
+        with _run_lock if _run_lock is not None else nullcontext():
+            EVENT_LOOP_WAITING.dec()
+            waited = time.perf_counter() - waiting_since
+            EVENT_LOOP_WAIT_SECONDS.observe(waited)
+            if span is not None:
+                span.set(wait_ms=round(waited * 1000, 1))
+            asyncio.set_event_loop(loop)
+            # The loop wraps ``coro`` in a task that copies this context, so its spans nest here.
+            with EVENT_LOOP_RUN_SECONDS.time():
+                return loop.run_until_complete(coro)
 
 
 def _init_turtle_soup_imports():
@@ -112,6 +152,7 @@ def _init_game_engine():
         try:
             from game.engine import GameEngine
             engine = GameEngine()
+            kb_vector_index.attach(engine)
             state.set_turtle_game_engine(engine)
             
             if not _turtle_engine_ready_printed:
@@ -127,8 +168,128 @@ def _init_game_engine():
     return True
 
 
-def _on_start_puzzle(puzzle_id: str):
+def _choose_turtle_endpoint(engine, affinity: Optional[str] = None) -> Optional[str]:
+    """Pick a model endpoint for this session when several are configured."""
+    current = st.session_state.get("turtle_endpoint")
+    if current is not None and current[0].is_healthy(current[1]):
+        return current[1]
+    endpoints = parse_endpoints(state.get_turtle_settings().model_endpoints)
+    if not endpoints:
+        return None
+    key = turtle_client_key(engine)
+    pool = get_endpoint_pool(key.backend if key else "ollama", endpoints)
+    url = pool.choose(affinity=affinity)
+    st.session_state.turtle_endpoint = (pool, url)
+    return url
+
+
+def _recheck_turtle_endpoint() -> None:
+    """Drop the runner and model lease bound to an endpoint that has since been ejected.
+
+    The next rerun builds them again against a healthy endpoint.
+    """
+    endpoint = st.session_state.get("turtle_endpoint")
+    if endpoint is None or endpoint[0].is_healthy(endpoint[1]):
+        return
+    pool, url = endpoint
+    logger.info(f"Turtle Soup endpoint {url} was ejected; moving the session to another endpoint")
+    key = st.session_state.get("turtle_client_key")
+    if key is not None:
+        model_keeper.release(key, st.session_state.get("turtle_model_lease"))
+        st.session_state.turtle_client_key = None
+        st.session_state.turtle_model_lease = None
+    pool.forget(state.get_turtle_session_id())
+    st.session_state.turtle_endpoint = None
+    _drop_turtle_runner()
+
+
+def _drop_turtle_runner() -> None:
+    """Drop the runner so the next rerun rebuilds it, storing its queued writes first.
+
+    The rebuilt runner reloads the session from the engine.
+    """
+    write_behind.flush()
+    state.set_turtle_session_runner(None)
+
+
+def _acquire_turtle_model(engine, affinity: Optional[str] = None) -> None:
+    """Lease (and prewarm) the engine's model for the current session."""
+    if st.session_state.get("turtle_client_key") is not None:
+        return
+    key = turtle_client_key(engine)
+    if key is None:
+        return
+    endpoint_url = _choose_turtle_endpoint(engine, affinity)
+    if endpoint_url:
+        key = replace(key, base_url=endpoint_url)
+    st.session_state.turtle_model_lease = model_keeper.acquire(key)
+    st.session_state.turtle_client_key = key
+
+
+def _touch_turtle_model() -> None:
+    """Renew this session's model lease; an abandoned tab's lease expires after keep_alive."""
+    key = st.session_state.get("turtle_client_key")
+    lease = st.session_state.get("turtle_model_lease")
+    if key is not None and lease is not None:
+        model_keeper.touch(key, lease)
+
+
+def _release_turtle_model() -> None:
+    key = st.session_state.get("turtle_client_key")
+    if key is not None:
+        model_keeper.release(key, st.session_state.get("turtle_model_lease"))
+        st.session_state.turtle_client_key = None
+        st.session_state.turtle_model_lease = None
+    endpoint = st.session_state.get("turtle_endpoint")
+    if endpoint is not None:
+        endpoint[0].forget(state.get_turtle_session_id())
+        st.session_state.turtle_endpoint = None
+
+
+def _acquire_turtle_kb(engine, puzzle_id: str, session_id: str) -> None:
+    """Load the puzzle's KB and pin it for this game session."""
+    if st.session_state.get("turtle_kb_lease") is not None:
+        return
+    kb_residency.acquire(engine.kb_manager, puzzle_id, session_id)
+    st.session_state.turtle_kb_lease = (engine.kb_manager, puzzle_id, session_id)
+
+
+def _release_turtle_kb() -> None:
+    lease = st.session_state.get("turtle_kb_lease")
+    if lease is not None:
+        kb_residency.release(*lease)
+        st.session_state.turtle_kb_lease = None
+
+
+def _get_turtle_thinking() -> ThinkingPolicy:
+    """The thinking policy for the current game, created from the sidebar settings."""
+    thinking = st.session_state.get("turtle_thinking")
+    if thinking is None:
+        turtle_settings = state.get_turtle_settings()
+        thinking = ThinkingPolicy(turtle_settings.thinking_mode, turtle_settings.thinking_budget)
+        st.session_state.turtle_thinking = thinking
+    return thinking
+
+
+@contextmanager
+def _track_turtle_endpoint():
+    endpoint = st.session_state.get("turtle_endpoint")
+    if endpoint is None:
+        yield
+        return
+    pool, url = endpoint
+    with pool.track(url):
+        yield
+
+
+def _reset_turtle_game() -> None:
+    _release_turtle_model()
+    _release_turtle_kb()
     state.reset_turtle_game_state()
+
+
+def _on_start_puzzle(puzzle_id: str):
+    _reset_turtle_game()
     state.set_turtle_puzzle_id(puzzle_id)
     st.session_state.turtle_home_action = "start_game"
 
@@ -165,7 +326,34 @@ def render_turtle_sidebar(i18n: I18n):
         turtle_settings.player_agent_mode = player_agent_mode
         state.set_turtle_settings(turtle_settings)
         # Reset runner so it will be recreated with the new player_agent_mode setting
-        state.set_turtle_session_runner(None)
+        _drop_turtle_runner()
+    
+    model_endpoints = st.text_input(
+        i18n("turtle_model_endpoints"),
+        value=turtle_settings.model_endpoints,
+        placeholder="http://localhost:11434",
+        key="turtle_sidebar_model_endpoints",
+        help=i18n("turtle_model_endpoints_help"),
+    )
+    if model_endpoints != turtle_settings.model_endpoints:
+        turtle_settings.model_endpoints = model_endpoints
+        state.set_turtle_settings(turtle_settings)
+        _release_turtle_model()
+        _drop_turtle_runner()
+    
+    thinking_mode, thinking_budget = render_thinking_controls(
+        i18n,
+        turtle_settings.thinking_mode,
+        turtle_settings.thinking_budget,
+        key_prefix="turtle",
+    )
+    if (thinking_mode, thinking_budget) != (turtle_settings.thinking_mode, turtle_settings.thinking_budget):
+        turtle_settings.thinking_mode = thinking_mode
+        turtle_settings.thinking_budget = thinking_budget
+        state.set_turtle_settings(turtle_settings)
+        # Rebuild the runner so the DM and player agent pick up the new client settings
+        st.session_state.turtle_thinking = None
+        _drop_turtle_runner()
     
     st.markdown("---")
     
@@ -175,6 +363,39 @@ def render_turtle_sidebar(i18n: I18n):
     
     if turtle_settings.player_agent_mode:
         st.info(f"🤖 {i18n('turtle_player_agent_mode')}")
+    
+    thinking = st.session_state.get("turtle_thinking")
+    if thinking is not None and thinking.mode != "keep" and thinking.stats.calls:
+        st.caption(f"🧠 {i18n('thinking_tokens_saved')}: {thinking.stats.tokens_saved}")
+    
+    client_key = st.session_state.get("turtle_client_key")
+    if client_key is not None and client_key.backend == "ollama":
+        load_stats = model_keeper.load_stats(client_key)
+        if load_stats["loads"]:
+            st.caption(f"⏱️ {i18n('model_load_time')}: {load_stats['last_load_ms']:.0f} ms")
+    
+    kb_stats = kb_residency.stats()
+    if kb_stats["resident"]:
+        st.caption(
+            f"📚 {i18n('turtle_kb_resident')}: {kb_stats['resident']} "
+            f"({kb_stats['resident_mb']:.0f}/{kb_stats['budget_mb']:.0f} MB)"
+        )
+    
+    puzzle_id = state.get_turtle_puzzle_id()
+    if session_id and puzzle_id and turtle_settings.question_cache:
+        cache_stats = question_cache.stats(puzzle_id)
+        if cache_stats["lookups"]:
+            st.caption(
+                f"⚡ {i18n('turtle_question_cache_hit_rate')}: {cache_stats['hit_rate']:.0%} "
+                f"({cache_stats['entries']} {i18n('turtle_question_cache_entries')})"
+            )
+        if cache_stats["entries"]:
+            st.button(
+                i18n("turtle_question_cache_clear"),
+                key="turtle_question_cache_clear",
+                on_click=question_cache.invalidate,
+                args=[puzzle_id],
+            )
 
 
 def render_puzzle_selection(i18n: I18n) -> Optional[str]:
@@ -186,45 +407,126 @@ def render_puzzle_selection(i18n: I18n) -> Optional[str]:
         return None
     
     try:
-        puzzles = engine.list_puzzles()
+        catalog = puzzle_catalog.snapshot(engine)
     except Exception as e:
         render_error(f"{i18n('error_generic')}: {str(e)}")
         return None
     
-    if not puzzles:
+    if not catalog.puzzles:
         render_empty_state(i18n("turtle_no_puzzles"), icon="puzzle")
         return None
     
-    for puzzle in puzzles:
-        with st.container():
-            col1, col2 = st.columns([4, 1])
-            
-            with col1:
-                st.markdown(f"**{puzzle.title if puzzle.title else puzzle.id}**")
-                if puzzle.description:
-                    st.caption(puzzle.description[:100] + "..." if len(puzzle.description) > 100 else puzzle.description)
-                
-                meta_cols = st.columns(3)
-                if puzzle.difficulty:
-                    meta_cols[0].caption(f"{i18n('turtle_puzzle_difficulty')}: {puzzle.difficulty}")
-                meta_cols[1].caption(f"{i18n('turtle_puzzle_language')}: {puzzle.language.upper()}")
-                if puzzle.tags:
-                    meta_cols[2].caption(f"{i18n('turtle_puzzle_tags')}: {', '.join(puzzle.tags[:3])}")
-            
-            with col2:
-                st.button(
-                    f"{EMOJI_MAP['game']} {i18n('turtle_start_game')}",
-                    key=f"turtle_start_puzzle_{puzzle.id}",
-                    use_container_width=True,
-                    on_click=_on_start_puzzle,
-                    args=[puzzle.id],
-                )
-            
-            st.markdown("<hr style='margin: 0.75rem 0; opacity: 0.2;'>", unsafe_allow_html=True)
+    any_label = i18n("turtle_filter_any")
+    filter_cols = st.columns([2, 1, 1])
+    with filter_cols[0]:
+        tags = st.multiselect(
+            i18n("turtle_puzzle_tags"),
+            options=catalog.tags,
+            key="turtle_filter_tags",
+        )
+    with filter_cols[1]:
+        difficulty = st.selectbox(
+            i18n("turtle_puzzle_difficulty"),
+            options=[""] + catalog.difficulties,
+            format_func=lambda x: x or any_label,
+            key="turtle_filter_difficulty",
+        )
+    with filter_cols[2]:
+        language = st.selectbox(
+            i18n("turtle_puzzle_language"),
+            options=[""] + catalog.languages,
+            format_func=lambda x: x.upper() if x else any_label,
+            key="turtle_filter_language",
+        )
+    
+    search_cols = st.columns([2, 1, 1])
+    with search_cols[0]:
+        search = st.text_input(
+            i18n("turtle_search_puzzles"),
+            key="turtle_puzzle_search",
+            help=i18n("turtle_search_puzzles_help"),
+        )
+    settings = state.get_turtle_settings()
+    with search_cols[1]:
+        page_size = st.selectbox(
+            i18n("turtle_page_size"),
+            options=PUZZLE_PAGE_SIZES,
+            index=PUZZLE_PAGE_SIZES.index(settings.puzzle_page_size)
+            if settings.puzzle_page_size in PUZZLE_PAGE_SIZES else 1,
+            key="turtle_puzzle_page_size",
+        )
+    if page_size != settings.puzzle_page_size:
+        state.set_turtle_settings(replace(settings, puzzle_page_size=page_size))
+    
+    query_key = (tuple(tags), difficulty, language, search.strip().lower(), page_size)
+    if st.session_state.get("turtle_puzzle_query") != query_key:
+        # A new filter or search jumps back to its first page of results.
+        st.session_state.turtle_puzzle_query = query_key
+        st.session_state.turtle_puzzle_page = 1
+    
+    puzzles = catalog.query(tags=tags, difficulty=difficulty, language=language, search=search)
+    if not puzzles:
+        render_empty_state(i18n("turtle_no_matching_puzzles"), icon="puzzle")
+        return None
+    
+    _, _, page_count = catalog.page(puzzles, 1, page_size)
+    if st.session_state.get("turtle_puzzle_page", 1) > page_count:
+        st.session_state.turtle_puzzle_page = page_count
+    with search_cols[2]:
+        page = st.number_input(
+            i18n("turtle_page"),
+            min_value=1,
+            max_value=page_count,
+            step=1,
+            key="turtle_puzzle_page",
+        )
+    
+    visible, page, page_count = catalog.page(puzzles, int(page), page_size)
+    st.caption(i18n("turtle_page_summary", page=page, pages=page_count, count=len(puzzles)))
+    
+    cards = catalog.page_html(
+        (query_key, page, i18n.language),
+        lambda: [_puzzle_card_html(puzzle, i18n) for puzzle in visible],
+    )
+    for puzzle, card in zip(visible, cards):
+        col1, col2 = st.columns([4, 1])
+        col1.markdown(card, unsafe_allow_html=True)
+        col2.button(
+            f"{EMOJI_MAP['game']} {i18n('turtle_start_game')}",
+            key=f"turtle_start_puzzle_{puzzle.id}",
+            use_container_width=True,
+            on_click=_on_start_puzzle,
+            args=[puzzle.id],
+        )
     
     return None
 
 
+def _puzzle_card_html(puzzle: Any, i18n: I18n) -> str:
+    description = puzzle.description or ""
+    if len(description) > 100:
+        description = description[:100] + "..."
+    meta: List[str] = []
+    if puzzle.difficulty:
+        meta.append(f"{i18n('turtle_puzzle_difficulty')}: {puzzle.difficulty}")
+    meta.append(f"{i18n('turtle_puzzle_language')}: {(puzzle.language or '').upper()}")
+    if puzzle.tags:
+        meta.append(f"{i18n('turtle_puzzle_tags')}: {', '.join(puzzle.tags[:3])}")
+    lines = [f"<strong>{html.escape(puzzle.title or puzzle.id)}</strong>"]
+    if description:
+        lines.append(f"<div style='opacity: 0.7; font-size: 0.875rem;'>{html.escape(description)}</div>")
+    lines.append(
+        "<div style='opacity: 0.6; font-size: 0.8rem;'>"
+        + " &middot; ".join(html.escape(m) for m in meta)
+        + "</div>"
+    )
+    return (
+        "<div style='padding-bottom: 0.75rem; border-bottom: 1px solid rgba(128, 128, 128, 0.2);'>"
+        + "".join(lines)
+        + "</div>"
+    )
+
+
 def render_active_sessions(i18n: I18n) -> Optional[str]:
     st.markdown(f"#### {EMOJI_MAP['game']} {i18n('turtle_active_sessions')}")
     
@@ -233,9 +535,7 @@ def render_active_sessions(i18n: I18n) -> Optional[str]:
         return None
     
     try:
-        from game.domain.entities import GameState as TurtleGameState
-        all_sessions = engine.list_sessions(player_id=state.get_turtle_player_id())
-        sessions = [s for s in all_sessions if s.state == TurtleGameState.IN_PROGRESS]
+        sessions = session_index.query(engine, state.get_turtle_player_id(), limit=5)
     except Exception as e:
         render_error(str(e))
         return None
@@ -244,17 +544,11 @@ def render_active_sessions(i18n: I18n) -> Optional[str]:
         render_empty_state(i18n("turtle_no_active_sessions"), icon="game")
         return None
     
-    for session in sessions[:5]:
+    for session in sessions:
         with st.container():
-            try:
-                puzzle = engine.get_puzzle(session.puzzle_id)
-                puzzle_title = puzzle.title if puzzle.title else session.puzzle_id
-            except:
-                puzzle_title = session.puzzle_id
+            st.markdown(f"**{session.puzzle_title}**")
             
-            st.markdown(f"**{puzzle_title}**")
-            
-            status_html = render_status_badge(session.state.value, i18n)
+            status_html = render_status_badge(session.state, i18n)
             st.markdown(
                 f"{status_html} | {i18n('turtle_turn')}: {session.question_count}",
                 unsafe_allow_html=True,
@@ -308,20 +602,255 @@ def render_turtle_home_page(i18n: I18n) -> Optional[str]:
     return None
 
 
+def _render_chat_archive(messages, i18n: I18n) -> int:
+    """Collapse full pages older than the live window; return where live messages start."""
+    settings = state.get_turtle_settings()
+    page_size = max(1, settings.chat_page_messages)
+    sealed_pages = max(0, len(messages) - settings.chat_window_messages) // page_size
+    if sealed_pages == 0:
+        return 0
+    
+    history_start = state.get_turtle_history_start()
+    labels = {}
+    for page in range(sealed_pages - 1, -1, -1):
+        first, last = messages[page * page_size], messages[(page + 1) * page_size - 1]
+        labels[page] = i18n("turtle_chat_page", first=first["turn_index"], last=last["turn_index"])
+    
+    with st.expander(f"{EMOJI_MAP['info']} {i18n('turtle_chat_archive', count=sealed_pages * page_size)}"):
+        page = st.selectbox(
+            i18n("turtle_chat_archive_page"),
+            options=list(labels),
+            format_func=labels.get,
+            key="turtle_chat_archive_page",
+        )
+        # Pages are keyed by where the loaded history starts, so "load earlier" re-pages once.
+        cache = st.session_state.setdefault("turtle_chat_pages", {})
+        key = (state.get_turtle_session_id(), history_start, page, i18n.language)
+        if key not in cache:
+            for stale in [k for k in cache if k[:2] != key[:2]]:
+                del cache[stale]
+            cache[key] = render_chat_page_html(messages[page * page_size:(page + 1) * page_size], i18n)
+        st.markdown(cache[key], unsafe_allow_html=True)
+    
+    return sealed_pages * page_size
+
+
+def _load_earlier_turns(engine, session, end: int) -> None:
+    """Prepend the page of stored turns that ends just before turn ``end``."""
+    page_turns = state.get_turtle_settings().history_page_turns
+    messages, start = load_page(engine, session, end, page_turns)
+    state.prepend_turtle_messages(messages)
+    state.set_turtle_history_start(start)
+
+
+def _trim_turtle_transcript(session) -> None:
+    settings = state.get_turtle_settings()
+    # Trim a page at a time so archived chat pages are not re-cut on every turn.
+    if len(state.get_turtle_messages()) <= settings.chat_tail_messages + settings.chat_page_messages:
+        return
+    engine = state.get_turtle_game_engine()
+    if engine is not None and count_turns(engine, session) > 0:
+        state.trim_turtle_messages(settings.chat_tail_messages)
+
+
+def _index_turtle_session(session) -> None:
+    engine = state.get_turtle_game_engine()
+    if engine is not None:
+        session_index.upsert(engine, session, state.get_turtle_player_id())
+
+
+def _turn_store(engine):
+    """The engine's session store (through write-behind) when it records turns with ``add_turn``."""
+    store = write_behind.wrap(getattr(engine, "session_store", None))
+    return store if callable(getattr(store, "add_turn", None)) else None
+
+
+def _question_cache_context(runner):
+    """(puzzle id, fingerprint, embedder) for caching this runner's judged questions.
+
+    None unless the session store can record a cached turn, since a cached
+    answer that is not recorded would be missing from the DM's history.
+    """
+    engine = state.get_turtle_game_engine()
+    if engine is None or not state.get_turtle_settings().question_cache or _turn_store(engine) is None:
+        return None
+    client_key = turtle_client_key(engine)
+    fingerprint = puzzle_fingerprint(
+        runner.puzzle,
+        getattr(engine, "agents_config", None),
+        judge_model=client_key.model_name if client_key is not None else None,
+    )
+    return runner.puzzle.id, fingerprint, get_question_embedder(engine)
+
+
+def _question_limit_reached(runner) -> bool:
+    """Whether the next question is the last one the puzzle allows; the runner ends the game on it."""
+    limit = getattr(runner.puzzle.constraints, "max_questions", None)
+    return bool(limit) and runner.session.question_count + 1 >= limit
+
+
+def _session_history(session) -> Optional[list]:
+    for name in SESSION_TURN_FIELDS:
+        turns = getattr(session, name, None)
+        if isinstance(turns, list):
+            return turns
+    return None
+
+
+def _record_cached_turn(runner, question: str, cached) -> bool:
+    """Record a turn answered from the question cache through the session store.
+
+    The turn goes to the store's ``add_turn`` and the session is saved with
+    the counters the runner would advance. Returns False without touching
+    the session when the turn has to go to the runner instead: the store
+    records no turns, or this question would reach the puzzle's question
+    limit and trigger the runner's game-over checks.
+    """
+    engine = state.get_turtle_game_engine()
+    store = _turn_store(engine)
+    if store is None or _question_limit_reached(runner):
+        return False
+    session = runner.session
+    store.add_turn(
+        session.session_id,
+        {PLAYER_FIELDS[0]: question, DM_FIELDS[0]: cached.message, "verdict": cached.verdict},
+    )
+    session.turn_count += 1
+    # question_count is derived from the turns on some sessions and stored on others.
+    if not isinstance(getattr(type(session), "question_count", None), property):
+        session.question_count += 1
+    _save_turtle_session(engine, session)
+    return True
+
+
+def _save_turtle_session(engine, session) -> None:
+    store = write_behind.wrap(getattr(engine, "session_store", None))
+    save = getattr(store, "save_session", None) or getattr(store, "save", None)
+    if callable(save):
+        save(session)
+
+
+def _ladder_hint(runner, i18n: I18n) -> Optional[str]:
+    """Next precomputed hint for this session, or None to let the DM agent answer."""
+    puzzle, session = runner.puzzle, runner.session
+    total = puzzle.constraints.max_hints
+    if session.hint_count >= total:
+        return None
+    language = puzzle.language or "en"
+    hints = hint_ladders.get(puzzle, language)
+    if hints is None:
+        engine = state.get_turtle_game_engine()
+        try:
+            hints = hint_ladders.adapt(puzzle, language, engine.model_registry.get_llm_client())
+        except Exception as e:
+            logger.warning(f"Could not adapt a hint ladder for {puzzle.id}: {e}")
+            return None
+    if not hints or session.hint_count >= len(hints):
+        return None
+    number = session.hint_count + 1
+    session.hint_count = number
+    _save_turtle_session(state.get_turtle_game_engine(), session)
+    return i18n("turtle_hint_message", number=number, total=total, hint=hints[number - 1])
+
+
+# Turns a single runner call can append to the session history.
+THINKING_CLEAN_TAIL = 2
+
+
+def _apply_thinking(runner, *texts: str) -> ThinkingPolicy:
+    """Count the turn's thinking once and apply the policy to the turns just stored.
+
+    The runner keeps its history on the session, so cleaning the newest
+    turns there also keeps the thinking out of later prompts and of the
+    saved session.
+    """
+    thinking = _get_turtle_thinking()
+    thinking.observe_response(*texts)
+    history = _session_history(runner.session) or []
+    changed = False
+    for turn in history[-THINKING_CLEAN_TAIL:]:
+        changed = thinking.clean_record(turn, PLAYER_FIELDS + DM_FIELDS) or changed
+    if changed:
+        _save_turtle_session(state.get_turtle_game_engine(), runner.session)
+    return thinking
+
+
+def _count_turn(source: str) -> None:
+    TURTLE_TURNS.inc(source=source)
+    span = tracer.current()
+    if span is not None:
+        span.set(source=source)
+
+
 def _process_player_input(runner, user_input: str, i18n: I18n) -> None:
-    state.add_turtle_message("user", user_input, turn_index=runner.session.turn_count + 1)
+    _touch_turtle_model()
+    with tracer.span("turtle.turn", turn=runner.session.turn_count + 1, puzzle_id=state.get_turtle_puzzle_id()):
+        _answer_player_input(runner, user_input, i18n)
+
+
+def _answer_player_input(runner, user_input: str, i18n: I18n) -> None:
+    # Every message of this turn shares one index, whatever the turn does to turn_count.
+    turn_index = runner.session.turn_count + 1
+    state.add_turtle_message("user", user_input, turn_index=turn_index)
     
     try:
-        response = run_async(runner.process_player_input(user_input))
+        command = dispatch_command(user_input, runner, state.get_turtle_messages(), i18n)
+        if command is not None:
+            _count_turn("command")
+            state.add_turtle_message("assistant", command.message, turn_index=turn_index)
+            if command.game_over:
+                _save_turtle_session(state.get_turtle_game_engine(), runner.session)
+                write_behind.flush()
+                _index_turtle_session(runner.session)
+                state.set_turtle_success_message(i18n("turtle_game_over_message"))
+            st.rerun()
+        
+        if user_input.strip().lower() == "/hint":
+            hint = _ladder_hint(runner, i18n)
+            if hint is not None:
+                _count_turn("hint_ladder")
+                state.add_turtle_message("assistant", hint, turn_index=turn_index)
+                _index_turtle_session(runner.session)
+                st.rerun()
+        
+        cache_context = None if user_input.startswith("/") else _question_cache_context(runner)
+        embedding = None
+        if cache_context is not None:
+            puzzle_id, fingerprint, embed = cache_context
+            with tracer.span("question_cache.lookup"):
+                cached, embedding = question_cache.lookup(puzzle_id, fingerprint, user_input, embed)
+            if cached is not None and _record_cached_turn(runner, user_input, cached):
+                _count_turn("cache")
+                state.add_turtle_message(
+                    "assistant",
+                    cached.message,
+                    verdict=cached.verdict,
+                    turn_index=turn_index,
+                )
+                _index_turtle_session(runner.session)
+                st.rerun()
         
+        with _track_turtle_endpoint(), TURTLE_TURN_SECONDS.time(source="player"):
+            response = run_async(runner.process_player_input(user_input))
+        thinking = _apply_thinking(runner, response.message)
+        _count_turn("player")
+        _index_turtle_session(runner.session)
+        _trim_turtle_transcript(runner.session)
+        
+        message = thinking.clean(response.message)
+        if cache_context is not None and not response.game_over:
+            question_cache.store(
+                puzzle_id, fingerprint, user_input, response.verdict or "", message, embed, embedding=embedding
+            )
         state.add_turtle_message(
             "assistant",
-            response.message,
+            message,
             verdict=response.verdict or "",
-            turn_index=runner.session.turn_count,
+            turn_index=turn_index,
         )
         
         if response.game_over:
+            write_behind.flush()
             state.set_turtle_success_message(i18n("turtle_game_over_message"))
         
         st.rerun()
@@ -331,27 +860,39 @@ def _process_player_input(runner, user_input: str, i18n: I18n) -> None:
 
 
 def _run_agent_turn(runner, i18n: I18n) -> None:
+    _touch_turtle_model()
+    with tracer.span("turtle.turn", turn=runner.session.turn_count + 1, puzzle_id=state.get_turtle_puzzle_id()):
+        _play_agent_turn(runner, i18n)
+
+
+def _play_agent_turn(runner, i18n: I18n) -> None:
     try:
-        with st.spinner(i18n("turtle_agent_thinking")):
-            response = run_async(runner.run_player_agent_turn())
-        
+        with st.spinner(i18n("turtle_agent_thinking")), _track_turtle_endpoint():
+            with TURTLE_TURN_SECONDS.time(source="agent"):
+                response = run_async(runner.run_player_agent_turn())
         player_msg = response.metadata.get('player_message', '')
+        thinking = _apply_thinking(runner, player_msg, response.message)
+        _count_turn("agent")
+        _index_turtle_session(runner.session)
+        _trim_turtle_transcript(runner.session)
+        
         if player_msg:
             state.add_turtle_message(
                 "user",
-                player_msg,
+                thinking.clean(player_msg),
                 turn_index=runner.session.turn_count,
                 is_agent=True,
             )
         
         state.add_turtle_message(
             "assistant",
-            response.message,
+            thinking.clean(response.message),
             verdict=response.verdict or "",
             turn_index=runner.session.turn_count,
         )
         
         if response.game_over:
+            write_behind.flush()
             state.set_turtle_success_message(i18n("turtle_game_over_message"))
         
         st.rerun()
@@ -375,23 +916,37 @@ def render_turtle_game_page(i18n: I18n) -> Optional[str]:
         render_error(i18n("turtle_error_init_required"))
         return None
     
+    _recheck_turtle_endpoint()
     runner = state.get_turtle_session_runner()
     if runner is None:
+        _acquire_turtle_model(engine, affinity=session_id)
         try:
+            _acquire_turtle_kb(engine, puzzle_id, session_id)
+            # The engine reads the stored session; writes still queued for it must land first.
+            write_behind.flush()
             session = engine.get_session(session_id)
-            puzzle = engine.get_puzzle(puzzle_id)
+            puzzle = puzzle_catalog.get_puzzle(engine, puzzle_id)
             
             turtle_settings = state.get_turtle_settings()
             player_agent_mode = turtle_settings.player_agent_mode
             
+            thinking = _get_turtle_thinking()
+            client_key = turtle_client_key(engine)
+            llm_client = get_turtle_llm_client(
+                engine,
+                _choose_turtle_endpoint(engine, session_id),
+                client_updates=thinking.client_updates(client_key.backend if client_key else "ollama"),
+                variant=thinking.variant,
+            )
+            
             from game.session_runner import GameSessionRunner
             runner = GameSessionRunner(
                 session=session,
                 puzzle=puzzle,
-                kb_manager=engine.kb_manager,
-                memory_manager=engine.memory_manager,
-                session_store=engine.session_store,
-                llm_client=engine.model_registry.get_llm_client(),
+                kb_manager=traced(engine.kb_manager, "kb", KB_METHODS),
+                memory_manager=write_behind.wrap_memory(engine.memory_manager),
+                session_store=traced(write_behind.wrap(engine.session_store), "session_store", SESSION_STORE_WRITES),
+                llm_client=llm_client,
                 agents_config=engine.agents_config,
                 player_agent_mode=player_agent_mode,
                 dm_agent_mode=True,
@@ -399,19 +954,23 @@ def render_turtle_game_page(i18n: I18n) -> Optional[str]:
             state.set_turtle_session_runner(runner)
             
             if session.turn_count == 0:
-                response = runner.start_game()
-                state.add_turtle_message("assistant", response.message, turn_index=0)
+                with tracer.span("turtle.start_game"):
+                    response = runner.start_game()
+                thinking.observe_response(response.message)
+                state.add_turtle_message("assistant", thinking.clean(response.message), turn_index=0)
+            elif not state.get_turtle_messages():
+                _load_earlier_turns(engine, session, count_turns(engine, session))
         except Exception as e:
             render_error(f"{i18n('error_generic')}: {str(e)}")
             if st.button(f"{EMOJI_MAP['puzzle']} {i18n('nav_home')}", key="turtle_back_to_home_error"):
-                state.reset_turtle_game_state()
+                _reset_turtle_game()
                 return "back_home"
             return None
     
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        puzzle = engine.get_puzzle(puzzle_id)
+        puzzle = puzzle_catalog.get_puzzle(engine, puzzle_id)
         st.markdown(f"### {EMOJI_MAP['puzzle']} {puzzle.title if puzzle.title else puzzle_id}")
         if puzzle.puzzle_statement:
             with st.expander(i18n("turtle_puzzle_story"), expanded=False):
@@ -440,10 +999,21 @@ def render_turtle_game_page(i18n: I18n) -> Optional[str]:
     st.markdown("---")
     st.markdown(f"#### {EMOJI_MAP['game']} {i18n('turtle_chat_history')}")
     
+    history_start = state.get_turtle_history_start()
+    if history_start > 0:
+        st.button(
+            f"⬆️ {i18n('turtle_load_earlier', count=history_start)}",
+            key="turtle_load_earlier",
+            use_container_width=True,
+            on_click=_load_earlier_turns,
+            args=[engine, session, history_start],
+        )
+    
     messages = state.get_turtle_messages()
+    live_start = _render_chat_archive(messages, i18n)
     chat_container = st.container()
     with chat_container:
-        for msg in messages:
+        for msg in messages[live_start:]:
             render_chat_message(
                 role=msg["role"],
                 content=msg["content"],
@@ -518,14 +1088,26 @@ def render_turtle_game_page(i18n: I18n) -> Optional[str]:
                 elif hint_btn:
                     _process_player_input(runner, "/hint", i18n)
     else:
+        _release_turtle_model()
         _render_turtle_game_over(session, i18n)
         
         if st.button(f"🏠 {i18n('turtle_back_home')}", key="turtle_game_over_back"):
             return "back_home"
     
+    _render_turtle_traces(session_id, i18n)
     return None
 
 
+def _render_turtle_traces(session_id: str, i18n: I18n) -> None:
+    settings = tracer.settings
+    if not settings.enabled:
+        return
+    traces = tracer.recent_traces("turtle.turn", session_id=session_id)[:settings.waterfall_turns]
+    if traces:
+        with st.expander(f"⏱️ {i18n('trace_waterfall', count=len(traces))}"):
+            render_trace_waterfall(traces, i18n)
+
+
 def _render_turtle_game_over(session, i18n: I18n) -> None:
     """Render the game over section with proper state handling and score display."""
     from game.domain.entities import GameState as TurtleGameState
@@ -542,8 +1124,6 @@ def _render_turtle_game_over(session, i18n: I18n) -> None:
 
 
 def render_turtle_soup_page():
-    render_css()
-    
     i18n = state.get_i18n()
     
     if not _init_turtle_soup_imports():
@@ -574,9 +1154,10 @@ def render_turtle_soup_page():
     current_turtle_page = state.get_turtle_current_page()
     
     if current_turtle_page == "game" or state.get_turtle_session_id():
-        action = render_turtle_game_page(i18n)
+        with tracer.span("turtle.rerun", game="turtle_soup", session_id=state.get_turtle_session_id()):
+            action = render_turtle_game_page(i18n)
         if action == "back_home":
-            state.reset_turtle_game_state()
+            _reset_turtle_game()
             state.set_turtle_current_page("home")
             st.rerun()
     else:
@@ -597,8 +1178,13 @@ def _start_new_turtle_game(i18n: I18n) -> None:
         state.set_turtle_error_message(i18n("turtle_error_missing_puzzle"))
         return
     
+    _acquire_turtle_model(engine)
     try:
         session = run_async(engine.create_session(puzzle_id, player_id))
+        session_index.upsert(engine, session, player_id)
+        endpoint = st.session_state.get("turtle_endpoint")
+        if endpoint is not None:
+            endpoint[0].pin(session.session_id, endpoint[1])
         state.set_turtle_session_id(session.session_id)
         state.set_turtle_current_page("game")
         st.rerun()
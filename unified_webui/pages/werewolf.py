@@ -3,22 +3,62 @@
 import logging
 import sys
 import time
+import weakref
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "AutoWerewolf"))
 
 from unified_webui.i18n import I18n
-from unified_webui.config import WEREWOLF_ROLE_ICONS, WEREWOLF_ICON, WerewolfSettings
-from unified_webui.components import render_css
+from unified_webui.config import (
+    WEREWOLF_EVENT_CATEGORIES,
+    WEREWOLF_ICON,
+    WEREWOLF_ROLE_ICONS,
+    WerewolfSettings,
+)
 from unified_webui import session_state as state
+from unified_webui.model_clients import ClientKey
+from unified_webui.model_warmup import model_keeper
+from unified_webui.endpoint_pool import get_endpoint_pool, parse_endpoints
+from unified_webui.metrics import metrics
+from unified_webui.werewolf_config import werewolf_config
+from unified_webui.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
 _werewolf_initialized = False
-_werewolf_config_loaded = False
+
+WEREWOLF_GAMES = metrics.counter("werewolf_games_started_total", "Werewolf games started", ("mode",))
+_live_games: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+_CONFIG_WIDGET_KEYS = [
+    "werewolf_backend_select",
+    "werewolf_model_name_input",
+    "werewolf_ollama_url_input",
+    "werewolf_api_base_input",
+    "werewolf_api_key_input",
+    "werewolf_temp_input",
+    "werewolf_tokens_input",
+    "werewolf_corrector_check",
+    "werewolf_corrector_retries_input",
+    "werewolf_role_set_select",
+    "werewolf_game_lang_select",
+    "werewolf_seed_input",
+]
+
+
+def _collect_werewolf_games():
+    counts: Dict[str, int] = {}
+    for session in list(_live_games):
+        status = str(getattr(session, "status", "unknown"))
+        counts[status] = counts.get(status, 0) + 1
+    samples = [({"status": status}, count) for status, count in counts.items()]
+    return [("werewolf_sessions", "gauge", "Werewolf game sessions by status", samples)]
+
+
+metrics.register_collector("werewolf_sessions", _collect_werewolf_games)
 
 
 def _init_werewolf_imports():
@@ -46,50 +86,52 @@ def _init_werewolf_imports():
 
 
 def _load_werewolf_config():
-    global _werewolf_config_loaded
-    if _werewolf_config_loaded:
+    """Apply the process-wide config defaults when they are new to this session.
+
+    Sessions whose settings still equal the defaults they last received get
+    the new ones; sessions that changed their settings keep them.
+    """
+    version, defaults = werewolf_config.defaults()
+    if defaults is None or st.session_state.get("werewolf_config_version") == version:
         return
     
-    if not st.session_state.get("werewolf_config_loaded", False):
-        try:
-            from autowerewolf.streamlit_web.config_loader import streamlit_config_loader
-            
-            streamlit_config_loader.load_from_file()
-            streamlit_config_loader.load_game_config()
-            
-            mc = streamlit_config_loader.model_config
-            gc = streamlit_config_loader.game_config
-            
-            if mc and gc:
-                werewolf_settings = WerewolfSettings(
-                    backend=mc.backend,
-                    model_name=mc.model_name,
-                    api_base=mc.api_base,
-                    api_key=mc.api_key,
-                    ollama_base_url=mc.ollama_base_url,
-                    temperature=mc.temperature,
-                    max_tokens=mc.max_tokens,
-                    enable_corrector=mc.enable_corrector,
-                    corrector_max_retries=mc.corrector_max_retries,
-                    role_set=gc.role_set,
-                    game_language=gc.language,
-                    random_seed=gc.random_seed,
-                )
-                state.set_werewolf_settings(werewolf_settings)
-                logger.info("Loaded werewolf settings from config files")
-            
-            st.session_state.werewolf_config_loaded = True
-        except Exception as e:
-            logger.warning(f"Could not load werewolf config: {e}")
-            st.session_state.werewolf_config_loaded = True
-    
-    _werewolf_config_loaded = True
+    applied = st.session_state.get("werewolf_config_defaults") or WerewolfSettings()
+    if state.get_werewolf_settings() == applied:
+        settings = werewolf_config.new_settings()
+        if settings is not None:
+            state.set_werewolf_settings(settings)
+            st.session_state.werewolf_config_defaults = defaults
+            # Keyed widgets keep their own value; drop it so they pick up the new defaults.
+            for key in _CONFIG_WIDGET_KEYS:
+                st.session_state.pop(key, None)
+            logger.info(f"Applied werewolf config version {version} to session")
+    st.session_state.werewolf_config_version = version
 
 
 def _get_werewolf_session():
     return st.session_state.get("werewolf_session")
 
 
+def _release_werewolf_client():
+    lease = st.session_state.get("werewolf_model_lease")
+    for key in st.session_state.get("werewolf_client_keys") or []:
+        model_keeper.release(key, lease)
+    st.session_state.werewolf_client_keys = []
+    st.session_state.werewolf_model_lease = None
+    endpoint = st.session_state.get("werewolf_endpoint")
+    if endpoint is not None:
+        pool, url = endpoint
+        # A finished game proves the endpoint; a failed one counts towards ejecting it.
+        session = _get_werewolf_session()
+        status = getattr(session, "status", None)
+        pool.end(url, ok={"completed": True, "error": False}.get(status))
+        st.session_state.werewolf_endpoint = None
+    game_span = st.session_state.get("werewolf_trace_span")
+    if game_span is not None:
+        tracer.end_span(game_span)
+        st.session_state.werewolf_trace_span = None
+
+
 def render_werewolf_sidebar(i18n: I18n):
     session = _get_werewolf_session()
     game_running = session is not None and session.status == "running"
@@ -98,6 +140,16 @@ def render_werewolf_sidebar(i18n: I18n):
     status_text = i18n("werewolf_connected") if game_running else i18n("werewolf_disconnected")
     st.caption(f"{status_color} {status_text}")
     
+    for client_key in st.session_state.get("werewolf_client_keys") or []:
+        if client_key.backend != "ollama":
+            continue
+        load_stats = model_keeper.load_stats(client_key)
+        if load_stats["loads"]:
+            st.caption(
+                f"⏱️ {i18n('model_load_time')} ({client_key.model_name}): "
+                f"{load_stats['last_load_ms']:.0f} ms"
+            )
+    
     mode = st.radio(
         i18n("werewolf_mode"),
         options=["watch", "play"],
@@ -134,6 +186,7 @@ def render_werewolf_sidebar(i18n: I18n):
             placeholder="http://localhost:11434",
             disabled=game_running,
             key="werewolf_ollama_url_input",
+            help=i18n("werewolf_endpoints_help"),
         )
         api_base = None
         api_key = None
@@ -144,6 +197,7 @@ def render_werewolf_sidebar(i18n: I18n):
             placeholder="https://api.openai.com/v1",
             disabled=game_running,
             key="werewolf_api_base_input",
+            help=i18n("werewolf_endpoints_help"),
         )
         api_key = st.text_input(
             i18n("werewolf_api_key"),
@@ -306,6 +360,7 @@ def render_werewolf_sidebar(i18n: I18n):
         if st.button(i18n("werewolf_stop_game"), type="secondary", use_container_width=True, key="werewolf_stop_btn"):
             if session:
                 session.stop()
+                _release_werewolf_client()
                 st.session_state.werewolf_session = None
                 st.rerun()
 
@@ -338,6 +393,25 @@ def _start_werewolf_game(
         session_manager,
     )
     
+    _release_werewolf_client()
+    
+    # A game talks to one endpoint for its whole run so prefix caches stay warm.
+    endpoints = parse_endpoints(ollama_url if backend == "ollama" else api_base)
+    if len(endpoints) > 1:
+        pool = get_endpoint_pool(backend, endpoints)
+        endpoint_url = pool.choose()
+        pool.begin(endpoint_url)
+        st.session_state.werewolf_endpoint = (pool, endpoint_url)
+    else:
+        endpoint_url = endpoints[0] if endpoints else None
+    if backend == "ollama":
+        ollama_url = endpoint_url
+    else:
+        api_base = endpoint_url
+    
+    # The game's span ends when the game does.
+    game_span = tracer.start_span("werewolf.game", game="werewolf", mode=mode, model=model_name)
+    
     model_config = StreamlitModelConfig(
         backend=backend,
         model_name=model_name,
@@ -362,6 +436,10 @@ def _start_werewolf_game(
         use_separate_model=False,
     )
     
+    client_key = ClientKey.build(backend, endpoint_url, model_name, api_key)
+    st.session_state.werewolf_client_keys = [client_key]
+    st.session_state.werewolf_model_lease = model_keeper.acquire(client_key)
+    
     session = session_manager.create_session(
         mode=mode,
         model_config=model_config,
@@ -370,7 +448,15 @@ def _start_werewolf_game(
         player_seat=player_seat,
         player_name=player_name,
     )
-    session.start()
+    with tracer.span("werewolf.session_start", parent=game_span):
+        session.start()
+    game_span.set(session_id=getattr(session, "game_id", None))
+    st.session_state.werewolf_trace_span = game_span
+    WEREWOLF_GAMES.inc(mode=mode)
+    try:
+        _live_games.add(session)
+    except TypeError:
+        pass
     st.session_state.werewolf_session = session
     st.session_state.werewolf_last_event_count = 0
     st.session_state.werewolf_winner_shown_for_game = None
@@ -634,18 +720,10 @@ def render_event_log(session, i18n: I18n):
         return
     
     def get_event_category(event) -> str:
-        event_type = event.event_type
-        if event_type in ["speech", "last_words", "sheriff_campaign_speech"]:
-            return "speech"
-        elif event_type in ["vote_cast", "vote_result", "sheriff_vote"]:
-            return "vote"
-        elif event_type in ["death_announcement", "lynch", "hunter_shot", "night_kill", 
-                           "witch_poison", "wolf_self_explode"]:
-            return "death"
-        elif event_type in ["sheriff_election", "sheriff_elected", "badge_pass", "badge_tear"]:
-            return "sheriff"
-        else:
-            return "system"
+        for category, event_types in WEREWOLF_EVENT_CATEGORIES.items():
+            if event.event_type in event_types:
+                return category
+        return "system"
     
     filtered_events = []
     for event in events:
@@ -737,6 +815,14 @@ def render_werewolf_main_content(i18n: I18n):
         """)
         return
     
+    if session.status != "running":
+        _release_werewolf_client()
+    elif st.session_state.get("werewolf_model_lease") is not None:
+        # Reruns of an open tab keep its models leased; an abandoned tab's leases expire.
+        lease = st.session_state.werewolf_model_lease
+        for client_key in st.session_state.get("werewolf_client_keys") or []:
+            model_keeper.touch(client_key, lease)
+    
     if session.status == "completed":
         game_id = session.game_id
         if st.session_state.werewolf_winner_shown_for_game != game_id:
@@ -776,8 +862,6 @@ def render_werewolf_main_content(i18n: I18n):
 
 
 def render_werewolf_page():
-    render_css()
-    
     i18n = state.get_i18n()
     
     _load_werewolf_config()
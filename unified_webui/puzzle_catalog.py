@@ -0,0 +1,218 @@
+"""Process-wide indexed Turtle Soup puzzle catalog for unified MysterySeek platform."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from unified_webui.config import TURTLE_PUZZLE_DIRS
+
+logger = logging.getLogger(__name__)
+
+PUZZLE_FILE_SUFFIXES = {".json", ".yaml", ".yml", ".md", ".txt"}
+
+MAX_CACHED_PAGES = 256
+
+
+def _positions(index: Dict[str, Set[int]], keys: Iterable[str]) -> Set[int]:
+    found: Set[int] = set()
+    for key in keys:
+        found |= index.get(key, set())
+    return found
+
+
+@dataclass
+class CatalogSnapshot:
+    puzzles: List[Any]
+    signature: str
+    built_at: float = field(default_factory=time.time)
+    by_id: Dict[str, Any] = field(default_factory=dict)
+    by_tag: Dict[str, Set[int]] = field(default_factory=dict)
+    by_difficulty: Dict[str, Set[int]] = field(default_factory=dict)
+    by_language: Dict[str, Set[int]] = field(default_factory=dict)
+    search_text: List[str] = field(default_factory=list)
+    _pages: Dict[Hashable, List[str]] = field(default_factory=dict, repr=False)
+    _pages_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self):
+        for position, puzzle in enumerate(self.puzzles):
+            self.by_id[puzzle.id] = puzzle
+            self.search_text.append(
+                " ".join([puzzle.id, puzzle.title or "", puzzle.description or ""]).lower()
+            )
+            for tag in puzzle.tags or []:
+                self.by_tag.setdefault(tag, set()).add(position)
+            if puzzle.difficulty:
+                self.by_difficulty.setdefault(str(puzzle.difficulty), set()).add(position)
+            self.by_language.setdefault((puzzle.language or "").lower(), set()).add(position)
+
+    @property
+    def tags(self) -> List[str]:
+        return sorted(self.by_tag)
+
+    @property
+    def difficulties(self) -> List[str]:
+        return sorted(self.by_difficulty)
+
+    @property
+    def languages(self) -> List[str]:
+        return sorted(lang for lang in self.by_language if lang)
+
+    def query(
+        self,
+        tags: Optional[Sequence[str]] = None,
+        difficulty: Optional[str] = None,
+        language: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Any]:
+        """Puzzles matching any of ``tags``, the given difficulty and language, and ``search``."""
+        selected: Optional[Set[int]] = None
+        for index, keys in (
+            (self.by_tag, tags),
+            (self.by_difficulty, [difficulty] if difficulty else None),
+            (self.by_language, [language.lower()] if language else None),
+        ):
+            if not keys:
+                continue
+            found = _positions(index, keys)
+            selected = found if selected is None else selected & found
+        search = (search or "").strip().lower()
+        if search:
+            candidates = range(len(self.puzzles)) if selected is None else sorted(selected)
+            selected = {p for p in candidates if search in self.search_text[p]}
+        if selected is None:
+            return self.puzzles
+        return [self.puzzles[position] for position in sorted(selected)]
+
+    def page(self, puzzles: Sequence[Any], page: int, page_size: int) -> Tuple[List[Any], int, int]:
+        """Return (page items, clamped page number, page count) for 1-based ``page``."""
+        page_size = max(1, page_size)
+        pages = max(1, (len(puzzles) + page_size - 1) // page_size)
+        page = min(max(1, page), pages)
+        start = (page - 1) * page_size
+        return list(puzzles[start:start + page_size]), page, pages
+
+    def page_html(self, key: Hashable, build: Callable[[], List[str]]) -> List[str]:
+        """Card HTML for one rendered page, built once per snapshot and ``key``."""
+        with self._pages_lock:
+            cached = self._pages.get(key)
+        if cached is not None:
+            return cached
+        cards = build()
+        with self._pages_lock:
+            if len(self._pages) >= MAX_CACHED_PAGES:
+                self._pages.pop(next(iter(self._pages)))
+            self._pages[key] = cards
+        return cards
+
+
+class PuzzleCatalog:
+    """Caches ``engine.list_puzzles()`` once per process.
+
+    The cache is rebuilt when the puzzle files change. The puzzle
+    directories' own mtimes are checked at most every ``recheck_interval``
+    seconds, which catches files being added, removed or replaced by
+    rename. Every file is stat'ed only every ``file_recheck_interval``
+    seconds, for files edited in place. Without any puzzle directory on
+    disk, the cache falls back to a ``ttl``.
+    """
+
+    def __init__(
+        self,
+        source_dirs: Optional[Sequence[Path]] = None,
+        recheck_interval: float = 2.0,
+        file_recheck_interval: float = 60.0,
+        ttl: float = 300.0,
+    ):
+        self.source_dirs = list(source_dirs if source_dirs is not None else TURTLE_PUZZLE_DIRS)
+        self.recheck_interval = recheck_interval
+        self.file_recheck_interval = file_recheck_interval
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._checked_at = 0.0
+        self._files_checked_at = 0.0
+        self._files_signature = ""
+        self._rebuilds = 0
+
+    def _walk(self) -> Iterable[Tuple[str, List[str]]]:
+        for source in self.source_dirs:
+            if source.is_dir():
+                for root, dirs, files in os.walk(source):
+                    dirs.sort()
+                    yield root, files
+
+    def _dir_signature(self) -> Optional[str]:
+        digest = hashlib.sha1()
+        found = False
+        for root, _ in self._walk():
+            digest.update(f"{root}:{os.stat(root).st_mtime_ns}".encode("utf-8"))
+            found = True
+        return digest.hexdigest() if found else None
+
+    def _file_signature(self) -> str:
+        digest = hashlib.sha1()
+        for root, files in self._walk():
+            for name in sorted(files):
+                if Path(name).suffix.lower() not in PUZZLE_FILE_SUFFIXES:
+                    continue
+                stat = os.stat(os.path.join(root, name))
+                digest.update(f"{root}/{name}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _signature(self, now: float) -> str:
+        directories = self._dir_signature()
+        if directories is None:
+            return f"ttl:{int(now // self.ttl)}"
+        if now - self._files_checked_at >= self.file_recheck_interval:
+            self._files_signature = self._file_signature()
+            self._files_checked_at = now
+        return f"{directories}:{self._files_signature}"
+
+    def snapshot(self, engine) -> CatalogSnapshot:
+        now = time.time()
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and now - self._checked_at < self.recheck_interval:
+                return snapshot
+            signature = self._signature(now)
+            self._checked_at = now
+            if snapshot is not None and snapshot.signature == signature:
+                return snapshot
+            started = time.perf_counter()
+            snapshot = CatalogSnapshot(puzzles=list(engine.list_puzzles()), signature=signature)
+            self._snapshot = snapshot
+            self._rebuilds += 1
+            logger.info(
+                f"Indexed {len(snapshot.puzzles)} puzzles in {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+            return snapshot
+
+    def get_puzzle(self, engine, puzzle_id: str):
+        puzzle = self.snapshot(engine).by_id.get(puzzle_id)
+        if puzzle is None:
+            puzzle = engine.get_puzzle(puzzle_id)
+        return puzzle
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+            self._files_checked_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                "puzzles": len(snapshot.puzzles) if snapshot else 0,
+                "tags": len(snapshot.by_tag) if snapshot else 0,
+                "rebuilds": self._rebuilds,
+                "age_s": round(time.time() - snapshot.built_at, 1) if snapshot else 0.0,
+            }
+
+
+puzzle_catalog = PuzzleCatalog()
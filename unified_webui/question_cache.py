@@ -0,0 +1,323 @@
+"""Per-puzzle cache of judged Turtle Soup questions for unified MysterySeek platform."""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from unified_webui.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Verdicts that judge a question; hints, commands and solution checks are never cached.
+CACHEABLE_VERDICTS = {"yes", "no", "yes_and_no", "irrelevant"}
+
+_NON_WORD = re.compile(r"[^\w\s]+", re.UNICODE)
+_SPACES = re.compile(r"\s+")
+
+# Words that flip a yes/no question; "t" is what normalizing leaves of "n't".
+NEGATION_WORDS = frozenset(
+    {"not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "without", "cannot", "t"}
+)
+NEGATION_CHARS = frozenset("不没未非无别莫")
+# Chinese A-not-A questions (是不是, 有没有) ask without negating.
+_A_NOT_A = re.compile(r"(\w)[不没]\1")
+
+# What a cached verdict depends on: the puzzle as the judge sees it and the judge's model settings.
+PUZZLE_FINGERPRINT_FIELDS = ("id", "puzzle_statement", "statement", "answer", "solution", "language")
+JUDGE_SECTIONS = ("judge", "dm", "dm_agent")
+JUDGE_FINGERPRINT_FIELDS = ("model", "model_name", "llm_model_name", "temperature", "system_prompt", "prompt")
+
+# Embedding clients per model registry; they go away with the engine that owns the registry.
+_embedders: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+
+
+def normalize_question(text: str) -> str:
+    """Case-, width- and punctuation-insensitive form of a question."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _NON_WORD.sub(" ", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+def _value(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def puzzle_fingerprint(puzzle: Any, judge_config: Any = None, judge_model: Optional[str] = None) -> str:
+    """Digest of the puzzle and the judge configuration; a change drops the puzzle's cache.
+
+    Only the fields a verdict depends on are hashed, so neither object's
+    repr (addresses, play counters, unrelated agents) moves the fingerprint.
+    """
+    parts = [f"{name}={_value(puzzle, name)!s}" for name in PUZZLE_FINGERPRINT_FIELDS]
+    parts.append(f"judge_model={judge_model or ''}")
+    for section_name in JUDGE_SECTIONS:
+        section = _value(judge_config, section_name)
+        for name in JUDGE_FINGERPRINT_FIELDS:
+            value = _value(section, name)
+            if value is not None:
+                parts.append(f"{section_name}.{name}={value!s}")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def negations(normalized: str) -> FrozenSet[str]:
+    """Negation markers in a normalized question; similar questions must share them to share a verdict."""
+    markers = {word for word in normalized.split() if word in NEGATION_WORDS}
+    markers.update(ch for ch in _A_NOT_A.sub("", normalized) if ch in NEGATION_CHARS)
+    return frozenset(markers)
+
+
+def _unit(vector: Sequence[float]) -> Optional[np.ndarray]:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    return array / norm if array.ndim == 1 and norm else None
+
+
+@dataclass
+class CachedAnswer:
+    question: str
+    verdict: str
+    message: str
+    embedding: Optional[np.ndarray] = None
+    negations: FrozenSet[str] = frozenset()
+    hits: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class _PuzzleBucket:
+    fingerprint: str
+    exact: Dict[str, CachedAnswer] = field(default_factory=dict)
+    # Unit embeddings of the entries that have one, stacked for one matrix-vector product per lookup.
+    _matrix: Optional[np.ndarray] = None
+    _rows: List[CachedAnswer] = field(default_factory=list)
+
+    def changed(self) -> None:
+        self._matrix = None
+
+    def semantic_rows(self) -> Tuple[Optional[np.ndarray], List[CachedAnswer]]:
+        if self._matrix is None:
+            entries = [e for e in self.exact.values() if e.embedding is not None]
+            dim = entries[-1].embedding.shape[0] if entries else 0
+            # An embedder change leaves old rows at another width; only the newest width is searched.
+            self._rows = [e for e in entries if e.embedding.shape[0] == dim]
+            self._matrix = np.stack([e.embedding for e in self._rows]) if self._rows else np.empty((0, 0))
+        return self._matrix, self._rows
+
+
+@dataclass
+class QuestionCacheStats:
+    lookups: int = 0
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    stores: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.exact_hits + self.semantic_hits) / self.lookups if self.lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class QuestionCache:
+    """Judged questions per puzzle, shared by every player in the process.
+
+    A question hits on its normalized form first, then on embedding cosine
+    similarity of at least ``similarity_threshold`` when an embedder is
+    given. A semantic hit also needs the same negation words, since "was
+    he killed?" and "was he not killed?" embed almost alike. Each puzzle's
+    entries carry the puzzle fingerprint they were judged under and are
+    dropped when it changes.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.95, max_entries_per_puzzle: int = 500):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries_per_puzzle = max_entries_per_puzzle
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _PuzzleBucket] = {}
+        self._stats: Dict[str, QuestionCacheStats] = {}
+
+    def _bucket(self, puzzle_id: str, fingerprint: str) -> _PuzzleBucket:
+        bucket = self._buckets.get(puzzle_id)
+        if bucket is None or bucket.fingerprint != fingerprint:
+            if bucket is not None:
+                self._stats_for(puzzle_id).invalidations += 1
+                logger.info(f"Question cache for puzzle {puzzle_id} invalidated by a puzzle or judge change")
+            bucket = _PuzzleBucket(fingerprint)
+            self._buckets[puzzle_id] = bucket
+        return bucket
+
+    def _stats_for(self, puzzle_id: str) -> QuestionCacheStats:
+        stats = self._stats.get(puzzle_id)
+        if stats is None:
+            stats = QuestionCacheStats()
+            self._stats[puzzle_id] = stats
+        return stats
+
+    def lookup(
+        self,
+        puzzle_id: str,
+        fingerprint: str,
+        question: str,
+        embed: Optional[Callable[[str], List[float]]] = None,
+    ) -> Tuple[Optional[CachedAnswer], Optional[np.ndarray]]:
+        """(cached answer or None, the question's embedding when one was computed).
+
+        Pass the embedding on to ``store`` after a miss so the question is
+        not embedded twice.
+        """
+        normalized = normalize_question(question)
+        if not normalized:
+            return None, None
+        with self._lock:
+            bucket = self._bucket(puzzle_id, fingerprint)
+            stats = self._stats_for(puzzle_id)
+            stats.lookups += 1
+            entry = bucket.exact.get(normalized)
+            if entry is not None:
+                entry.hits += 1
+                stats.exact_hits += 1
+                return entry, None
+            matrix, rows = bucket.semantic_rows()
+        if embed is None or not rows:
+            return None, None
+
+        vector = _embed(embed, question)
+        if vector is None or vector.shape[0] != matrix.shape[1]:
+            return None, vector
+        scores = matrix @ vector
+        polarity = negations(normalized)
+        for row in np.argsort(scores)[::-1]:
+            if scores[row] < self.similarity_threshold:
+                break
+            best = rows[row]
+            if best.negations != polarity:
+                continue
+            with self._lock:
+                best.hits += 1
+                self._stats_for(puzzle_id).semantic_hits += 1
+            return best, vector
+        return None, vector
+
+    def store(
+        self,
+        puzzle_id: str,
+        fingerprint: str,
+        question: str,
+        verdict: str,
+        message: str,
+        embed: Optional[Callable[[str], List[float]]] = None,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Cache a judged question; ``embedding`` is the one ``lookup`` returned, if any."""
+        normalized = normalize_question(question)
+        if not normalized or (verdict or "").lower() not in CACHEABLE_VERDICTS:
+            return
+        if embedding is not None:
+            embedding = _unit(embedding)
+        elif embed is not None:
+            embedding = _embed(embed, question)
+        entry = CachedAnswer(
+            question=question,
+            verdict=verdict,
+            message=message,
+            embedding=embedding,
+            negations=negations(normalized),
+        )
+        with self._lock:
+            bucket = self._bucket(puzzle_id, fingerprint)
+            if normalized not in bucket.exact and len(bucket.exact) >= self.max_entries_per_puzzle:
+                # Keep the questions players actually repeat.
+                coldest = min(bucket.exact, key=lambda k: (bucket.exact[k].hits, bucket.exact[k].created_at))
+                del bucket.exact[coldest]
+            bucket.exact[normalized] = entry
+            bucket.changed()
+            self._stats_for(puzzle_id).stores += 1
+
+    def invalidate(self, puzzle_id: Optional[str] = None) -> None:
+        with self._lock:
+            targets = list(self._buckets) if puzzle_id is None else [puzzle_id]
+            for target in targets:
+                if self._buckets.pop(target, None) is not None:
+                    self._stats_for(target).invalidations += 1
+
+    def stats(self, puzzle_id: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            if puzzle_id is not None:
+                stats = self._stats_for(puzzle_id).as_dict()
+                bucket = self._buckets.get(puzzle_id)
+                stats["entries"] = len(bucket.exact) if bucket else 0
+                return stats
+            total = QuestionCacheStats()
+            for stats in self._stats.values():
+                total.lookups += stats.lookups
+                total.exact_hits += stats.exact_hits
+                total.semantic_hits += stats.semantic_hits
+                total.stores += stats.stores
+                total.invalidations += stats.invalidations
+            result = total.as_dict()
+            result["puzzles"] = len(self._buckets)
+            result["entries"] = sum(len(b.exact) for b in self._buckets.values())
+            return result
+
+
+def _embed(embed: Callable[[str], List[float]], text: str) -> Optional[np.ndarray]:
+    """The text's unit-length embedding, or None when embedding failed."""
+    try:
+        return _unit(embed(text))
+    except Exception as e:
+        logger.warning(f"Question embedding failed, using exact matches only: {e}")
+        return None
+
+
+def get_question_embedder(engine) -> Optional[Callable[[str], List[float]]]:
+    """The engine's embedding model as a text -> vector callable, if it exposes one."""
+    registry = getattr(engine, "model_registry", None)
+    factory = getattr(registry, "get_embedding_client", None)
+    if not callable(factory):
+        return None
+    try:
+        client = _embedders.get(registry)
+    except TypeError:
+        client = None
+    if client is None:
+        try:
+            client = factory()
+        except Exception as e:
+            logger.warning(f"No embedding client for the question cache: {e}")
+            return None
+        try:
+            _embedders[registry] = client
+        except TypeError:
+            logger.debug(f"{type(registry).__name__} cannot be weakly referenced; embedding client not reused")
+    embed = getattr(client, "embed_query", None)
+    return embed if callable(embed) else None
+
+
+question_cache = QuestionCache()
+metrics.register_stats(
+    "question_cache",
+    question_cache.stats,
+    counters=("lookups", "exact_hits", "semantic_hits", "stores", "invalidations"),
+    gauges=("entries",),
+)
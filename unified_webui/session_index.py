@@ -0,0 +1,202 @@
+"""Indexed Turtle Soup session queries for unified MysterySeek platform."""
+
+import heapq
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from unified_webui.puzzle_catalog import puzzle_catalog
+
+logger = logging.getLogger(__name__)
+
+IN_PROGRESS = "in_progress"
+# Attributes a session store may use for where it keeps its sessions on disk.
+STORE_PATH_ATTRS = ("db_path", "database_path", "file_path", "path", "storage_dir", "sessions_dir", "base_dir", "data_dir")
+# Files a SQLite store writes next to its database.
+SQLITE_SIDECARS = ("-wal", "-journal")
+
+
+def _state_value(session) -> str:
+    value = getattr(session, "state", "")
+    return str(getattr(value, "value", value))
+
+
+def _store_paths(engine) -> List[Path]:
+    store = getattr(engine, "session_store", None)
+    paths = []
+    for attr in STORE_PATH_ATTRS:
+        value = getattr(store, attr, None)
+        if isinstance(value, (str, os.PathLike)) and str(value) and str(value) != ":memory:":
+            paths.append(Path(value))
+    return paths
+
+
+def _stat_signature(paths: List[Path]) -> Optional[Tuple]:
+    """mtimes and sizes of the store's files, or None when it keeps nothing on disk."""
+    parts = []
+    for path in paths:
+        for candidate in [path, *(Path(f"{path}{suffix}") for suffix in SQLITE_SIDECARS)]:
+            try:
+                stat = os.stat(candidate)
+            except OSError:
+                continue
+            parts.append((str(candidate), stat.st_mtime_ns, stat.st_size))
+    return tuple(parts) or None
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if hasattr(value, "timestamp"):
+        return value.timestamp()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class SessionSummary:
+    session_id: str
+    puzzle_id: str
+    player_id: str
+    state: str
+    question_count: int
+    puzzle_title: str
+    updated_at: float
+
+
+class SessionIndex:
+    """Session summaries indexed by (player, state), newest first.
+
+    The index is filled from one ``engine.list_sessions`` scan per player and
+    then kept current by ``upsert`` calls from the page whenever it creates or
+    advances a session. A query only touches the sessions of that player in
+    that state, so finished games do not slow down the active-session list.
+
+    Sessions written by other processes are picked up by watching the
+    store's files. Their mtimes and sizes are checked at most every
+    ``recheck_interval`` seconds, and a change rescans each player on their
+    next query. A store that exposes no path on disk is rescanned every
+    ``resync_interval`` seconds instead.
+    """
+
+    def __init__(self, recheck_interval: float = 2.0, resync_interval: float = 30.0):
+        self.recheck_interval = recheck_interval
+        self.resync_interval = resync_interval
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, SessionSummary] = {}
+        self._by_player_state: Dict[Tuple[str, str], Dict[str, SessionSummary]] = {}
+        self._synced_at: Dict[str, float] = {}
+        self._store_signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._scans = 0
+
+    def _summarize(self, engine, session, player_id: str, updated_at: Optional[float]) -> SessionSummary:
+        try:
+            puzzle = puzzle_catalog.get_puzzle(engine, session.puzzle_id)
+            title = puzzle.title or session.puzzle_id
+        except Exception:
+            title = session.puzzle_id
+        if updated_at is None:
+            updated_at = _timestamp(getattr(session, "updated_at", None)) or time.time()
+        return SessionSummary(
+            session_id=session.session_id,
+            puzzle_id=session.puzzle_id,
+            player_id=player_id,
+            state=_state_value(session),
+            question_count=getattr(session, "question_count", 0) or 0,
+            puzzle_title=title,
+            updated_at=updated_at,
+        )
+
+    def _store(self, summary: SessionSummary) -> None:
+        previous = self._by_id.get(summary.session_id)
+        if previous is not None:
+            bucket = self._by_player_state.get((previous.player_id, previous.state), {})
+            bucket.pop(summary.session_id, None)
+        self._by_id[summary.session_id] = summary
+        self._by_player_state.setdefault((summary.player_id, summary.state), {})[summary.session_id] = summary
+
+    def upsert(self, engine, session, player_id: str) -> None:
+        """Record a session this process just created or advanced."""
+        summary = self._summarize(engine, session, player_id, time.time())
+        with self._lock:
+            self._store(summary)
+
+    def remove(self, session_id: str) -> None:
+        with self._lock:
+            summary = self._by_id.pop(session_id, None)
+            if summary is not None:
+                self._by_player_state.get((summary.player_id, summary.state), {}).pop(session_id, None)
+
+    def _check_store(self, engine) -> bool:
+        """Whether the store shows files on disk; forgets every player's scan when they changed."""
+        now = time.time()
+        with self._lock:
+            if now - self._checked_at < self.recheck_interval:
+                return self._store_signature is not None
+            self._checked_at = now
+        signature = _stat_signature(_store_paths(engine))
+        with self._lock:
+            if signature != self._store_signature:
+                if self._store_signature is not None:
+                    logger.info("Session store changed on disk; rescanning players on their next query")
+                self._store_signature = signature
+                self._synced_at.clear()
+            return signature is not None
+
+    def _sync(self, engine, player_id: str) -> None:
+        started = time.perf_counter()
+        sessions = engine.list_sessions(player_id=player_id)
+        summaries = [self._summarize(engine, s, player_id, None) for s in sessions]
+        with self._lock:
+            for key in [k for k in self._by_player_state if k[0] == player_id]:
+                for session_id in self._by_player_state.pop(key):
+                    self._by_id.pop(session_id, None)
+            for summary in summaries:
+                self._store(summary)
+            self._synced_at[player_id] = time.time()
+            self._scans += 1
+        logger.info(
+            f"Indexed {len(summaries)} sessions for {player_id} in {(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+
+    def query(
+        self,
+        engine,
+        player_id: str,
+        state: str = IN_PROGRESS,
+        limit: int = 5,
+    ) -> List[SessionSummary]:
+        """Most recently updated sessions of ``player_id`` in ``state``."""
+        watched = self._check_store(engine)
+        synced_at = self._synced_at.get(player_id)
+        if synced_at is None or (not watched and time.time() - synced_at >= self.resync_interval):
+            self._sync(engine, player_id)
+        with self._lock:
+            bucket = list(self._by_player_state.get((player_id, state), {}).values())
+        return heapq.nlargest(limit, bucket, key=lambda s: s.updated_at)
+
+    def invalidate(self, player_id: Optional[str] = None) -> None:
+        with self._lock:
+            if player_id is None:
+                self._synced_at.clear()
+            else:
+                self._synced_at.pop(player_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sessions": len(self._by_id),
+                "players": len(self._synced_at),
+                "scans": self._scans,
+                "watching_store": self._store_signature is not None,
+            }
+
+
+session_index = SessionIndex()
@@ -11,7 +11,8 @@ from unified_webui.config import (
     DEFAULT_LANGUAGE,
     DEFAULT_PLAYER_ID,
 )
-from unified_webui.i18n import I18n, set_language as i18n_set_language
+from unified_webui.i18n import I18n
+from unified_webui.turtle_transcript import Transcript
 
 
 def init_session_state() -> None:
@@ -31,19 +32,30 @@ def init_session_state() -> None:
         st.session_state.werewolf_show_winner_modal = False
         st.session_state.werewolf_winner_team = None
         st.session_state.werewolf_winner_shown_for_game = None
-        st.session_state.werewolf_config_loaded = False
+        st.session_state.werewolf_config_version = None
+        st.session_state.werewolf_config_defaults = None
+        st.session_state.werewolf_client_keys = []
+        st.session_state.werewolf_model_lease = None
+        st.session_state.werewolf_endpoint = None
+        st.session_state.werewolf_trace_span = None
         
         st.session_state.turtle_player_id = DEFAULT_PLAYER_ID
         st.session_state.turtle_display_name = ""
         st.session_state.turtle_current_page = "home"
         st.session_state.turtle_current_session_id = ""
         st.session_state.turtle_current_puzzle_id = ""
-        st.session_state.turtle_messages = []
+        st.session_state.turtle_messages = Transcript()
+        st.session_state.turtle_history_start = 0
         st.session_state.turtle_game_engine = None
         st.session_state.turtle_session_runner = None
         st.session_state.turtle_settings = TurtleSoupSettings()
         st.session_state.turtle_error_message = ""
         st.session_state.turtle_success_message = ""
+        st.session_state.turtle_client_key = None
+        st.session_state.turtle_model_lease = None
+        st.session_state.turtle_endpoint = None
+        st.session_state.turtle_thinking = None
+        st.session_state.turtle_kb_lease = None
 
 
 def get_i18n() -> I18n:
@@ -59,7 +71,6 @@ def get_language() -> str:
 def set_language(language: str) -> None:
     st.session_state.language = language
     st.session_state.i18n = I18n(language)
-    i18n_set_language(language)
 
 
 def get_current_game() -> str:
@@ -148,26 +159,37 @@ def set_turtle_puzzle_id(puzzle_id: str) -> None:
     st.session_state.turtle_current_puzzle_id = puzzle_id
 
 
-def get_turtle_messages() -> List[Dict[str, Any]]:
-    return st.session_state.get("turtle_messages", [])
+def get_turtle_messages() -> Transcript:
+    if "turtle_messages" not in st.session_state:
+        st.session_state.turtle_messages = Transcript()
+    return st.session_state.turtle_messages
 
 
 def add_turtle_message(role: str, content: str, verdict: str = "", turn_index: int = 0, is_agent: bool = False) -> None:
-    if "turtle_messages" not in st.session_state:
-        st.session_state.turtle_messages = []
-    
-    message = {
-        "role": role,
-        "content": content,
-        "verdict": verdict,
-        "turn_index": turn_index,
-        "is_agent": is_agent,
-    }
-    st.session_state.turtle_messages.append(message)
+    get_turtle_messages().append(role, content, verdict, turn_index, is_agent)
+
+
+def prepend_turtle_messages(messages: List[Dict[str, Any]]) -> None:
+    get_turtle_messages().prepend(messages)
+
+
+def trim_turtle_messages(max_messages: int) -> None:
+    """Keep a bounded tail in memory; dropped turns reload through "load earlier"."""
+    history_start = get_turtle_messages().trim(max_messages)
+    if history_start:
+        st.session_state.turtle_history_start = history_start
 
 
 def clear_turtle_messages() -> None:
-    st.session_state.turtle_messages = []
+    st.session_state.turtle_messages = Transcript()
+
+
+def get_turtle_history_start() -> int:
+    return st.session_state.get("turtle_history_start", 0)
+
+
+def set_turtle_history_start(turn: int) -> None:
+    st.session_state.turtle_history_start = turn
 
 
 def get_turtle_game_engine():
@@ -223,6 +245,9 @@ def clear_turtle_success_message() -> None:
 def reset_turtle_game_state() -> None:
     st.session_state.turtle_current_session_id = ""
     st.session_state.turtle_session_runner = None
-    st.session_state.turtle_messages = []
+    st.session_state.turtle_messages = Transcript()
+    st.session_state.turtle_history_start = 0
+    st.session_state.turtle_chat_pages = {}
+    st.session_state.turtle_thinking = None
     clear_turtle_error_message()
     clear_turtle_success_message()
@@ -0,0 +1,154 @@
+"""Thinking-budget control for reasoning models in unified MysterySeek platform."""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence, Tuple
+
+THINKING_MODES = ["keep", "disable", "cap", "strip"]
+
+_THINK_BLOCK = re.compile(r"<think>(.*?)</think>\s*", re.S)
+
+_baseline_lock = threading.Lock()
+_baseline = {"calls": 0, "tokens": 0}
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+def split_thinking(text: str) -> Tuple[str, str]:
+    """Return (thinking, answer) for a response that may contain <think> blocks."""
+    thinking = "\n".join(m.group(1).strip() for m in _THINK_BLOCK.finditer(text))
+    return thinking, _THINK_BLOCK.sub("", text).strip()
+
+
+def _record_baseline(thinking_tokens: int) -> None:
+    with _baseline_lock:
+        _baseline["calls"] += 1
+        _baseline["tokens"] += thinking_tokens
+
+
+def baseline_thinking_per_call() -> float:
+    """Average thinking tokens per call seen process-wide with thinking left on."""
+    with _baseline_lock:
+        return _baseline["tokens"] / _baseline["calls"] if _baseline["calls"] else 0.0
+
+
+@dataclass
+class ThinkingStats:
+    mode: str = "keep"
+    calls: int = 0
+    thinking_tokens: int = 0
+    history_tokens_saved: int = 0
+
+    @property
+    def generation_tokens_saved(self) -> int:
+        if self.mode not in ("disable", "cap"):
+            return 0
+        return max(0, round(baseline_thinking_per_call() * self.calls) - self.thinking_tokens)
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.generation_tokens_saved + self.history_tokens_saved
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "calls": self.calls,
+            "thinking_tokens": self.thinking_tokens,
+            "history_tokens_saved": self.history_tokens_saved,
+            "generation_tokens_saved": self.generation_tokens_saved,
+            "tokens_saved": self.tokens_saved,
+        }
+
+
+class ThinkingPolicy:
+    """Per-game thinking control.
+
+    ``disable`` turns reasoning off at the model where the backend allows it,
+    ``cap`` asks for a thinking budget and trims longer thinking out of the
+    stored history, and ``strip`` lets the model think but keeps the thinking
+    out of the history. ``keep`` leaves everything as the model returns it.
+    """
+
+    def __init__(self, mode: str = "keep", budget_tokens: int = 512):
+        self.mode = mode if mode in THINKING_MODES else "keep"
+        self.budget_tokens = budget_tokens
+        self.stats = ThinkingStats(mode=self.mode)
+        self._lock = threading.Lock()
+
+    @property
+    def variant(self) -> str:
+        return f"{self.mode}:{self.budget_tokens}" if self.mode == "cap" else self.mode
+
+    def client_updates(self, backend: str) -> Dict[str, Any]:
+        """Chat model fields that switch thinking off or cap it, per backend."""
+        if self.mode == "disable":
+            if backend == "ollama":
+                return {"reasoning": False}
+            return {"extra_body": {"enable_thinking": False, "chat_template_kwargs": {"enable_thinking": False}}}
+        if self.mode == "cap" and backend != "ollama":
+            return {"extra_body": {"thinking_budget": self.budget_tokens}}
+        return {}
+
+    def observe(self, thinking_tokens: int) -> None:
+        with self._lock:
+            self.stats.calls += 1
+            self.stats.thinking_tokens += thinking_tokens
+        if self.mode in ("keep", "strip"):
+            _record_baseline(thinking_tokens)
+
+    def observe_response(self, *texts: str) -> None:
+        """Count one model response's thinking once, across every text it returned."""
+        thinking_tokens = 0
+        for text in texts:
+            thinking = split_thinking(text)[0] if text else ""
+            thinking_tokens += estimate_tokens(thinking) if thinking else 0
+        self.observe(thinking_tokens)
+
+    def clean(self, text: str, count_saved: bool = False) -> str:
+        """Apply the policy to a response before it is stored or shown.
+
+        Cleaning an already cleaned text leaves it unchanged. Thinking is
+        counted by ``observe``/``observe_response``; ``count_saved`` adds the
+        trimmed tokens to the history savings, for text that was stored.
+        """
+        thinking, answer = split_thinking(text)
+        thinking_tokens = estimate_tokens(thinking) if thinking else 0
+        if not thinking or self.mode == "keep":
+            return text
+        if self.mode == "cap" and thinking_tokens > self.budget_tokens:
+            kept = thinking[: self.budget_tokens * 4]
+            if count_saved:
+                with self._lock:
+                    self.stats.history_tokens_saved += thinking_tokens - estimate_tokens(kept)
+            return f"<think>{kept}…</think>\n{answer}"
+        if self.mode == "cap":
+            return text
+        if count_saved:
+            with self._lock:
+                self.stats.history_tokens_saved += thinking_tokens
+        return answer
+
+    def clean_record(self, record: Any, fields: Sequence[str]) -> bool:
+        """Clean the text ``fields`` of a stored turn (dict or object) in place; True if any changed."""
+        if self.mode == "keep":
+            return False
+        changed = False
+        for name in fields:
+            value = record.get(name) if isinstance(record, dict) else getattr(record, name, None)
+            if not isinstance(value, str) or "<think>" not in value:
+                continue
+            cleaned = self.clean(value, count_saved=True)
+            if cleaned == value:
+                continue
+            if isinstance(record, dict):
+                record[name] = cleaned
+            else:
+                try:
+                    setattr(record, name, cleaned)
+                except AttributeError:
+                    continue
+            changed = True
+        return changed
@@ -0,0 +1,241 @@
+"""Span tracing with a JSON-lines exporter for unified MysterySeek platform."""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from unified_webui.config import TRACING_SETTINGS, TracingSettings
+
+logger = logging.getLogger(__name__)
+
+# Retrieval methods a knowledge-base manager may expose; traced when present.
+KB_METHODS = ("query", "search", "retrieve", "similarity_search", "get_relevant_documents", "aquery", "asearch")
+# Child spans copy these from their parent unless they set their own.
+INHERITED_ATTRIBUTES = ("game", "session_id")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("mysteryseek_current_span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    """One timed operation; field names in ``as_dict`` follow the OTLP JSON span."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes", "start_ns", "end_ns", "status", "_started")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.trace_id = parent.trace_id if parent is not None else _new_id(128)
+        self.span_id = _new_id(64)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.name = name
+        if parent is not None:
+            for key in INHERITED_ATTRIBUTES:
+                if key in parent.attributes and key not in attributes:
+                    attributes[key] = parent.attributes[key]
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = "ok"
+        self._started = time.perf_counter_ns()
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+class Tracer:
+    """Creates spans, keeps recent traces in memory and exports finished spans.
+
+    ``span()`` parents new spans on the current one through a context
+    variable. Coroutines run by ``run_async`` inherit it, but threads do
+    not. Work on other threads, such as a werewolf game, passes its parent
+    to ``start_span()`` explicitly. Finished spans are written to
+    ``file_path`` by a background thread, so the traced code never waits on
+    file I/O.
+    """
+
+    def __init__(self, settings: Optional[TracingSettings] = None):
+        self.settings = settings or TRACING_SETTINGS
+        self._lock = threading.Lock()
+        self._recent: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._export: "queue.SimpleQueue[Span]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.enabled
+
+    def current(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes: Any) -> Span:
+        return Span(name, parent, attributes)
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        if span.end_ns is not None or not self.settings.enabled:
+            return
+        span.end_ns = span.start_ns + (time.perf_counter_ns() - span._started)
+        if error is not None:
+            span.status = "error"
+            span.attributes["error"] = f"{type(error).__name__}: {error}"
+        with self._lock:
+            spans = self._recent.get(span.trace_id)
+            if spans is None:
+                spans = []
+                self._recent[span.trace_id] = spans
+                while len(self._recent) > self.settings.keep_traces:
+                    self._recent.popitem(last=False)
+            if len(spans) < self.settings.max_spans_per_trace:
+                spans.append(span)
+        if self.settings.file_path is not None:
+            self._export.put(span)
+            self._ensure_writer()
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None, **attributes: Any):
+        """Time the ``with`` block as a child of ``parent``, or else of the current span."""
+        if not self.settings.enabled:
+            yield None
+            return
+        span = Span(name, parent or _current_span.get(), attributes)
+        token = _current_span.set(span)
+        error: Optional[BaseException] = None
+        try:
+            yield span
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span, error)
+
+    @contextmanager
+    def child_span(self, name: str, **attributes: Any):
+        """Like ``span()``, but only inside an existing trace; otherwise yields None."""
+        if _current_span.get() is None:
+            yield None
+            return
+        with self.span(name, **attributes) as span:
+            yield span
+
+    def recent_traces(self, root_name: Optional[str] = None, **attributes: Any) -> List[List[Span]]:
+        """Finished traces, newest first, whose spans include one named ``root_name`` with ``attributes``."""
+        with self._lock:
+            traces = [list(spans) for spans in reversed(self._recent.values())]
+        matched = []
+        for spans in traces:
+            for span in spans:
+                if root_name is not None and span.name != root_name:
+                    continue
+                if all(span.attributes.get(k) == v for k, v in attributes.items()):
+                    matched.append(spans)
+                    break
+        return matched
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(target=self._write_loop, name="trace-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            # Block for the first span, then write it with whatever queued up meanwhile.
+            self.flush([self._export.get()])
+
+    def flush(self, spans: Optional[List[Span]] = None) -> None:
+        """Write every span queued so far."""
+        spans = list(spans or [])
+        while True:
+            try:
+                spans.append(self._export.get_nowait())
+            except queue.Empty:
+                break
+        if not spans or self.settings.file_path is None:
+            return
+        path = Path(self.settings.file_path)
+        lines = "".join(json.dumps(span.as_dict(), default=str, ensure_ascii=False) + "\n" for span in spans)
+        with self._write_lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if path.exists() and path.stat().st_size > self.settings.max_file_mb * 1024 * 1024:
+                    os.replace(path, path.with_name(path.name + ".1"))
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            except OSError as e:
+                logger.warning(f"Could not write {len(spans)} spans to {path}: {e}")
+
+
+class TracingProxy:
+    """Forwards everything to ``target``; the listed methods run inside child spans."""
+
+    def __init__(self, target: Any, tracer: Tracer, prefix: str, methods: Sequence[str]):
+        self._target = target
+        self._tracer = tracer
+        self._prefix = prefix
+        self._methods = set(methods)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if name not in self._methods or not callable(attr):
+            return attr
+        span_name = f"{self._prefix}.{name}"
+        tracer = self._tracer
+        if inspect.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            async def traced_async(*args, **kwargs):
+                with tracer.child_span(span_name):
+                    return await attr(*args, **kwargs)
+
+            return traced_async
+
+        @functools.wraps(attr)
+        def traced(*args, **kwargs):
+            with tracer.child_span(span_name):
+                return attr(*args, **kwargs)
+
+        return traced
+
+
+def traced(target: Any, prefix: str, methods: Sequence[str]) -> Any:
+    """Wrap ``target`` so calls to ``methods`` show up in the caller's trace."""
+    if target is None or not tracer.enabled:
+        return target
+    return TracingProxy(target, tracer, prefix, methods)
+
+
+tracer = Tracer()
+atexit.register(tracer.flush)
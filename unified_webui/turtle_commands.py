@@ -0,0 +1,74 @@
+"""Local slash-command handling for Turtle Soup in unified MysterySeek platform."""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from unified_webui.i18n import I18n
+
+HISTORY_PAIRS = 5
+
+
+@dataclass
+class CommandResult:
+    message: str
+    game_over: bool = False
+
+
+def _status(runner, messages, i18n: I18n) -> CommandResult:
+    session = runner.session
+    total = runner.puzzle.constraints.max_hints
+    state = str(getattr(session.state, "value", session.state)).lower()
+    lines = [
+        f"**{i18n('turtle_game_state')}:** {i18n(f'turtle_state_{state}')}",
+        f"**{i18n('turtle_turn')}:** {session.turn_count}",
+        f"**{i18n('turtle_hints_used')}:** {session.hint_count}/{total}",
+        f"**{i18n('turtle_hints_remaining')}:** {max(0, total - session.hint_count)}",
+    ]
+    return CommandResult("\n\n".join(lines))
+
+
+def _history(runner, messages, i18n: I18n) -> CommandResult:
+    pairs: List[str] = []
+    answer: Optional[dict] = None
+    for message in reversed(messages[-HISTORY_PAIRS * 4:]):
+        if message["role"] == "assistant":
+            answer = message
+        elif answer is not None and not message["content"].startswith("/"):
+            verdict = f" ({answer['verdict']})" if answer.get("verdict") else ""
+            pairs.append(f"- **{message['content']}** → {answer['content']}{verdict}")
+            answer = None
+            if len(pairs) == HISTORY_PAIRS:
+                break
+    if not pairs:
+        return CommandResult(i18n("turtle_history_empty"))
+    return CommandResult("\n".join(reversed(pairs)))
+
+
+def _help(runner, messages, i18n: I18n) -> CommandResult:
+    keys = ["turtle_commands_hint", "turtle_commands_status", "turtle_commands_history",
+            "turtle_commands_quit", "turtle_commands_help"]
+    return CommandResult("\n".join(f"- `{i18n(key).split(' - ')[0]}` - {i18n(key).split(' - ', 1)[-1]}" for key in keys))
+
+
+def _quit(runner, messages, i18n: I18n) -> CommandResult:
+    session = runner.session
+    aborted = getattr(type(session.state), "ABORTED", None)
+    if aborted is not None:
+        session.state = aborted
+    return CommandResult(i18n("turtle_session_ended"), game_over=True)
+
+
+LOCAL_COMMANDS: Dict[str, Callable[..., CommandResult]] = {
+    "/status": _status,
+    "/history": _history,
+    "/help": _help,
+    "/quit": _quit,
+}
+
+
+def dispatch_command(text: str, runner, messages, i18n: I18n) -> Optional[CommandResult]:
+    """Answer a deterministic command from session state; None sends ``text`` to the runner."""
+    handler = LOCAL_COMMANDS.get(text.strip().lower())
+    if handler is None:
+        return None
+    return handler(runner, messages, i18n)
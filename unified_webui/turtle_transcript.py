@@ -0,0 +1,208 @@
+"""Turtle Soup transcript rehydration for unified MysterySeek platform."""
+
+import logging
+import threading
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from unified_webui.write_behind import write_behind
+
+logger = logging.getLogger(__name__)
+
+PLAYER_FIELDS = ("player_message", "player_input", "question", "user_input", "input")
+DM_FIELDS = ("dm_response", "dm_message", "response", "answer", "message")
+VERDICT_FIELDS = ("verdict", "answer_type")
+SESSION_TURN_FIELDS = ("turn_history", "turns", "history")
+
+ROLES = ("user", "assistant")
+AGENT_FLAG = 0x80
+
+# Verdicts are a handful of strings shared by every transcript in the process.
+_verdicts: List[str] = [""]
+_verdict_codes: Dict[str, int] = {"": 0}
+_verdicts_lock = threading.Lock()
+
+
+def _verdict_code(verdict: str) -> int:
+    code = _verdict_codes.get(verdict)
+    if code is None:
+        with _verdicts_lock:
+            code = _verdict_codes.setdefault(verdict, len(_verdicts))
+            if code == len(_verdicts):
+                _verdicts.append(verdict)
+    return code
+
+
+class Transcript:
+    """Compact chat transcript for one Turtle Soup session.
+
+    Messages are kept in parallel arrays: a role byte (with an agent flag),
+    an interned verdict code, an int turn index and the content string.
+    Indexing returns a plain message dict built on access, so callers read
+    it like the dicts ``add_turtle_message`` used to store.
+    """
+
+    __slots__ = ("_roles", "_verdicts", "_turns", "_contents")
+
+    def __init__(self, messages: Iterable[Dict[str, Any]] = ()):
+        self._roles = bytearray()
+        self._verdicts = array("H")
+        self._turns = array("i")
+        self._contents: List[str] = []
+        self.extend(messages)
+
+    def append(self, role: str, content: str, verdict: str = "", turn_index: int = 0, is_agent: bool = False) -> None:
+        code = ROLES.index(role) if role in ROLES else 0
+        self._roles.append(code | (AGENT_FLAG if is_agent else 0))
+        self._verdicts.append(_verdict_code(verdict or ""))
+        self._turns.append(int(turn_index))
+        self._contents.append(content)
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        for msg in messages:
+            self.append(msg["role"], msg["content"], msg.get("verdict", ""), msg.get("turn_index", 0), msg.get("is_agent", False))
+
+    def prepend(self, messages: Sequence[Dict[str, Any]]) -> None:
+        older = Transcript(messages)
+        self._roles[:0] = older._roles
+        self._verdicts[:0] = older._verdicts
+        self._turns[:0] = older._turns
+        self._contents[:0] = older._contents
+
+    def drop_before(self, position: int) -> None:
+        """Forget the oldest ``position`` messages."""
+        del self._roles[:position]
+        del self._verdicts[:position]
+        del self._turns[:position]
+        del self._contents[:position]
+
+    def turn_index(self, position: int) -> int:
+        return self._turns[position]
+
+    def trim(self, max_messages: int) -> int:
+        """Drop whole turns from the front to keep at most ``max_messages``.
+
+        Returns how many stored turns now precede the transcript (0 if
+        nothing was dropped), for reloading them from the session store.
+        """
+        excess = len(self) - max_messages
+        if excess <= 0:
+            return 0
+        first_kept_turn = self._turns[excess]
+        position = excess
+        while position > 0 and self._turns[position - 1] >= first_kept_turn:
+            position -= 1
+        if position == 0 or first_kept_turn <= 1:
+            return 0
+        self.drop_before(position)
+        return first_kept_turn - 1
+
+    def _message(self, position: int) -> Dict[str, Any]:
+        role = self._roles[position]
+        return {
+            "role": ROLES[role & ~AGENT_FLAG],
+            "content": self._contents[position],
+            "verdict": _verdicts[self._verdicts[position]],
+            "turn_index": self._turns[position],
+            "is_agent": bool(role & AGENT_FLAG),
+        }
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [self._message(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transcript index out of range")
+        return self._message(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for position in range(len(self)):
+            yield self._message(position)
+
+
+def _field(turn: Any, names: Sequence[str], default: Any = "") -> Any:
+    for name in names:
+        value = turn.get(name) if isinstance(turn, dict) else getattr(turn, name, None)
+        if value:
+            return value
+    return default
+
+
+def _session_turns(session) -> List[Any]:
+    for name in SESSION_TURN_FIELDS:
+        turns = getattr(session, name, None)
+        if isinstance(turns, (list, tuple)):
+            return list(turns)
+    return []
+
+
+def _paged_store(engine):
+    # Through the write-behind proxy, so turns still queued for the store are read back too.
+    store = write_behind.wrap(getattr(engine, "session_store", None))
+    if store is not None and callable(getattr(store, "get_turns", None)) and callable(
+        getattr(store, "count_turns", None)
+    ):
+        return store
+    return None
+
+
+def count_turns(engine, session) -> int:
+    """Number of stored turns without loading them, where the store allows it."""
+    store = _paged_store(engine)
+    if store is not None:
+        return int(store.count_turns(session.session_id))
+    return len(_session_turns(session))
+
+
+def load_turns(engine, session, start: int, end: int) -> List[Any]:
+    """Turns ``[start, end)`` of a session, oldest first."""
+    start = max(0, start)
+    if end <= start:
+        return []
+    store = _paged_store(engine)
+    if store is not None:
+        return list(store.get_turns(session.session_id, offset=start, limit=end - start))
+    return _session_turns(session)[start:end]
+
+
+def turn_messages(turns: Sequence[Any], first_index: int) -> List[Dict[str, Any]]:
+    """Message dicts (as ``Transcript`` takes and returns them) for stored turns."""
+    messages: List[Dict[str, Any]] = []
+    for offset, turn in enumerate(turns):
+        turn_index = _field(turn, ("turn_index", "turn_number"), first_index + offset + 1)
+        is_agent = bool(_field(turn, ("is_agent", "from_agent"), False))
+        question = _field(turn, PLAYER_FIELDS)
+        if question:
+            messages.append({
+                "role": "user",
+                "content": str(question),
+                "verdict": "",
+                "turn_index": turn_index,
+                "is_agent": is_agent,
+            })
+        answer = _field(turn, DM_FIELDS)
+        if answer:
+            verdict = _field(turn, VERDICT_FIELDS)
+            messages.append({
+                "role": "assistant",
+                "content": str(answer),
+                "verdict": str(getattr(verdict, "value", verdict) or ""),
+                "turn_index": turn_index,
+                "is_agent": False,
+            })
+    return messages
+
+
+def load_page(engine, session, end: int, page_turns: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Messages for the ``page_turns`` turns before ``end``, and the new start index."""
+    start = max(0, end - page_turns)
+    try:
+        turns = load_turns(engine, session, start, end)
+    except Exception as e:
+        logger.warning(f"Could not load turns {start}-{end} of session {session.session_id}: {e}")
+        return [], end
+    return turn_messages(turns, start), start
@@ -0,0 +1,267 @@
+"""Persisted memory-mapped KB vector index for unified MysterySeek platform."""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from unified_webui.config import KB_INDEX_DIR
+from unified_webui.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+# Version 1 indexes kept their vectors in this fixed file; later ones name a per-build file.
+VECTORS_FILE = "vectors.f32"
+VECTORS_PATTERN = "vectors-*.f32"
+INDEX_VERSION = 2
+
+# Puzzle fields that make up its knowledge base; list fields give one document per item.
+KB_DOCUMENT_FIELDS = ("puzzle_statement", "answer", "solution", "key_facts", "facts", "hints", "additional_info")
+
+
+def content_hash(text: str, model: str) -> str:
+    return hashlib.sha1(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+def puzzle_documents(puzzle: Any) -> List[Tuple[str, str]]:
+    """(document id, text) pairs for one puzzle's knowledge base."""
+    documents = []
+    for name in KB_DOCUMENT_FIELDS:
+        value = getattr(puzzle, name, None)
+        if not value:
+            continue
+        items = value if isinstance(value, (list, tuple)) else [value]
+        for position, item in enumerate(items):
+            text = str(getattr(item, "content", item)).strip()
+            if text:
+                documents.append((f"{puzzle.id}:{name}:{position}", text))
+    return documents
+
+
+@dataclass
+class SearchResult:
+    doc_id: str
+    puzzle_id: str
+    text: str
+    score: float
+
+
+class VectorIndex:
+    """Read-only view of an index directory: a manifest plus a float32 matrix.
+
+    Rows are unit-normalized and grouped by puzzle, so a per-puzzle search is
+    one matrix-vector product over a contiguous slice of the memory map.
+    Opening parses the manifest, which holds every row's id and text, so it
+    grows with the number of documents. The vectors are not read: their
+    pages are faulted in on first use and shared between processes through
+    the OS page cache.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST_FILE, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") not in (1, INDEX_VERSION):
+            raise ValueError(f"Unsupported KB index version {manifest.get('version')}")
+        self.vectors_file: str = manifest.get("vectors", VECTORS_FILE)
+        self.model: str = manifest["model"]
+        self.dim: int = manifest["dim"]
+        self.rows: List[Dict[str, str]] = manifest["rows"]
+        self.puzzles: Dict[str, Tuple[int, int]] = {k: tuple(v) for k, v in manifest["puzzles"].items()}
+        expected = len(self.rows) * self.dim * np.dtype(np.float32).itemsize
+        if os.path.getsize(self.directory / self.vectors_file) != expected:
+            raise ValueError("KB index vectors do not match its manifest")
+        self.vectors = (
+            np.memmap(self.directory / self.vectors_file, dtype=np.float32, mode="r", shape=(len(self.rows), self.dim))
+            if self.rows else np.zeros((0, self.dim), dtype=np.float32)
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def search(self, query: Sequence[float], k: int = 4, puzzle_id: Optional[str] = None) -> List[SearchResult]:
+        with tracer.child_span("kb.vector_search", k=k, rows=len(self.rows)):
+            return self._search(query, k, puzzle_id)
+
+    def _search(self, query: Sequence[float], k: int, puzzle_id: Optional[str]) -> List[SearchResult]:
+        start, end = self.puzzles.get(puzzle_id, (0, 0)) if puzzle_id is not None else (0, len(self.rows))
+        if end <= start:
+            return []
+        q = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return []
+        scores = self.vectors[start:end] @ (q / norm)
+        k = min(k, end - start)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            SearchResult(
+                doc_id=self.rows[start + i]["id"],
+                puzzle_id=self.rows[start + i]["puzzle_id"],
+                text=self.rows[start + i]["text"],
+                score=float(scores[i]),
+            )
+            for i in top
+        ]
+
+
+def _embed_many(embed_documents: Callable[[List[str]], List[List[float]]], texts: List[str]) -> np.ndarray:
+    vectors = np.asarray(embed_documents(texts), dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def build_index(
+    puzzles: Sequence[Any],
+    embed_documents: Callable[[List[str]], List[List[float]]],
+    model: str,
+    directory: Path = KB_INDEX_DIR,
+) -> Dict[str, int]:
+    """Write (or update) the index for ``puzzles``, embedding only changed documents.
+
+    Unchanged rows are copied from the previous index by content hash. The
+    vectors go to a new file named in the new manifest, and replacing the
+    manifest with ``os.replace`` is the single step that switches readers
+    over, so they never pair a manifest with another build's vectors. Vector
+    files older than the previous build are removed afterwards.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    previous: Optional[VectorIndex] = None
+    try:
+        previous = VectorIndex(directory)
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    reusable: Dict[str, int] = {}
+    if previous is not None and previous.model == model:
+        reusable = {row["hash"]: i for i, row in enumerate(previous.rows)}
+
+    rows: List[Dict[str, str]] = []
+    spans: Dict[str, List[int]] = {}
+    for puzzle in sorted(puzzles, key=lambda p: p.id):
+        start = len(rows)
+        for doc_id, text in puzzle_documents(puzzle):
+            rows.append({"id": doc_id, "puzzle_id": puzzle.id, "text": text, "hash": content_hash(text, model)})
+        if len(rows) > start:
+            spans[puzzle.id] = [start, len(rows)]
+
+    missing = [i for i, row in enumerate(rows) if row["hash"] not in reusable]
+    fresh = _embed_many(embed_documents, [rows[i]["text"] for i in missing]) if missing else None
+    dim = fresh.shape[1] if fresh is not None else (previous.dim if previous is not None else 0)
+
+    built_at = time.time()
+    vectors_name = f"vectors-{int(built_at * 1000)}-{os.getpid()}.f32"
+    vectors_path = directory / vectors_name
+    if rows:
+        matrix = np.memmap(vectors_path, dtype=np.float32, mode="w+", shape=(len(rows), dim))
+        if missing:
+            matrix[missing] = fresh
+        missing_set = set(missing)
+        kept = [i for i in range(len(rows)) if i not in missing_set]
+        if kept:
+            matrix[kept] = previous.vectors[[reusable[rows[i]["hash"]] for i in kept]]
+        matrix.flush()
+        del matrix
+    else:
+        vectors_path.write_bytes(b"")
+
+    manifest_tmp = directory / f"{MANIFEST_FILE}.tmp"
+    with open(manifest_tmp, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": INDEX_VERSION, "model": model, "dim": dim, "built_at": built_at, "vectors": vectors_name,
+             "rows": rows, "puzzles": spans},
+            f,
+            ensure_ascii=False,
+        )
+    with open(vectors_path, "rb+") as f:
+        os.fsync(f.fileno())
+    os.replace(manifest_tmp, directory / MANIFEST_FILE)
+    # Readers that opened the previous manifest may still be about to map its vectors.
+    keep = {vectors_name, previous.vectors_file if previous is not None else None}
+    for stale in [*directory.glob(VECTORS_PATTERN), directory / VECTORS_FILE]:
+        if stale.name not in keep:
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+    stats = {"documents": len(rows), "embedded": len(missing), "reused": len(rows) - len(missing),
+             "puzzles": len(spans)}
+    logger.info(f"KB index at {directory}: {stats}")
+    return stats
+
+
+class SharedVectorIndex:
+    """Process-wide handle that reopens the index when its manifest changes."""
+
+    def __init__(self, directory: Path = KB_INDEX_DIR):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._index: Optional[VectorIndex] = None
+        self._mtime = 0.0
+
+    def get(self) -> Optional[VectorIndex]:
+        try:
+            mtime = os.stat(self.directory / MANIFEST_FILE).st_mtime
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if self._index is None or mtime != self._mtime:
+                try:
+                    self._index = VectorIndex(self.directory)
+                    self._mtime = mtime
+                except Exception as e:
+                    logger.warning(f"Could not open KB index at {self.directory}: {e}")
+            return self._index
+
+    def attach(self, engine) -> bool:
+        """Hand the index to ``engine.kb_manager`` when it accepts a prebuilt one."""
+        index = self.get()
+        setter = getattr(getattr(engine, "kb_manager", None), "set_vector_index", None)
+        if index is None or not callable(setter):
+            return False
+        setter(index)
+        return True
+
+
+kb_vector_index = SharedVectorIndex()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the Turtle Soup KB vector index")
+    parser.add_argument("--output", type=Path, default=KB_INDEX_DIR, help="Index directory")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    sys.path.insert(0, str(Path(__file__).parent.parent / "Echoes-of-Deceit-v2" / "src"))
+    from game.engine import GameEngine
+    from unified_webui.question_cache import get_question_embedder
+
+    engine = GameEngine()
+    embed_query = get_question_embedder(engine)
+    if embed_query is None:
+        print("The engine exposes no embedding model", file=sys.stderr)
+        return 1
+    client = getattr(embed_query, "__self__", None)
+    embed_documents = getattr(client, "embed_documents", None)
+    if not callable(embed_documents):
+        def embed_documents(texts: List[str]) -> List[List[float]]:
+            return [embed_query(text) for text in texts]
+    model = str(getattr(client, "model", None) or getattr(client, "model_name", None) or type(client).__name__)
+    print(json.dumps(build_index(engine.list_puzzles(), embed_documents, model, args.output)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
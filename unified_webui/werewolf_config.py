@@ -0,0 +1,164 @@
+"""Process-wide AutoWerewolf config cache for unified MysterySeek platform."""
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from unified_webui.config import WEREWOLF_CONFIG_DIRS, WerewolfSettings
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILE_SUFFIXES = {".yaml", ".yml", ".json", ".toml"}
+# Attributes the AutoWerewolf config loader may use to say which files it reads.
+LOADER_PATH_ATTRS = ("config_path", "config_file", "model_config_path", "game_config_path", "game_config_file")
+
+
+def _settings_from(model_config: Any, game_config: Any) -> WerewolfSettings:
+    return WerewolfSettings(
+        backend=model_config.backend,
+        model_name=model_config.model_name,
+        api_base=model_config.api_base,
+        api_key=model_config.api_key,
+        ollama_base_url=model_config.ollama_base_url,
+        temperature=model_config.temperature,
+        max_tokens=model_config.max_tokens,
+        enable_corrector=model_config.enable_corrector,
+        corrector_max_retries=model_config.corrector_max_retries,
+        role_set=game_config.role_set,
+        game_language=game_config.language,
+        random_seed=game_config.random_seed,
+    )
+
+
+class WerewolfConfigCache:
+    """Parses the AutoWerewolf model and game config once per process.
+
+    The config files' mtimes and sizes are hashed at most every
+    ``recheck_interval`` seconds. A change re-parses them once for the whole
+    process and bumps ``version``, which sessions compare against to pick up
+    new defaults. Without any config file on disk, the cache falls back to a
+    ``ttl``.
+    """
+
+    def __init__(
+        self,
+        config_dirs: Optional[Sequence[Path]] = None,
+        recheck_interval: float = 2.0,
+        ttl: float = 300.0,
+    ):
+        self.config_dirs = list(config_dirs if config_dirs is not None else WEREWOLF_CONFIG_DIRS)
+        self.recheck_interval = recheck_interval
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._settings: Optional[WerewolfSettings] = None
+        self._signature: Optional[str] = None
+        self._version = 0
+        self._loader_missing = False
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+        self._reloads = 0
+
+    def _loader(self):
+        if self._loader_missing:
+            return None
+        try:
+            from autowerewolf.streamlit_web.config_loader import streamlit_config_loader
+        except ImportError as e:
+            logger.warning(f"Could not import AutoWerewolf config loader: {e}")
+            self._loader_missing = True
+            return None
+        return streamlit_config_loader
+
+    def _paths(self, loader: Any) -> List[Path]:
+        paths = []
+        for attr in LOADER_PATH_ATTRS:
+            value = getattr(loader, attr, None)
+            if value:
+                paths.append(Path(value))
+        for directory in self.config_dirs:
+            if directory.is_dir():
+                paths.extend(
+                    sorted(p for p in directory.iterdir() if p.suffix.lower() in CONFIG_FILE_SUFFIXES)
+                )
+        return paths
+
+    def _file_signature(self, loader: Any) -> str:
+        digest = hashlib.sha1()
+        found = False
+        for path in self._paths(loader):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+            found = True
+        if not found:
+            return f"ttl:{int(time.time() // self.ttl)}"
+        return digest.hexdigest()
+
+    def _parse(self, loader: Any) -> Optional[WerewolfSettings]:
+        try:
+            loader.load_from_file()
+            loader.load_game_config()
+        except Exception as e:
+            logger.warning(f"Could not load werewolf config: {e}")
+            return None
+        model_config, game_config = loader.model_config, loader.game_config
+        if not (model_config and game_config):
+            return None
+        return _settings_from(model_config, game_config)
+
+    def defaults(self) -> Tuple[int, Optional[WerewolfSettings]]:
+        """The current config version and its settings; callers must not mutate them."""
+        now = time.time()
+        with self._lock:
+            if now - self._checked_at < self.recheck_interval:
+                return self._version, self._settings
+            self._checked_at = now
+            loader = self._loader()
+            if loader is None:
+                return self._version, self._settings
+            signature = self._file_signature(loader)
+            if signature == self._signature:
+                return self._version, self._settings
+            self._signature = signature
+            settings = self._parse(loader)
+            if settings is None and self._settings is not None:
+                # A half-written or broken file keeps the last good config.
+                return self._version, self._settings
+            if settings != self._settings:
+                if self._settings is not None:
+                    self._reloads += 1
+                    logger.info("Reloaded werewolf settings from changed config files")
+                self._settings = settings
+                self._version += 1
+            self._loaded_at = now
+            return self._version, self._settings
+
+    def new_settings(self) -> Optional[WerewolfSettings]:
+        """A copy of the cached settings that a session may edit in place."""
+        _, settings = self.defaults()
+        return copy.deepcopy(settings) if settings is not None else None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._signature = None
+            self._loader_missing = False
+            self._checked_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": self._version,
+                "loaded": self._settings is not None,
+                "reloads": self._reloads,
+                "age_s": round(time.time() - self._loaded_at, 1) if self._loaded_at else 0.0,
+            }
+
+
+werewolf_config = WerewolfConfigCache()
@@ -0,0 +1,299 @@
+"""Write-behind, group-committed persistence for unified MysterySeek platform."""
+
+import atexit
+import copy
+import logging
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from unified_webui.config import WRITE_BEHIND_SETTINGS, WriteBehindSettings
+from unified_webui.metrics import metrics
+from unified_webui.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+SESSION_STORE_WRITES = ("save_session", "update_session", "save", "add_turn", "append_turn", "save_turn")
+MEMORY_WRITES = ("add_memory", "save_memory", "update_memory")
+# Per-session reads that must see queued writes; they flush the session's pending writes first.
+SESSION_STORE_READS = ("get_turns", "count_turns", "list_turns")
+# Writes that replace the whole stored session; a later one supersedes an earlier one.
+WHOLE_OBJECT_SAVES = ("save_session", "save")
+# Partial updates whose keyword fields can be merged into the previous queued update.
+PARTIAL_UPDATES = ("update_session",)
+BATCH_CONTEXTS = ("transaction", "batch")
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 0.1
+# Attribute on a wrapped store that holds its proxies, so they live and die with the store.
+PROXY_ATTR = "_write_behind_proxies"
+
+
+def _session_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[str]:
+    """The session id a write is about: the first argument's ``session_id`` or the id itself."""
+    first = args[0] if args else kwargs.get("session", kwargs.get("session_id"))
+    session_id = getattr(first, "session_id", None)
+    if session_id is None and isinstance(first, str):
+        session_id = first
+    return session_id
+
+
+@dataclass
+class _Write:
+    target: Any
+    method: str
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    session_key: Optional[Tuple[int, str]] = None
+    attempts: int = 0
+
+
+class WriteBehindProxy:
+    """Forwards everything to ``target`` except the listed write methods, which are queued.
+
+    A whole-object save (``save_session``, ``save``) replaces the queued
+    save of the same session when nothing else for that session was queued
+    after it. Likewise, ``update_session`` keyword fields merge into an
+    ``update_session`` that is still that session's last queued write.
+    Everything else, appends such as ``add_turn`` included, is kept in
+    order.
+
+    Arguments are deep-copied when the write is queued, so the write stores
+    the object as it was at that call even if the caller keeps changing it.
+    ``get_session`` returns a copy of a session whose last queued write is a
+    whole-object save. If other writes for it are still queued,
+    ``get_session`` flushes them first.
+    """
+
+    def __init__(self, target: Any, writer: "WriteBehindWriter", write_methods: Sequence[str]):
+        self._target = target
+        self._writer = writer
+        self._write_methods = set(write_methods)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if name in SESSION_STORE_READS and callable(attr):
+            def read_after_write(*args, **kwargs):
+                session_id = _session_key(args, kwargs)
+                if session_id is not None and self._writer.pending_session(self._target, session_id)[1]:
+                    self._writer.flush()
+                return attr(*args, **kwargs)
+
+            return read_after_write
+        if name not in self._write_methods or not callable(attr):
+            return attr
+
+        def deferred(*args, **kwargs):
+            try:
+                args, kwargs = copy.deepcopy((args, kwargs))
+            except Exception as e:
+                # Without a snapshot a queued write could store later changes; write it now.
+                logger.debug(f"Writing {name} through, its arguments cannot be copied: {e}")
+                self._writer.flush()
+                return attr(*args, **kwargs)
+            session_id = _session_key(args, kwargs)
+            key = (id(self._target), session_id) if session_id is not None else None
+            self._writer.submit(_Write(self._target, name, args, kwargs, key))
+
+        return deferred
+
+    def get_session(self, session_id: str, *args, **kwargs):
+        pending, queued = self._writer.pending_session(self._target, session_id)
+        if pending is not None:
+            return copy.deepcopy(pending)
+        if queued:
+            self._writer.flush()
+        return self._target.get_session(session_id, *args, **kwargs)
+
+
+class WriteBehindWriter:
+    """One background thread that group-commits queued writes.
+
+    A batch is committed every ``flush_interval`` seconds or as soon as
+    ``max_batch`` writes are queued. Writes to a store that offers a
+    ``transaction()``/``batch()`` context run inside one such context per
+    batch. ``flush()`` writes everything queued so far before returning. It
+    retries failed writes, and it is called on game over and at interpreter
+    exit.
+    """
+
+    def __init__(self, settings: Optional[WriteBehindSettings] = None):
+        self.settings = settings or WRITE_BEHIND_SETTINGS
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._queue: List[_Write] = []
+        # Last queued write per (target, session), and the same for the batch being committed.
+        self._last: Dict[Tuple[int, str], _Write] = {}
+        self._inflight: Dict[Tuple[int, str], _Write] = {}
+        self._flushing = threading.RLock()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"queued": 0, "coalesced": 0, "written": 0, "batches": 0, "errors": 0, "dropped": 0}
+        self._last_flush_ms = 0.0
+
+    def wrap(self, target: Any, write_methods: Sequence[str] = SESSION_STORE_WRITES) -> Any:
+        """The proxy for ``target``; the same one on every call while ``target`` lives."""
+        if target is None or isinstance(target, WriteBehindProxy) or not self.settings.enabled:
+            return target
+        key = ",".join(write_methods)
+        with self._lock:
+            try:
+                proxies = target.__dict__.setdefault(PROXY_ATTR, {})
+            except AttributeError:
+                # No instance dict to keep it on: a fresh proxy still shares this writer's queue.
+                proxies = {}
+            proxy = proxies.get(key)
+            if proxy is None or proxy._writer is not self:
+                proxy = WriteBehindProxy(target, self, write_methods)
+                proxies[key] = proxy
+            return proxy
+
+    def wrap_memory(self, memory_manager: Any) -> Any:
+        if not self.settings.defer_memory_writes:
+            return memory_manager
+        return self.wrap(memory_manager, MEMORY_WRITES)
+
+    def _coalesce(self, write: _Write) -> bool:
+        """Fold ``write`` into its session's last queued write when that keeps the outcome the same."""
+        last = self._last.get(write.session_key) if write.session_key is not None else None
+        if last is None or last.method != write.method or last.attempts:
+            return False
+        if write.method in WHOLE_OBJECT_SAVES:
+            last.args, last.kwargs = write.args, write.kwargs
+            return True
+        if write.method in PARTIAL_UPDATES and last.args == write.args:
+            last.kwargs = {**last.kwargs, **write.kwargs}
+            return True
+        return False
+
+    def submit(self, write: _Write) -> None:
+        with self._lock:
+            self._stats["queued"] += 1
+            if self._coalesce(write):
+                self._stats["coalesced"] += 1
+                return
+            self._queue.append(write)
+            if write.session_key is not None:
+                self._last[write.session_key] = write
+            if len(self._queue) >= self.settings.max_batch:
+                self._wake.notify()
+        self._ensure_thread()
+
+    def pending_session(self, target: Any, session_id: str) -> Tuple[Any, bool]:
+        """(queued session object or None, whether any write for the session is still queued)."""
+        key = (id(target), session_id)
+        with self._lock:
+            write = self._last.get(key) or self._inflight.get(key)
+            if write is None:
+                return None, False
+            if write.method in WHOLE_OBJECT_SAVES and write.args:
+                return write.args[0], True
+            return None, True
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._loop, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._queue) < self.settings.max_batch:
+                    self._wake.wait(self.settings.flush_interval)
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write everything queued so far; returns True once all of it is stored.
+
+        Failed writes are retried after a short pause until they succeed or
+        have failed ``MAX_ATTEMPTS`` times. Writes that still fail are
+        dropped and logged as errors, and the call returns False.
+        """
+        stored = True
+        with self._flushing:
+            while True:
+                with self._lock:
+                    batch, self._queue = self._queue, []
+                    self._inflight, self._last = self._last, {}
+                if not batch:
+                    return stored
+                started = time.perf_counter()
+                # Only flushes a traced caller waits on (game over) are spanned, not the background ones.
+                with tracer.child_span("session_store.flush", writes=len(batch)):
+                    failed = self._commit(batch)
+                retry = [w for w in failed if w.attempts < MAX_ATTEMPTS]
+                for write in failed:
+                    if write.attempts >= MAX_ATTEMPTS:
+                        stored = False
+                        logger.error(
+                            f"Dropped {write.method} for session {write.session_key and write.session_key[1]} "
+                            f"after {write.attempts} failed attempts"
+                        )
+                with self._lock:
+                    self._stats["batches"] += 1
+                    self._stats["written"] += len(batch) - len(failed)
+                    self._stats["dropped"] += len(failed) - len(retry)
+                    self._last_flush_ms = (time.perf_counter() - started) * 1000
+                    # Retries go ahead of anything queued meanwhile, so per-session order holds.
+                    self._queue[:0] = retry
+                    for write in retry:
+                        if write.session_key is not None and write.session_key not in self._last:
+                            self._last[write.session_key] = write
+                    self._inflight = {}
+                if retry:
+                    time.sleep(RETRY_DELAY * max(w.attempts for w in retry))
+
+    def flush_at_exit(self) -> None:
+        if not self.flush():
+            logger.error("Some deferred session writes could not be stored before exit")
+
+    def _commit(self, batch: List[_Write]) -> List[_Write]:
+        by_target: Dict[int, List[_Write]] = {}
+        for write in batch:
+            by_target.setdefault(id(write.target), []).append(write)
+        failed: List[_Write] = []
+        for writes in by_target.values():
+            target = writes[0].target
+            context = next(
+                (getattr(target, name) for name in BATCH_CONTEXTS if callable(getattr(target, name, None))),
+                None,
+            )
+            try:
+                with context() if context is not None else nullcontext():
+                    for write in writes:
+                        try:
+                            getattr(target, write.method)(*write.args, **write.kwargs)
+                        except Exception as e:
+                            write.attempts += 1
+                            failed.append(write)
+                            with self._lock:
+                                self._stats["errors"] += 1
+                            logger.warning(f"Deferred {write.method} failed (attempt {write.attempts}): {e}")
+            except Exception as e:
+                # The batch context itself failed to commit; retry the whole group.
+                logger.warning(f"Group commit on {type(target).__name__} failed: {e}")
+                for write in writes:
+                    if write not in failed:
+                        write.attempts += 1
+                        failed.append(write)
+        return failed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._queue)
+            stats["avg_batch"] = round(stats["written"] / stats["batches"], 1) if stats["batches"] else 0.0
+            stats["last_flush_ms"] = round(self._last_flush_ms, 1)
+            return stats
+
+
+write_behind = WriteBehindWriter()
+atexit.register(write_behind.flush_at_exit)
+metrics.register_stats(
+    "write_behind",
+    write_behind.stats,
+    counters=("queued", "coalesced", "written", "batches", "errors", "dropped"),
+    gauges=("pending",),
+)